@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+apply_corrections.py
+~~~~~~~~~~~~~~~~~~~~
+Apply Binance aggTrades correction files without re-ingesting whole months.
+
+For every archive listed in a correction file the re-issued archive is
+downloaded and verified, then only the stored symbol/day partitions whose
+content changed are rewritten in the local Parquet store (and in ClickHouse
+with ``--clickhouse``). Every changed row is appended to the audit log.
+
+Usage:
+    python bin/apply_corrections.py --store-dir data/store \\
+        --updates data/binance/updates/2022-10-04_aggregate_trade_updates.csv --dry-run
+    python bin/apply_corrections.py --store-dir data/store --clickhouse \\
+        --updates data/binance/updates/*.csv data/binance/updates/*.zip
+
+Dependencies:
+    pip install clickhouse-driver pandas pyarrow python-dotenv
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.corrections import apply_correction, load_corrections
+from src.db import create_connection
+from src.trades import TradeStore
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('apply_corrections.log'),
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Apply Binance aggTrades correction files")
+    parser.add_argument("--updates", type=Path, nargs="+", required=True,
+                        help="Correction files (.csv or .zip) from data/binance/updates")
+    parser.add_argument("--store-dir", type=Path, required=True, help="Root of the Parquet trade store")
+    parser.add_argument("--download-dir", type=Path, default=Path("."),
+                        help="STORE_DIRECTORY for re-issued archives")
+    parser.add_argument("--clickhouse", action="store_true", help="Also rewrite partitions in ClickHouse")
+    parser.add_argument("--audit-log", type=Path, default=Path("corrections.jsonl"),
+                        help="JSON lines file receiving every changed row")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without rewriting anything")
+    parser.add_argument("--log-level", type=str, default="INFO",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(getattr(logging, args.log_level))
+
+    store = TradeStore(args.store_dir)
+    client = create_connection() if args.clickhouse and not args.dry_run else None
+
+    corrections = [c for path in args.updates for c in load_corrections(path)]
+    logger.info(f"🩹 {len(corrections)} corrected archives listed")
+
+    patched_days = patched_rows = errors = 0
+    with open(args.audit_log, "a") as audit:
+        for correction in corrections:
+            try:
+                result = apply_correction(correction, store, args.download_dir, client, audit, args.dry_run)
+            except Exception as exc:
+                errors += 1
+                logger.error(f"❌ {correction['path']}: {exc}")
+                continue
+            patched_days += len(result["days"])
+            patched_rows += result["rows"]
+
+    logger.info(
+        f"🏁 {patched_days} partitions {'would change' if args.dry_run else 'rewritten'}, "
+        f"{patched_rows:,} rows changed, {errors} errors (audit: {args.audit_log})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+backtest_clickhouse.py
+~~~~~~~~~~~~~~~~~~~~~~
+EMA-cross backtest fed straight from ClickHouse candles.
+
+Bars are streamed into the ``BacktestEngine`` in time chunks (see
+``src/feeds.py``) instead of being materialised as one ``list[Bar]``, so
+multi-year 1m runs keep a flat memory profile and the next chunk is read
+while the engine processes the current one.
+
+Usage:
+    python bin/backtest_clickhouse.py -s BTCUSDT -i 1m --start 2023-01-01 --end 2024-01-01
+    python bin/backtest_clickhouse.py -s ETHUSDT -i 5m --start 2022-01-01 --end 2025-01-01 \\
+        --chunk-days 30 --prefetch 2
+    python bin/backtest_clickhouse.py -s BTCUSDT -i 1m --start 2023-01-01 --end 2024-01-01 \\
+        --catalog data/catalog   # bars exported by bin/export_catalog.py
+
+Dependencies:
+    pip install clickhouse-driver pandas nautilus-trader python-dotenv
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.feeds import add_clickhouse_bars
+
+from clickhouse import ClickHouseConnector, currency_pair_from_db
+
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.examples.strategies.ema_cross import EMACross, EMACrossConfig
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+BAR_SPEC = {
+    "1m": "1-MINUTE", "3m": "3-MINUTE", "5m": "5-MINUTE", "15m": "15-MINUTE", "30m": "30-MINUTE",
+    "1h": "1-HOUR", "2h": "2-HOUR", "4h": "4-HOUR", "6h": "6-HOUR", "8h": "8-HOUR", "12h": "12-HOUR",
+    "1d": "1-DAY",
+}
+
+
+def parse_utc(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EMA-cross backtest streamed from ClickHouse")
+    parser.add_argument("-s", "--symbol", default="BTCUSDT")
+    parser.add_argument("-i", "--interval", default="1m", choices=sorted(BAR_SPEC))
+    parser.add_argument("--exchange", default="BINANCE")
+    parser.add_argument("--mkt", default="spot", choices=["spot", "usdm", "coinm"])
+    parser.add_argument("--start", type=parse_utc, required=True, help="YYYY-MM-DD")
+    parser.add_argument("--end", type=parse_utc, required=True, help="YYYY-MM-DD")
+    parser.add_argument("--chunk-days", type=float, default=7, help="Days of bars per ClickHouse query")
+    parser.add_argument("--prefetch", type=int, default=1, help="Chunks to read ahead (0 = synchronous)")
+    parser.add_argument("--fast", type=int, default=10)
+    parser.add_argument("--slow", type=int, default=20)
+    parser.add_argument("--trade-size", type=Decimal, default=Decimal("0.01"))
+    parser.add_argument("--balance", type=float, default=1_000_000, help="Starting quote balance")
+    parser.add_argument("--catalog", type=Path, default=None,
+                        help="Read instrument and bars from a ParquetDataCatalog instead of ClickHouse")
+    args = parser.parse_args()
+
+    if args.catalog:
+        catalog = ParquetDataCatalog(str(args.catalog))
+        instrument = catalog.instruments(instrument_ids=[f"{args.symbol.upper()}.{args.exchange.upper()}"])[0]
+    else:
+        ch = ClickHouseConnector()
+        instrument = currency_pair_from_db(ch, exchange=args.exchange, symbol=args.symbol, mkt=args.mkt)
+    bar_type = BarType.from_str(f"{instrument.id}-{BAR_SPEC[args.interval]}-LAST-EXTERNAL")
+
+    engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR")))
+    engine.add_venue(
+        venue=Venue(args.exchange.upper()),
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.CASH,
+        base_currency=None,
+        starting_balances=[
+            Money(args.balance, instrument.quote_currency),
+            Money(0, instrument.base_currency),
+        ],
+    )
+    engine.add_instrument(instrument)
+    engine.add_strategy(EMACross(EMACrossConfig(
+        instrument_id=instrument.id,
+        bar_type=bar_type,
+        trade_size=args.trade_size,
+        fast_ema_period=args.fast,
+        slow_ema_period=args.slow,
+        subscribe_trade_ticks=False,
+        request_bars=False,
+    )))
+    if args.catalog:
+        engine.add_data(catalog.bars(bar_types=[str(bar_type)], start=args.start, end=args.end))
+    else:
+        add_clickhouse_bars(
+            engine, ch, instrument, bar_type,
+            exchange=args.exchange, symbol=args.symbol, timeframe=args.interval,
+            start=args.start, end=args.end, mkt=args.mkt,
+            chunk=timedelta(days=args.chunk_days), prefetch_chunks=args.prefetch,
+        )
+
+    logger.info(f"🚀 Running {args.symbol} {args.interval} bars {args.start:%Y-%m-%d} → {args.end:%Y-%m-%d}")
+    t0 = time.perf_counter()
+    engine.run()
+    elapsed = time.perf_counter() - t0
+
+    fills = engine.trader.generate_order_fills_report()
+    logger.info(f"✅ Backtest finished in {elapsed:.1f}s, {len(fills)} fills")
+    print(engine.trader.generate_account_report(Venue(args.exchange.upper())).tail())
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
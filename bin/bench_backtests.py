@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_backtests.py
+~~~~~~~~~~~~~~~~~~
+Backtest throughput benchmark over the ``refs/backtest`` scenarios.
+
+Each scenario (see ``src/benchmarks.py``) runs in a fresh interpreter so that
+peak RSS and startup are its own. Recorded per scenario: events/sec, setup
+and run wall time, startup (interpreter + imports, i.e. process wall time
+minus setup and run) and peak RSS. Results are written as JSON together with
+the Nautilus/Python versions. With ``--baseline`` they are diffed against a
+saved run, and the exit status is 1 if any metric regressed by more than
+``--tolerance``.
+
+Usage:
+    python bin/bench_backtests.py --out results/bench/latest.json --save-baseline results/bench/baseline.json
+    python bin/bench_backtests.py --baseline results/bench/baseline.json
+    python bin/bench_backtests.py --scenario ema_cross_bars --scale 0.1 --repeat 3
+
+Dependencies:
+    pip install nautilus-trader numpy pandas
+"""
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+SCENARIO_NAMES = ["ema_cross_bars", "twap_trade_ticks", "orderbook_imbalance", "orderbook_replay", "synthetic_pnl"]
+
+
+def worker(name: str, scale: float, seed: int) -> None:
+    """Child process: import, measure one scenario, print its JSON."""
+    t0 = time.perf_counter()
+    from src.benchmarks import measure
+    imported = time.perf_counter() - t0
+    print(json.dumps({**measure(name, scale, seed), "import_s": imported}))
+
+
+def run_scenario(name: str, scale: float, seed: int) -> dict:
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, __file__, "--worker", name, "--scale", str(scale), "--seed", str(seed)],
+        capture_output=True, text=True, cwd=ROOT,
+    )
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} failed:\n{proc.stderr.strip()}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["process_s"] = wall
+    result["startup_s"] = wall - result["setup_s"] - result["run_s"]
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest throughput benchmark suite")
+    parser.add_argument("--scenario", action="append", choices=SCENARIO_NAMES, help="Repeatable (default: all)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for every scenario's event count")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per scenario; the fastest is kept")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", type=Path, default=None, help="Results JSON (default: results/bench/<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path, default=None, help="Baseline JSON to diff against")
+    parser.add_argument("--save-baseline", type=Path, default=None, help="Also write the results here")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Relative change counted as a regression")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.scale, args.seed)
+        return
+
+    from src.benchmarks import compare, environment
+
+    results = []
+    for name in args.scenario or SCENARIO_NAMES:
+        runs = [run_scenario(name, args.scale, args.seed) for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r["run_s"])
+        results.append(best)
+        logger.info(f"⏱️ {name}: {best['events']:,} events in {best['run_s']:.2f}s "
+                    f"({best['events_per_sec']:,.0f}/s), setup {best['setup_s']:.2f}s, "
+                    f"startup {best['startup_s']:.2f}s, peak RSS {best['peak_rss_mb']:.0f} MB")
+
+    report = {"environment": environment(), "scale": args.scale, "seed": args.seed, "results": results}
+    out = args.out or ROOT / "results" / "bench" / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    for path in filter(None, (out, args.save_baseline)):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2))
+    logger.info(f"✅ Results written to {out}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("scale") != args.scale:
+            logger.warning(f"⚠️ Baseline scale {baseline.get('scale')} differs from {args.scale}")
+        diff = compare(report, baseline, args.tolerance)
+        print(diff.to_string(index=False, formatters={"change": "{:+.1%}".format}))
+        regressions = diff[diff["regression"]]
+        if not regressions.empty:
+            logger.error(f"❌ {len(regressions)} regressions vs {args.baseline} "
+                         f"(nautilus {baseline['environment']['nautilus_trader']} → "
+                         f"{report['environment']['nautilus_trader']})")
+            sys.exit(1)
+        logger.info(f"✅ No regressions beyond {args.tolerance:.0%} vs {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bulk-downloader.py
+~~~~~~~~~~~~~~~~~~
+Sync every dataset declared in a job file from data.binance.vision.
 
-from binance_bulk_downloader.downloader import BinanceBulkDownloader
+All specs are expanded into one deduplicated file list and downloaded by a
+shared concurrent engine with checksum verification. Progress is persisted
+after each file, so re-runs (e.g. a nightly cron) only fetch new files.
+With ``extract`` in the job, CSVs are unpacked into the ``data/futures/...``
+tree that the ``upload-csv*`` Makefile targets read.
 
-# Download 1-minute klines for BTCUSDT perpetual futures
-# Saved on ~/hakkoo/algocoin/data/futures/um/monthly/klines/BTCUSDT/1m
-downloader_1m = BinanceBulkDownloader(
-    data_type="klines",
-    data_frequency="1m",
-    asset="um",
-    timeperiod_per_file="monthly",
-    symbols=["BTCUSDT"]
+Usage:
+    python bin/bulk-downloader.py --job data/binance/sync.toml --dry-run
+    python bin/bulk-downloader.py --job data/binance/sync.toml --workers 32
+
+Cron (nightly at 03:15 UTC):
+    15 3 * * * cd ~/hakkoo/algocoin && python bin/bulk-downloader.py --job data/binance/sync.toml >> sync.log 2>&1
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src import sync
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
 )
-downloader_1m.run_download()
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Declarative Binance bulk data sync")
+    parser.add_argument("--job", type=Path, default=Path("data/binance/sync.toml"),
+                        help="TOML/YAML job file with [[spec]] entries")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent downloads (overrides job)")
+    parser.add_argument("--dry-run", action="store_true", help="Only estimate the download size")
+    args = parser.parse_args()
+
+    job = sync.load_job(args.job)
+    dest = Path(job.get("dest", "."))
+    workers = args.workers or job.get("workers", 16)
+    state = sync.SyncState(job.get("state", dest / ".sync-state.jsonl"))
+
+    extract = Path(job["extract"]) if job.get("extract") else None
+    tasks = sync.expand(job["spec"], dest)
+    pending = state.pending(tasks, extract)
+    logger.info(f"🗂️  {len(job['spec'])} specs → {len(tasks)} unique files, {len(pending)} pending")
+
+    if args.dry_run:
+        est = sync.estimate(pending, workers)
+        logger.info(
+            f"🔍 DRY RUN: {est['files']} files, {est['bytes'] / 2**30:.2f} GiB to download "
+            f"({est['missing']} not published)"
+        )
+        return
+
+    pipeline = sync.run(pending, state, workers=workers, checksum=job.get("checksum", True), extract=extract)
+    for row in pipeline.report():
+        logger.info(f"📊 {row['stage']:<8} items={row['items']:<6} dropped={row['dropped']:<5} "
+                    f"errors={row['errors']:<4} {row['items_per_s']:.2f}/s")
+    failed = sum(st.errors for st in pipeline.stats)
+    sys.exit(1 if failed else 0)
+
 
+if __name__ == "__main__":
+    main()
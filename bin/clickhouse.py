@@ -7,8 +7,9 @@ Instrument provider for Nautilus Trader that creates Instrument objects
 from ClickHouse metadata. **Version without MessageBus**. Supports:
   • a generic ClickHouse connector (with extended diagnostics);
   • the currency_pair_from_db() factory;
-  • the ClickHouseInstrumentProvider class (adapter port);
-  • usage examples – 4 cases in ``__main__``.
+  • the ClickHouseInstrumentProvider class (adapter port) with a bulk
+    ``load_all``/``load_all_async`` backed by a local snapshot;
+  • usage examples – 5 cases in ``__main__``.
 
 Dependencies
 ------------
@@ -17,24 +18,34 @@ pip install clickhouse-driver pandas nautilus-trader python-dotenv
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
 import re
 import sys
+import time
 
 from dotenv import load_dotenv
 from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from pathlib import Path
 from types import ModuleType
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 from clickhouse_driver import Client
 
 load_dotenv()
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.symbols import CACHE_DIR, CACHE_TTL, get_cache
+
 # ── Nautilus Trader ─────────────────────────────────────────────── #
 from nautilus_trader.model import InstrumentId, Symbol, Venue
 from nautilus_trader.model.currencies import Currency
+from nautilus_trader.model.enums import CurrencyType
 from nautilus_trader.model.instruments import CurrencyPair
+from nautilus_trader.model.objects import Price, Quantity
 # NB: the path to the InstrumentProvider base class changed after v1.200
 from nautilus_trader.common.providers import InstrumentProvider
 from nautilus_trader.cache.cache import Cache
@@ -49,6 +60,7 @@ EXCHANGE_NAME_TO_ID: Dict[str, int] = {
     "BINANCE": 1,
     # add other exchanges if needed …
 }
+EXCHANGE_ID_TO_NAME = {v: k for k, v in EXCHANGE_NAME_TO_ID.items()}
 
 INTERVAL_STR_TO_CODE: Dict[str, int] = {
     "1s": 1, "1m": 2, "3m": 3, "5m": 4, "15m": 5, "30m": 6,
@@ -58,6 +70,12 @@ INTERVAL_STR_TO_CODE: Dict[str, int] = {
 CODE_TO_INTERVAL_STR = {v: k for k, v in INTERVAL_STR_TO_CODE.items()}
 
 MKT_ENUM: Dict[str, int] = {"spot": 1, "usdm": 2, "coinm": 3}
+MKT_NAME = {v: k for k, v in MKT_ENUM.items()}
+
+# Rows behind ClickHouseInstrumentProvider.load_all, reused across restarts
+INSTRUMENT_SNAPSHOT = Path(os.getenv("INSTRUMENT_SNAPSHOT", CACHE_DIR.parent / "instruments.json"))
+# exchangeInfo fields stored with each snapshot row, so a restart needs no network
+SNAPSHOT_META = ("tick_size", "lot_size", "status", "listed", "delisted")
 
 # ─────────────────────────── Utilities ──────────────────────────── #
 _SYMBOL_RE = re.compile(
@@ -75,13 +93,29 @@ def parse_symbol(sym: str) -> Tuple[str, str]:
     return sym[:mid], sym[mid:]
 
 
+_CURRENCIES: Dict[str, Currency] = {}
+
+
 def _get_currency(code: str, module: ModuleType) -> Currency:
     """Try to get an existing Currency from nautilus_trader.model.currencies.
-    If the currency is missing, create it on-the-fly (name=iso=code, numeric=0)."""
-    try:
-        return getattr(module, code.upper())
-    except AttributeError:
-        return Currency(code.upper(), code.upper(), 0)
+    If the currency is missing, create it on-the-fly (name=code, crypto,
+    8 decimals). Results are memoized so bulk loads share one object per code."""
+    code = code.upper()
+    cur = _CURRENCIES.get(code)
+    if cur is None:
+        cur = getattr(module, code, None)
+        if not isinstance(cur, Currency):
+            cur = Currency(code, 8, 0, code, CurrencyType.CRYPTO)
+        _CURRENCIES[code] = cur
+    return cur
+
+
+def _increment(step: Optional[str], digits: int) -> str:
+    """Return a normalized increment string: the exchange step size from the
+    symbol cache when known, otherwise ``10**-digits``."""
+    if step and Decimal(step) > 0:
+        return format(Decimal(step).normalize(), "f")
+    return format(Decimal(1).scaleb(-digits), "f")
 
 
 # ─────────────────────── ClickHouse Connector ───────────────────── #
@@ -121,9 +155,12 @@ class ClickHouseConnector:
         mkt: str = "spot",
         debug: bool = False,
         auto_clip: bool = False,
+        empty_ok: bool = False,
     ) -> pd.DataFrame:
         """Return a DataFrame with candles; if the result set is empty,
-        diagnose the range and optionally clip to the available range."""
+        diagnose the range and optionally clip to the available range.
+        With ``empty_ok`` an empty range simply returns an empty DataFrame
+        (used by chunked readers that walk across gaps)."""
         exchange = exchange.upper()
         if exchange not in EXCHANGE_NAME_TO_ID:
             raise ValueError(f"Unknown exchange: {exchange}")
@@ -198,6 +235,8 @@ class ClickHouseConnector:
             ]
             df[num_cols] = df[num_cols].astype("float64")
             return df
+        if empty_ok:
+            return pd.DataFrame()
 
         # ──────── no data → diagnose min/max ─────────── #
         diag_sql = f"""
@@ -250,6 +289,52 @@ class ClickHouseConnector:
 
 # ─────────────── Create CurrencyPair from DB ───────────────────── #
 
+_INSTRUMENT_SQL = f"""
+        SELECT
+            i.ex_id,
+            i.mkt,
+            i.price_digits,
+            i.qty_digits,
+            b.code AS base_code,
+            q.code AS quote_code
+        FROM   {CH_DATABASE}.instrument AS i
+               JOIN {CH_DATABASE}.currency AS b ON i.base  = b.id
+               JOIN {CH_DATABASE}.currency AS q ON i.quote = q.id
+        """
+
+
+def _with_meta(row: Tuple) -> Tuple:
+    """Append the exchangeInfo metadata (tick/lot size, listing) to an ``_INSTRUMENT_SQL`` row."""
+    _, mkt_id, _, _, base_code, quote_code = row
+    meta = get_cache(MKT_NAME[mkt_id]).get(f"{base_code}{quote_code}".upper()) or {}
+    return (*row, {k: meta.get(k) for k in SNAPSHOT_META})
+
+
+def _pair_from_row(row: Tuple, ts_ns: int) -> CurrencyPair:
+    """Build a ``CurrencyPair`` from a ``_with_meta`` row (no network access)."""
+    ex_id, _, price_digits, qty_digits, base_code, quote_code, meta = row
+    exchange = EXCHANGE_ID_TO_NAME[ex_id]
+    symbol = f"{base_code}{quote_code}".upper()
+
+    price_increment = Price.from_str(_increment(meta.get("tick_size"), price_digits))
+    size_increment = Quantity.from_str(_increment(meta.get("lot_size"), qty_digits))
+
+    currencies_mod: ModuleType = sys.modules["nautilus_trader.model.currencies"]
+    return CurrencyPair(
+        instrument_id=InstrumentId(Symbol(symbol), Venue(exchange)),
+        raw_symbol=Symbol(symbol),
+        base_currency=_get_currency(base_code, currencies_mod),
+        quote_currency=_get_currency(quote_code, currencies_mod),
+        price_precision=price_increment.precision,
+        size_precision=size_increment.precision,
+        price_increment=price_increment,
+        size_increment=size_increment,
+        ts_init=ts_ns,
+        ts_event=ts_ns,
+        info={k: meta.get(k) for k in ("status", "listed", "delisted")},
+    )
+
+
 def currency_pair_from_db(
     ch: ClickHouseConnector,
     *,
@@ -261,15 +346,7 @@ def currency_pair_from_db(
     exchange_u = exchange.upper()
     base, quote = parse_symbol(symbol)
     row = ch.cli.execute(
-        """
-        SELECT
-            i.price_digits,
-            i.qty_digits,
-            b.code AS base_code,
-            q.code AS quote_code
-        FROM   crypto.instrument AS i
-               JOIN crypto.currency AS b ON i.base  = b.id
-               JOIN crypto.currency AS q ON i.quote = q.id
+        _INSTRUMENT_SQL + """
         WHERE  i.ex_id = %(ex)s
           AND  b.code  = %(b)s
           AND  q.code  = %(q)s
@@ -287,42 +364,120 @@ def currency_pair_from_db(
     if not row:
         raise RuntimeError(f"Instrument {symbol} {mkt} on {exchange_u} not found.")
 
-    price_digits, qty_digits, base_code, quote_code = row[0]
+    return _pair_from_row(_with_meta(row[0]), int(datetime.now(timezone.utc).timestamp() * 1e9))
 
-    currencies_mod: ModuleType = sys.modules["nautilus_trader.model.currencies"]
-    base_cur = _get_currency(base_code, currencies_mod)
-    quote_cur = _get_currency(quote_code, currencies_mod)
 
-    now_ns = int(datetime.now(timezone.utc).timestamp() * 1e9)
-    return CurrencyPair(
-        instrument_id=InstrumentId(symbol.upper(), Venue(exchange_u)),
-        symbol=Symbol(symbol.upper()),
-        base_currency=base_cur,
-        quote_currency=quote_cur,
-        price_precision=price_digits,          # int, see releases >= 1.200
-        size_precision=qty_digits,             # int
-        ts_init=now_ns,
-        ts_event=now_ns,
-    )
+def instrument_rows_from_db(
+    ch: ClickHouseConnector,
+    *,
+    exchange: Optional[str] = None,
+    mkt: Optional[str] = "spot",
+    quotes: Optional[List[str]] = None,
+) -> List[Tuple]:
+    """Fetch the specs of every matching instrument in one query (``_with_meta`` rows)."""
+    conds, params = [], {}
+    if exchange is not None:
+        conds.append("i.ex_id = %(ex)s")
+        params["ex"] = EXCHANGE_NAME_TO_ID[exchange.upper()]
+    if mkt is not None:
+        conds.append("i.mkt = %(m)s")
+        params["m"] = MKT_ENUM[mkt]
+    if quotes:
+        conds.append("q.code IN %(q)s")
+        params["q"] = tuple(q.upper() for q in quotes)
+    where = f"WHERE  {' AND '.join(conds)}" if conds else ""
+    rows = ch.cli.execute(_INSTRUMENT_SQL + where + "\n        ORDER BY i.ex_id, b.code, q.code", params)
+    return [_with_meta(tuple(r)) for r in rows]
+
+
+# ─────────────────── Local instrument snapshot ──────────────────── #
+
+def _load_snapshot(path: Path, ttl: float) -> Optional[List[Tuple]]:
+    """Rows saved by ``_save_snapshot`` if the file is younger than ``ttl``."""
+    try:
+        with open(path) as f:
+            snap = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if time.time() - snap.get("saved_at", 0) > ttl:
+        return None
+    rows = [tuple(r) for r in snap["rows"]]
+    if any(len(r) != 7 for r in rows):  # written before the metadata was stored
+        return None
+    return rows
+
+
+def _save_snapshot(path: Path, rows: List[Tuple]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump({"saved_at": time.time(), "rows": rows}, f)
+    os.replace(tmp, path)
 
 
 # ──────────────── ClickHouse InstrumentProvider ─────────────────── #
 class ClickHouseInstrumentProvider(InstrumentProvider):
     """Nautilus adapter provider for loading instruments from ClickHouse
-    (without MessageBus support)."""
+    (without MessageBus support).
+
+    ``load_all`` reads every instrument in a single query and keeps the rows
+    in a local JSON snapshot (``INSTRUMENT_SNAPSHOT``), so later processes
+    build their instruments without touching ClickHouse until the snapshot
+    is older than ``snapshot_ttl``."""
 
     def __init__(
         self,
-        connector: ClickHouseConnector,
+        connector: ClickHouseConnector | None,
         cache: Cache | None = None,
+        snapshot_path: Path | None = None,
+        snapshot_ttl: float = CACHE_TTL,
     ):
-        # super().__init__ expects bus and cache; we omit bus (None)
-        super().__init__(cache=cache)
+        super().__init__()
         self._ch = connector
-
-    # Simple synchronous implementation; an async wrapper could be added
-    def load_all(self) -> None:
-        raise NotImplementedError("load_all() is not implemented in this example.")
+        self._cache = cache
+        self._snapshot_path = Path(snapshot_path or INSTRUMENT_SNAPSHOT)
+        self._snapshot_ttl = snapshot_ttl
+
+    def _snapshot_file(self, filters: Dict) -> Path:
+        """One snapshot per filter combination, next to the configured path."""
+        if not filters:
+            return self._snapshot_path
+        key = "-".join(
+            f"{k}={','.join(v) if isinstance(v, (list, tuple)) else v}"
+            for k, v in sorted(filters.items())
+        )
+        return self._snapshot_path.with_name(f"{self._snapshot_path.stem}.{key}{self._snapshot_path.suffix}")
+
+    def load_all(self, filters: Optional[Dict] = None, refresh: bool = False) -> None:
+        """Load every instrument matching ``filters`` (``exchange``, ``mkt``,
+        ``quotes``; default spot) into the provider and the Cache."""
+        filters = dict(filters or {})
+        path = self._snapshot_file(filters)
+        rows = None if refresh else _load_snapshot(path, self._snapshot_ttl)
+        if rows is None:
+            if self._ch is None:
+                raise RuntimeError(f"No fresh instrument snapshot at {path} and no ClickHouse connector")
+            rows = instrument_rows_from_db(
+                self._ch,
+                exchange=filters.get("exchange"),
+                mkt=filters.get("mkt", "spot"),
+                quotes=filters.get("quotes"),
+            )
+            _save_snapshot(path, rows)
+
+        ts_ns = int(datetime.now(timezone.utc).timestamp() * 1e9)
+        pairs = [_pair_from_row(row, ts_ns) for row in rows]
+        self.add_bulk(pairs)
+        for pair in pairs:
+            self.add_currency(pair.base_currency)
+            self.add_currency(pair.quote_currency)
+            if self._cache is not None:
+                self._cache.add_instrument(pair)
+        self._loaded = True
+
+    async def load_all_async(self, filters: Optional[Dict] = None) -> None:
+        """``load_all`` on a worker thread (``clickhouse-driver`` is blocking)."""
+        await asyncio.to_thread(self.load_all, filters)
 
     # mini-API for single requests
     def currency_pair_from_db(
@@ -400,3 +555,9 @@ if __name__ == "__main__":
         f"price_precision={pair.price_precision}, "
         f"size_precision={pair.size_precision}"
     )
+
+    # 5) Whole universe in one query (snapshot reused on the next run)
+    print("\n— load_all (USDT spot pairs) —")
+    t0 = time.perf_counter()
+    provider.load_all({"exchange": "BINANCE", "mkt": "spot", "quotes": ["USDT"]})
+    print(f"⏱  {provider.count} instruments in {time.perf_counter() - t0:.3f}s")
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+sweep.py
+~~~~~~~~
+Parallel parameter sweep of the EMA-cross example strategies.
+
+Market data comes from a Nautilus ``ParquetDataCatalog`` (see
+``bin/export_catalog.py``). Each pool worker loads it once and then runs its
+share of the grid. The results table, one row per parameter point with PnL,
+returns and general statistics, is printed and written to ``--out``. With
+``--store`` every run is also kept as a columnar result (stats, fills and
+positions; see ``src/storage.py``) for later comparison. ``--mc N`` then
+resamples each stored run's trades N times and writes Monte Carlo confidence
+intervals to ``<out>_mc.csv`` (see ``src/robustness.py``).
+
+Usage:
+    python bin/sweep.py --catalog data/catalog --bar-type BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL \\
+        --grid fast_ema_period=5,10,20 --grid slow_ema_period=20,50,100 --grid trade_size=0.01,0.05
+    python bin/sweep.py --catalog data/catalog --strategy ema_cross_twap \\
+        --bar-type ETHUSDT.BINANCE-250-TICK-LAST-INTERNAL --grid fast_ema_period=5,10 \\
+        --set twap_horizon_secs=10 --set twap_interval_secs=2.5 --workers 8
+
+Dependencies:
+    pip install nautilus-trader pandas pyarrow
+"""
+
+import argparse
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.registry import RUN_REGISTRY, RunRegistry, sweep_runs
+from src.robustness import METHODS, store_robustness
+from src.storage import ResultStore
+from src.sweep import DataSpec, SweepSpec, VenueSpec, param_grid, run_sweep
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+STRATEGIES = {
+    "ema_cross": {
+        "strategy_path": "nautilus_trader.examples.strategies.ema_cross:EMACross",
+        "config_path": "nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+        "exec_algorithms": [],
+    },
+    "ema_cross_twap": {
+        "strategy_path": "nautilus_trader.examples.strategies.ema_cross_twap:EMACrossTWAP",
+        "config_path": "nautilus_trader.examples.strategies.ema_cross_twap:EMACrossTWAPConfig",
+        "exec_algorithms": ["nautilus_trader.examples.algorithms.twap:TWAPExecAlgorithm"],
+    },
+}
+
+
+def parse_value(text: str):
+    """Ints and floats are converted, anything else is passed as a string.
+
+    Strict float fields (``twap_interval_secs``) reject strings. ``Decimal``
+    fields such as ``trade_size`` accept either a number or a string.
+    """
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_values(text: str) -> list:
+    """Comma-separated values; ``a-b`` or ``a-b:step`` is an inclusive integer range."""
+    values = []
+    for part in text.split(","):
+        match = re.fullmatch(r"(\d+)-(\d+)(?::(\d+))?", part)
+        if match:
+            lo, hi, step = int(match[1]), int(match[2]), int(match[3] or 1)
+            values.extend(range(lo, hi + 1, step))
+        else:
+            values.append(parse_value(part))
+    return values
+
+
+def parse_assignments(items, multi: bool):
+    out = {}
+    for item in items or []:
+        key, _, value = item.partition("=")
+        if not value:
+            raise SystemExit(f"expected key=value, got {item!r}")
+        out[key] = parse_values(value) if multi else parse_value(value)
+    return out
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """Arguments shared with bin/walkforward.py."""
+    parser.add_argument("--catalog", required=True, help="ParquetDataCatalog path")
+    parser.add_argument("--bar-type", required=True,
+                        help="Strategy bar type; EXTERNAL bars are loaded from the catalog, "
+                             "INTERNAL ones are aggregated from trade ticks")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="ema_cross")
+    parser.add_argument("--grid", action="append", required=True, help="param=v1,v2,... or param=lo-hi[:step] (repeatable)")
+    parser.add_argument("--set", action="append", help="Fixed config value param=value (repeatable)")
+    parser.add_argument("--start", help="Data start (ISO date)")
+    parser.add_argument("--end", help="Data end (ISO date)")
+    parser.add_argument("--balance", action="append", help="Starting balance, e.g. '1000000 USDT' (repeatable)")
+    parser.add_argument("--account-type", default="CASH", choices=["CASH", "MARGIN"])
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: CPU count, 0 = in-process)")
+    parser.add_argument("--cache", type=Path, default=None,
+                        help="Memoize runs here as they finish; a rerun resumes from it, "
+                             "until the config or the catalog data changes")
+    parser.add_argument("--share", action="store_true",
+                        help="Load the bars once into shared memory instead of once per worker (one EXTERNAL bar type)")
+    parser.add_argument("--warm", action="store_true",
+                        help="Reuse each worker's engine between runs (reset + new strategy) instead of rebuilding it")
+    parser.add_argument("--registry", type=Path, default=RUN_REGISTRY, help="Run registry (SQLite) to index runs in")
+    parser.add_argument("--no-register", action="store_true", help="Do not index the runs")
+
+
+def register(args, spec: SweepSpec, results, kind: str, params, store=None) -> None:
+    """Index a results table in the run registry unless ``--no-register``."""
+    if args.no_register:
+        return
+    registry = RunRegistry(args.registry)
+    try:
+        runs = sweep_runs(spec, results, kind=kind, params=params, data_version=spec.data.version(), store=store)
+        n = registry.record_many(runs)
+    finally:
+        registry.close()
+    logger.info(f"🗂️ {n} runs indexed in {args.registry}")
+
+
+def build_spec(args) -> SweepSpec:
+    instrument_id = args.bar_type.split("-")[0]
+    external = args.bar_type.endswith("-EXTERNAL")
+    return SweepSpec(
+        data=DataSpec(
+            catalog=args.catalog,
+            instrument_id=instrument_id,
+            bar_types=[args.bar_type] if external else None,
+            start=args.start,
+            end=args.end,
+        ),
+        base_config={
+            "instrument_id": instrument_id,
+            "bar_type": args.bar_type,
+            "trade_size": "0.01",
+            "request_bars": False,
+            "subscribe_trade_ticks": not external,
+            **parse_assignments(args.set, multi=False),
+        },
+        venue=VenueSpec(
+            name=instrument_id.split(".")[-1],
+            account_type=args.account_type,
+            starting_balances=args.balance or ["1000000 USDT"],
+        ),
+        **STRATEGIES[args.strategy],
+    )
+
+
+def quote_capital(spec: SweepSpec) -> float:
+    """Starting balance in the instrument's quote currency (the first balance if none matches)."""
+    symbol = spec.data.instrument_id.split(".")[0]
+    balances = [b.split() for b in spec.venue.starting_balances]
+    return next((float(amount) for amount, ccy in balances if symbol.endswith(ccy)), float(balances[0][0]))
+
+
+def grid_points(args):
+    """The ``--grid`` product, dropping fast >= slow EMA combinations."""
+    grid = parse_assignments(args.grid, multi=True)
+    return grid, param_grid(grid, lambda p: p.get("fast_ema_period", 0) < p.get("slow_ema_period", 1 << 30))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel EMA-cross parameter sweep")
+    add_spec_arguments(parser)
+    parser.add_argument("--sort-by", default="PnL (total)")
+    parser.add_argument("--out", type=Path, default=Path("sweep_results.csv"), help=".csv or .parquet")
+    parser.add_argument("--store", type=Path, default=None, help="Result store directory (one run per point)")
+    parser.add_argument("--mc", type=int, default=0, metavar="N",
+                        help="Monte Carlo resamples per stored run after the sweep (needs --store)")
+    parser.add_argument("--mc-method", default="shuffle", choices=METHODS,
+                        help="Trade shuffle, trade bootstrap or block bootstrap of daily returns")
+    args = parser.parse_args()
+    if args.mc and not args.store:
+        parser.error("--mc resamples the stored runs: add --store")
+
+    spec = build_spec(args)
+    grid, points = grid_points(args)
+    logger.info(f"🚀 {len(points)} parameter points, strategy {args.strategy}")
+
+    done = []
+
+    def progress(row):
+        done.append(row)
+        status = f"❌ {row['error']}" if row.get("error") else f"PnL {row.get('PnL (total)', float('nan')):.2f}"
+        if row.get("cached"):
+            status += " (cached)"
+        logger.info(f"[{len(done)}/{len(points)}] {({k: row[k] for k in grid})} {status}")
+
+    results = run_sweep(spec, points, workers=args.workers, on_result=progress, store=args.store, cache=args.cache,
+                        share=args.share, warm=args.warm)
+    if args.sort_by in results:
+        results = results.sort_values(args.sort_by, ascending=False)
+
+    register(args, spec, results, "sweep", list(grid), store=args.store)
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    if args.out.suffix == ".parquet":
+        results.to_parquet(args.out, index=False)
+    else:
+        results.to_csv(args.out, index=False)
+    print(results.head(20).to_string(index=False))
+    logger.info(f"✅ Results written to {args.out}" + (f", runs stored in {args.store}" if args.store else ""))
+
+    runs = results["run_id"].dropna().tolist() if "run_id" in results else []  # failed points are not stored
+    if args.mc and not runs:
+        logger.warning("⚠️ No stored runs to resample, skipping --mc")
+    elif args.mc:
+        t0 = time.perf_counter()
+        mc = store_robustness(ResultStore(args.store), args.mc, args.mc_method, capital=quote_capital(spec),
+                              runs=runs, workers=args.workers)
+        mc_path = args.out.with_name(f"{args.out.stem}_mc.csv")
+        mc.to_csv(mc_path)
+        logger.info(f"🎲 {args.mc} {args.mc_method} resamples of {len(mc)} runs in "
+                    f"{time.perf_counter() - t0:.1f}s, intervals written to {mc_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+synth.py
+~~~~~~~~
+Generate seeded synthetic Binance klines or aggTrades for stress tests.
+
+Prices follow a GBM, jump-diffusion or regime-switching model (see
+``src/synthetic.py``); the same ``--seed`` always gives the same rows. Output
+formats:
+  • ``binance``  – data.binance.vision zips with ``.CHECKSUM`` sidecars under
+    ``--out`` (readable by ``bin/ingest.py``'s parse stage);
+  • ``parquet``  – one klines Parquet file, or ``TradeStore`` day partitions
+    for aggTrades;
+  • ``catalog``  – Nautilus bars or trade ticks in a ``ParquetDataCatalog``
+    (BTCUSDT/ETHUSDT test instruments), written one month per file.
+
+Usage:
+    python bin/synth.py --kind klines --interval 1s --start 2023-01-01 --end 2024-12-31 \\
+        --model regime --seed 7 --format binance --out data/synthetic
+    python bin/synth.py --kind aggTrades --start 2024-01-01 --end 2024-01-31 --format catalog \\
+        --out data/synthetic_catalog
+
+Dependencies:
+    pip install numpy pandas pyarrow nautilus-trader
+"""
+
+import argparse
+import dataclasses
+import itertools
+import logging
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.synthetic import INTERVAL_MS, MODELS, agg_trade_days, kline_bars, kline_days, write_binance, write_klines_parquet
+from src.ticks import ticks_from_frame
+from src.trades import TradeStore
+
+from backtest_clickhouse import BAR_SPEC
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+INSTRUMENTS = {"BTCUSDT": "btcusdt_binance", "ETHUSDT": "ethusdt_binance"}
+
+
+def write_catalog(args, days) -> int:
+    from nautilus_trader.model.data import BarType
+    from nautilus_trader.persistence.catalog import ParquetDataCatalog
+    from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+    instrument = getattr(TestInstrumentProvider, INSTRUMENTS[args.symbol])()
+    catalog = ParquetDataCatalog(str(args.out))
+    catalog.write_data([instrument])
+    if args.kind == "klines":
+        bar_type = BarType.from_str(f"{instrument.id}-{BAR_SPEC.get(args.interval, '1-SECOND')}-LAST-EXTERNAL")
+        build = lambda df: kline_bars(df, bar_type, instrument)
+    else:
+        build = lambda df: ticks_from_frame(df, instrument)
+    rows = 0
+    for _, month in itertools.groupby(days, key=lambda item: item[0].strftime("%Y-%m")):
+        df = pd.concat([frame for _, frame in month], ignore_index=True)
+        catalog.write_data(build(df))
+        rows += len(df)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seeded synthetic Binance market data")
+    parser.add_argument("--kind", default="klines", choices=["klines", "aggTrades"])
+    parser.add_argument("--symbol", default="BTCUSDT")
+    parser.add_argument("--market", default="spot", choices=["spot", "um", "cm"])
+    parser.add_argument("-i", "--interval", default="1m", choices=sorted(INTERVAL_MS))
+    parser.add_argument("--start", required=True, help="YYYY-MM-DD")
+    parser.add_argument("--end", required=True, help="YYYY-MM-DD (inclusive)")
+    parser.add_argument("--model", default="gbm", choices=sorted(MODELS))
+    parser.add_argument("--mu", type=float, default=None, help="Annual drift (overrides the model's)")
+    parser.add_argument("--sigma", type=float, default=None, help="Annual volatility (overrides the model's)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--price", type=float, default=40_000.0, help="Starting price")
+    parser.add_argument("--trades-per-day", type=float, default=500_000.0, help="aggTrades only")
+    parser.add_argument("--format", default="binance", choices=["binance", "parquet", "catalog"])
+    parser.add_argument("--period", default="daily", choices=["daily", "monthly"], help="Binance file period")
+    parser.add_argument("--out", type=Path, default=Path("data/synthetic"))
+    args = parser.parse_args()
+    args.symbol = args.symbol.upper()
+    if args.format == "catalog" and args.symbol not in INSTRUMENTS:
+        parser.error(f"--format catalog supports {', '.join(INSTRUMENTS)} only")
+
+    overrides = {k: v for k, v in (("mu", args.mu), ("sigma", args.sigma)) if v is not None}
+    model = dataclasses.replace(MODELS[args.model], **overrides)
+    if args.kind == "klines":
+        days = kline_days(args.start, args.end, args.interval, model, seed=args.seed, price=args.price)
+    else:
+        days = agg_trade_days(args.start, args.end, model, seed=args.seed, price=args.price,
+                              trades_per_day=args.trades_per_day)
+    counted = []
+    days = ((day, counted.append(len(df)) or df) for day, df in days)
+
+    t0 = time.perf_counter()
+    if args.format == "binance":
+        interval = args.interval if args.kind == "klines" else None
+        paths = write_binance(days, args.out, args.market, args.kind, args.symbol, interval, args.period)
+        target = f"{len(paths)} files under {args.out}"
+    elif args.format == "parquet" and args.kind == "klines":
+        path = args.out / f"{args.symbol}-{args.interval}.parquet"
+        write_klines_parquet(days, path)
+        target = str(path)
+    elif args.format == "parquet":
+        store = TradeStore(args.out)
+        for day, df in days:
+            store.write_day(args.market, args.symbol, day, df.drop(columns="is_best_match"))
+        target = f"trade store {args.out}"
+    else:
+        write_catalog(args, days)
+        target = f"catalog {args.out}"
+    elapsed = time.perf_counter() - t0
+    rows = sum(counted)
+    logger.info(f"✅ {rows:,} {args.kind} rows ({args.model}, seed {args.seed}) → {target} "
+                f"in {elapsed:.1f}s ({rows / max(elapsed, 1e-9) / 1e6:.2f}M rows/s)")
+
+
+if __name__ == "__main__":
+    main()
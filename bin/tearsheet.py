@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+tearsheet.py
+~~~~~~~~~~~~
+Tearsheets of every run in a result store, in one vectorized pass.
+
+Reads the ``positions`` and ``fills`` reports of all runs in ``--store``
+(written by ``bin/sweep.py --store``). Computes one row of metrics per run
+(see ``src/tearsheet.py``): trade stats, realized equity drawdowns,
+Sharpe/Sortino of daily returns, turnover and exposure. ``--key`` joins
+scalar values of the runs (e.g. their parameters) to the table.
+
+Usage:
+    python bin/tearsheet.py --store results/sweep_ema_runs --capital 1000000 \\
+        --key fast_ema_period --key slow_ema_period --sort sharpe --out results/tearsheet_ema.csv
+
+Dependencies:
+    pip install numpy pandas pyarrow
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.storage import ResultStore
+from src.tearsheet import store_reports, tearsheets
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorized tearsheets of stored runs")
+    parser.add_argument("--store", type=Path, required=True, help="Result store directory")
+    parser.add_argument("--capital", type=float, default=1_000_000.0, help="Starting quote balance of each run")
+    parser.add_argument("--periods", type=int, default=365, help="Return periods per year (365 for crypto)")
+    parser.add_argument("--key", action="append", default=[], help="Run value to join, e.g. a parameter name")
+    parser.add_argument("--sort", default="sharpe", help="Metric to rank by (descending)")
+    parser.add_argument("--top", type=int, default=20, help="Rows printed")
+    parser.add_argument("--out", type=Path, default=None, help="CSV with every run")
+    args = parser.parse_args()
+
+    store = ResultStore(args.store)
+    t0 = time.perf_counter()
+    reports = store_reports(store)
+    sheet = tearsheets(reports["positions"], reports["fills"], args.capital, args.periods)
+    elapsed = time.perf_counter() - t0
+    if sheet.empty:
+        logger.warning(f"⚠️ No closed positions in {args.store}")
+        return
+    logger.info(f"⚡ {len(sheet)} tearsheets from {len(reports['positions'])} positions in {elapsed:.2f}s")
+
+    if args.key:
+        sheet = store.summary(args.key).set_index("run_id").join(sheet, how="right")
+    if args.sort not in sheet:
+        parser.error(f"unknown metric {args.sort!r}; one of {', '.join(sheet.columns)}")
+    sheet = sheet.sort_values(args.sort, ascending=False)
+    cols = [*args.key, "trades", "pnl", "return_pct", "max_drawdown_pct", "sharpe", "sortino", "profit_factor",
+            "win_rate", "turnover", "exposure"]
+    print(sheet[[c for c in dict.fromkeys([*cols, args.sort]) if c in sheet]].head(args.top).to_string())
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        sheet.to_csv(args.out)
+        logger.info(f"✅ Tearsheets written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,17 +18,21 @@ Dependencies:
 
 import argparse
 import os
+import re
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import logging
-from datetime import datetime
+from datetime import datetime, date
 
 import pandas as pd
 from clickhouse_driver import Client
 from dotenv import load_dotenv
 from tqdm import tqdm
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.symbols import get_cache
+
 # Load environment variables
 load_dotenv()
 
@@ -68,6 +72,9 @@ KLINES_COLUMNS = [
     "ignore"          # 11: Unused field (always 0)
 ]
 
+# BTCUSDT-1m-2020-04.csv (monthly) or BTCUSDT-1m-2020-04-01.csv (daily)
+_FILE_DATE_RE = re.compile(r"-(\d{4})-(\d{2})(?:-(\d{2}))?\.csv$")
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -258,6 +265,26 @@ class ClickHouseUploader:
 
         logger.info(f"📈 Symbol: {symbol}, Interval: {interval}")
 
+        # Skip files dated outside the symbol's listing window
+        market = market_from_path(data_dir)
+        symbol_cache = get_cache(market)
+        try:
+            if symbol_cache.get(symbol) is None:
+                logger.warning(f"⚠️  {symbol} not found in {market} exchangeInfo cache")
+        except ConnectionError as e:
+            # Offline with an empty cache: upload everything rather than nothing
+            logger.warning(f"⚠️  No {market} symbol metadata, not filtering by listing window: {e}")
+            symbol_cache = None
+        if symbol_cache is not None:
+            listed_files = []
+            for csv_file in csv_files:
+                file_date, period = file_date_from_name(csv_file.name)
+                if file_date and not symbol_cache.is_listed(symbol, file_date, period):
+                    logger.warning(f"  ⏭️  Skipping {csv_file.name}: outside {symbol} listing window")
+                    continue
+                listed_files.append(csv_file)
+            csv_files = listed_files
+
         results = []
         total_success = 0
         total_errors = 0
@@ -275,6 +302,26 @@ class ClickHouseUploader:
         return results
 
 
+def market_from_path(data_dir: Path) -> str:
+    """Infer the trading type (spot/um/cm) from a data.binance.vision style path."""
+    parts = data_dir.parts
+    for market in ("um", "cm"):
+        if market in parts:
+            return market
+    return "spot"
+
+
+def file_date_from_name(name: str):
+    """Return ``(date, period)`` parsed from a klines CSV filename, or ``(None, None)``."""
+    m = _FILE_DATE_RE.search(name)
+    if not m:
+        return None, None
+    year, month, day = m.groups()
+    if day is None:
+        return date(int(year), int(month), 1), "monthly"
+    return date(int(year), int(month), int(day)), "daily"
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Upload Binance klines CSV data to ClickHouse")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+verify_checksums.py
+~~~~~~~~~~~~~~~~~~~
+Verify downloaded Binance archives against their ``.CHECKSUM`` sidecars.
+
+Files are hashed in parallel and their digests cached by (path, size, mtime)
+in ``CHECKSUM_INDEX``, so repeated runs only hash new or modified files.
+Mismatching files are deleted; with ``--redownload`` they are fetched again
+from data.binance.vision and re-verified.
+
+Usage:
+    python bin/verify_checksums.py --store-dir data/binance/python
+    python bin/verify_checksums.py --store-dir /data --workers 16 --redownload
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.checksum import ChecksumIndex, discard, find_archives, verify_files
+from src.ingest import BASE_URL, fetch
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+
+def redownload(paths, store_dir: Path) -> list:
+    """Fetch corrupt files again; the path under ``store_dir`` mirrors the URL."""
+    refetched = []
+    for path in paths:
+        rel = path.relative_to(store_dir).as_posix()
+        url = f"{BASE_URL}{rel}"
+        if fetch(url, path) and fetch(url + ".CHECKSUM", path.with_name(path.name + ".CHECKSUM")):
+            refetched.append(path)
+        else:
+            logger.error(f"  ❌ {url} is no longer published")
+    return refetched
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Verify Binance archives against .CHECKSUM files")
+    parser.add_argument("--store-dir", type=Path, required=True,
+                        help="STORE_DIRECTORY used by the downloaders (contains data/...)")
+    parser.add_argument("--workers", type=int, default=None, help="Hashing threads (default: CPU count)")
+    parser.add_argument("--index", type=Path, default=None, help="SQLite digest cache path")
+    parser.add_argument("--redownload", action="store_true", help="Re-fetch files that fail verification")
+    args = parser.parse_args()
+
+    index = ChecksumIndex(args.index) if args.index else ChecksumIndex()
+    archives = find_archives(args.store_dir)
+    logger.info(f"🔍 Verifying {len(archives)} archives")
+
+    t0 = time.perf_counter()
+    result = verify_files(archives, index, args.workers)
+    logger.info(
+        f"✅ {len(result['ok'])} ok, ❌ {len(result['mismatch'])} mismatched, "
+        f"⚠️  {len(result['unchecked'])} without sidecar ({time.perf_counter() - t0:.1f}s)"
+    )
+
+    bad = result["mismatch"]
+    for path in bad:
+        logger.warning(f"  🗑️  {path}")
+        discard(path, index)
+
+    if bad and args.redownload:
+        again = verify_files(redownload(bad, args.store_dir), index, args.workers)
+        logger.info(f"🔁 Re-downloaded {len(again['ok'])} files, {len(again['mismatch'])} still mismatched")
+        bad = again["mismatch"]
+
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+walkforward.py
+~~~~~~~~~~~~~~
+Walk-forward optimization of the EMA-cross example strategies.
+
+For each rolling train/test window (see ``docs/BIAS.md``) the parameter grid
+runs on the train period. The winner by ``--metric`` is then traded on the
+next, unseen test period. All windows run in parallel on one process pool.
+Written to ``--out``:
+  • ``in_sample.csv``      – every grid point on every train window;
+  • ``out_of_sample.csv``  – chosen parameters and OOS statistics per window;
+  • ``equity.csv``         – stitched OOS equity curve (cumulative realized
+    PnL in the quote currency).
+
+Usage:
+    python bin/walkforward.py --catalog data/catalog --bar-type BTCUSDT.BINANCE-1-HOUR-LAST-EXTERNAL \\
+        --start 2021-01-01 --end 2025-01-01 --train-days 365 --test-days 90 \\
+        --grid fast_ema_period=5,10,20 --grid slow_ema_period=20,50,100
+
+Dependencies:
+    pip install nautilus-trader pandas pyarrow
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.walkforward import make_windows, walk_forward
+
+from sweep import add_spec_arguments, build_spec, grid_points, register
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Walk-forward EMA-cross optimization")
+    add_spec_arguments(parser)
+    parser.add_argument("--train-days", type=float, required=True)
+    parser.add_argument("--test-days", type=float, required=True)
+    parser.add_argument("--step-days", type=float, default=None, help="Window step (default: --test-days)")
+    parser.add_argument("--anchored", action="store_true", help="Grow the train window from --start")
+    parser.add_argument("--metric", default="PnL (total)", help="In-sample selection statistic (maximized)")
+    parser.add_argument("--out", type=Path, default=Path("results/walkforward"))
+    args = parser.parse_args()
+    if not (args.start and args.end):
+        parser.error("--start and --end are required for walk-forward windows")
+
+    spec = build_spec(args)
+    grid, points = grid_points(args)
+    windows = make_windows(
+        args.start, args.end,
+        train=pd.Timedelta(days=args.train_days),
+        test=pd.Timedelta(days=args.test_days),
+        step=pd.Timedelta(days=args.step_days) if args.step_days else None,
+        anchored=args.anchored,
+    )
+    if not windows:
+        parser.error("date range is shorter than one train + test window")
+    logger.info(f"🚀 {len(windows)} windows × {len(points)} parameter points")
+
+    def progress(row):
+        params = {k: row.get(k) for k in grid}
+        status = f"❌ {row['error']}" if row.get("error") else f"OOS PnL {row.get('PnL (total)', float('nan')):.2f}"
+        logger.info(f"🪟 window {row['window']} {row['test_start']:%Y-%m-%d %H:%M} → {row['test_end']:%Y-%m-%d %H:%M} "
+                    f"{params} {status}")
+
+    result = walk_forward(spec, points, windows, metric=args.metric, workers=args.workers, on_window=progress,
+                          cache=args.cache, share=args.share, warm=args.warm)
+
+    register(args, spec, result.in_sample, "walkforward-is", list(grid))
+    register(args, spec, result.out_of_sample, "walkforward-oos", list(grid))
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    result.in_sample.to_csv(args.out / "in_sample.csv", index=False)
+    result.out_of_sample.to_csv(args.out / "out_of_sample.csv", index=False)
+    result.equity.to_csv(args.out / "equity.csv", header=True)
+
+    cols = ["window", "test_start", *grid, f"is_{args.metric}", "PnL (total)"]
+    print(result.out_of_sample[[c for c in cols if c in result.out_of_sample]].to_string(index=False))
+    final = result.equity.iloc[-1] if len(result.equity) else 0.0
+    logger.info(f"✅ Stitched OOS PnL {final:.2f} over {len(result.out_of_sample)} windows → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
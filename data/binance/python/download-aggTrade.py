@@ -13,7 +13,7 @@ from argparse import ArgumentParser, RawTextHelpFormatter, ArgumentTypeError
 from datetime import *
 import pandas as pd
 from enums import *
-from utility import download_file, get_all_symbols, get_parser, get_start_end_date_objects, convert_to_date_object, \
+from utility import download_file, get_all_symbols, is_listed, get_parser, get_start_end_date_objects, convert_to_date_object, \
   get_path
 
 
@@ -41,7 +41,7 @@ def download_monthly_aggTrades(trading_type, symbols, num_symbols, years, months
     for year in years:
       for month in months:
         current_date = convert_to_date_object('{}-{}-01'.format(year, month))
-        if current_date >= start_date and current_date <= end_date:
+        if current_date >= start_date and current_date <= end_date and is_listed(trading_type, symbol, current_date, 'monthly'):
           path = get_path(trading_type, "aggTrades", "monthly", symbol)
           file_name = "{}-aggTrades-{}-{}.zip".format(symbol.upper(), year, '{:02d}'.format(month))
           download_file(path, file_name, date_range, folder)
@@ -76,7 +76,7 @@ def download_daily_aggTrades(trading_type, symbols, num_symbols, dates, start_da
     print("[{}/{}] - start download daily {} aggTrades ".format(current+1, num_symbols, symbol))
     for date in dates:
       current_date = convert_to_date_object(date)
-      if current_date >= start_date and current_date <= end_date:
+      if current_date >= start_date and current_date <= end_date and is_listed(trading_type, symbol, current_date, 'daily'):
         path = get_path(trading_type, "aggTrades", "daily", symbol)
         file_name = "{}-aggTrades-{}.zip".format(symbol.upper(), date)
         download_file(path, file_name, date_range, folder)
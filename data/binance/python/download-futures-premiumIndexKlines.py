@@ -13,7 +13,7 @@ from datetime import *
 import pandas as pd
 
 from enums import START_DATE, END_DATE, DAILY_INTERVALS, PERIOD_START_DATE
-from utility import download_file, get_all_symbols, get_parser, convert_to_date_object, \
+from utility import download_file, get_all_symbols, is_listed, get_parser, convert_to_date_object, \
     get_path, raise_arg_error
 
 
@@ -43,7 +43,7 @@ def download_monthly_premiumIndexKlines(trading_type, symbols, num_symbols, inte
             for year in years:
                 for month in months:
                     current_date = convert_to_date_object('{}-{}-01'.format(year, month))
-                    if start_date <= current_date <= end_date:
+                    if start_date <= current_date <= end_date and is_listed(trading_type, symbol, current_date, 'monthly'):
                         path = get_path(trading_type, "premiumIndexKlines", "monthly", symbol, interval)
                         file_name = "{}-{}-{}-{}.zip".format(symbol.upper(), interval, year, '{:02d}'.format(month))
                         download_file(path, file_name, date_range, folder)
@@ -84,7 +84,7 @@ def download_daily_premiumIndexKlines(trading_type, symbols, num_symbols, interv
         for interval in intervals:
             for date in dates:
                 current_date = convert_to_date_object(date)
-                if start_date <= current_date <= end_date:
+                if start_date <= current_date <= end_date and is_listed(trading_type, symbol, current_date, 'daily'):
                     path = get_path(trading_type, "premiumIndexKlines", "daily", symbol, interval)
                     file_name = "{}-{}-{}.zip".format(symbol.upper(), interval, date)
                     download_file(path, file_name, date_range, folder)
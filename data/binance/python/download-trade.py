@@ -12,7 +12,7 @@ import sys
 from datetime import *
 import pandas as pd
 from enums import *
-from utility import download_file, get_all_symbols, get_parser, get_start_end_date_objects, convert_to_date_object, \
+from utility import download_file, get_all_symbols, is_listed, get_parser, get_start_end_date_objects, convert_to_date_object, \
   get_path
 
 
@@ -40,7 +40,7 @@ def download_monthly_trades(trading_type, symbols, num_symbols, years, months, s
     for year in years:
       for month in months:
         current_date = convert_to_date_object('{}-{}-01'.format(year, month))
-        if current_date >= start_date and current_date <= end_date:
+        if current_date >= start_date and current_date <= end_date and is_listed(trading_type, symbol, current_date, 'monthly'):
           path = get_path(trading_type, "trades", "monthly", symbol)
           file_name = "{}-trades-{}-{}.zip".format(symbol.upper(), year, '{:02d}'.format(month))
           download_file(path, file_name, date_range, folder)
@@ -75,7 +75,7 @@ def download_daily_trades(trading_type, symbols, num_symbols, dates, start_date,
     print("[{}/{}] - start download daily {} trades ".format(current+1, num_symbols, symbol))
     for date in dates:
       current_date = convert_to_date_object(date)
-      if current_date >= start_date and current_date <= end_date:
+      if current_date >= start_date and current_date <= end_date and is_listed(trading_type, symbol, current_date, 'daily'):
         path = get_path(trading_type, "trades", "daily", symbol)
         file_name = "{}-trades-{}.zip".format(symbol.upper(), date)
         download_file(path, file_name, date_range, folder)
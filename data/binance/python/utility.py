@@ -6,6 +6,10 @@ import urllib.request
 from argparse import ArgumentParser, RawTextHelpFormatter, ArgumentTypeError
 from enums import *
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from src.symbols import get_cache
+from src.checksum import ChecksumIndex, check_file, discard
+
 def get_destination_dir(file_url, folder=None):
   store_directory = os.environ.get('STORE_DIRECTORY')
   if folder:
@@ -18,16 +22,30 @@ def get_download_url(file_url):
   return "{}{}".format(BASE_URL, file_url)
 
 def get_all_symbols(type):
-  if type == 'um':
-    response = urllib.request.urlopen("https://fapi.binance.com/fapi/v1/exchangeInfo").read()
-  elif type == 'cm':
-    response = urllib.request.urlopen("https://dapi.binance.com/dapi/v1/exchangeInfo").read()
-  else:
-    response = urllib.request.urlopen("https://api.binance.com/api/v3/exchangeInfo").read()
-  return list(map(lambda symbol: symbol['symbol'], json.loads(response)['symbols']))
+  # symbols that vanished from exchangeInfo stay in the cache marked DELISTED; keep the live set
+  cache = get_cache(type)
+  try:
+    return [s for s in cache.symbols() if cache.get(s).get('status') != 'DELISTED']
+  except ConnectionError as e:
+    sys.exit("Cannot list {} symbols: {}\nPass the symbols explicitly with -s, or retry once online.".format(type, e))
 
-def download_file(base_path, file_name, date_range=None, folder=None):
+_listing_offline = set()
+
+def is_listed(type, symbol, d, period='daily'):
+  if isinstance(d, str):
+    d = convert_to_date_object(d)
+  try:
+    return get_cache(type).is_listed(symbol.upper(), d, period)
+  except ConnectionError as e:
+    # offline with an empty cache: download every date rather than none
+    if type not in _listing_offline:
+      _listing_offline.add(type)
+      print("\nwarning: no {} symbol metadata, not filtering by listing window: {}".format(type, e))
+    return True
+
+def download_file(base_path, file_name, date_range=None, folder=None, retry_corrupt=True):
   download_path = "{}{}".format(base_path, file_name)
+  request = (base_path, file_name, date_range, folder)
   if folder:
     base_path = os.path.join(folder, base_path)
   if date_range:
@@ -38,6 +56,9 @@ def download_file(base_path, file_name, date_range=None, folder=None):
 
   if os.path.exists(save_path):
     print("\nfile already exists! {}".format(save_path))
+    if file_name.endswith('.CHECKSUM'):
+      # archives fetched earlier may be truncated; the digest cache makes this cheap
+      verify_download(save_path[:-len('.CHECKSUM')], request, retry_corrupt)
     return
   
   # make the directory
@@ -69,6 +90,27 @@ def download_file(base_path, file_name, date_range=None, folder=None):
     print("\nFile not found: {}".format(download_url))
     pass
 
+  if file_name.endswith('.CHECKSUM'):
+    verify_download(save_path[:-len('.CHECKSUM')], request, retry_corrupt)
+
+_checksum_index = None
+
+def verify_download(archive_path, request, retry=True):
+  # check an archive against the sidecar that was just fetched; corrupt files are re-downloaded once
+  global _checksum_index
+  if _checksum_index is None:
+    _checksum_index = ChecksumIndex()
+  archive_path = Path(archive_path)
+  if not archive_path.exists() or check_file(archive_path, _checksum_index) is not False:
+    return
+  print("\nchecksum mismatch! {}".format(archive_path))
+  discard(archive_path, _checksum_index)
+  if retry:
+    base_path, file_name, date_range, folder = request
+    archive_name = file_name[:-len('.CHECKSUM')]
+    download_file(base_path, archive_name, date_range, folder)
+    download_file(base_path, file_name, date_range, folder, retry_corrupt=False)
+
 def convert_to_date_object(d):
   year, month, day = [int(x) for x in d.split('-')]
   date_obj = date(year, month, day)
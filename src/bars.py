@@ -0,0 +1,100 @@
+# src/bars.py
+"""Bulk construction of Nautilus ``Bar`` objects from NumPy arrays.
+
+``BarDataWrangler.process`` goes through ``DataFrame.values`` (an extra 2-D
+copy) and a Python-level ``map`` that builds every ``Price``/``Quantity``
+separately. Here the timestamps and OHLCV columns are prepared as contiguous
+``uint64``/``float64`` arrays in NumPy. They are then handed to
+``Bar.from_raw_arrays_to_list``, which builds all bars in a single Cython
+loop. The result is the same list of bars the wrangler would return.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.model.data import Bar, BarType
+
+
+def to_ns(ts) -> np.ndarray:
+    """Epoch nanoseconds as ``uint64`` from datetime64 values or integer ns."""
+    arr = np.asarray(ts)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        arr = arr.astype("datetime64[ns]").view("int64")
+    return np.ascontiguousarray(arr, dtype=np.uint64)
+
+
+def _column(values, n: int, name: str) -> np.ndarray:
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    if arr.shape != (n,):
+        raise ValueError(f"{name}: expected {n} values, got shape {arr.shape}")
+    if not np.isfinite(arr).all():
+        raise ValueError(f"{name}: contains NaN or infinite values")
+    return arr
+
+
+def bars_from_arrays(
+    bar_type: BarType,
+    instrument,
+    ts_event,
+    open,
+    high,
+    low,
+    close,
+    volume=None,
+    ts_init_delta: int = 0,
+    default_volume: float = 1_000_000.0,
+    ts_init=None,
+) -> List[Bar]:
+    """Build bars from columnar arrays at the instrument's price/size precision.
+
+    ``ts_init`` defaults to ``ts_event + ts_init_delta``.
+    """
+    ts_event = to_ns(ts_event)
+    n = len(ts_event)
+    if volume is None:
+        volume = np.full(n, default_volume)
+    ts_init = ts_event + np.uint64(ts_init_delta) if ts_init is None else to_ns(ts_init)
+    return Bar.from_raw_arrays_to_list(
+        bar_type,
+        instrument.price_precision,
+        instrument.size_precision,
+        _column(open, n, "open"),
+        _column(high, n, "high"),
+        _column(low, n, "low"),
+        _column(close, n, "close"),
+        _column(volume, n, "volume"),
+        ts_event,
+        ts_init,
+    )
+
+
+def arrays_from_bars(bars: Sequence[Bar]) -> Dict[str, np.ndarray]:
+    """Columnar ``ts_event``/``ts_init``/OHLCV arrays from a list of bars (the inverse
+    of ``bars_from_arrays``)."""
+    n = len(bars)
+    out = {
+        "ts_event": np.fromiter((b.ts_event for b in bars), dtype=np.uint64, count=n),
+        "ts_init": np.fromiter((b.ts_init for b in bars), dtype=np.uint64, count=n),
+    }
+    for name in ("open", "high", "low", "close", "volume"):
+        out[name] = np.fromiter((getattr(b, name).as_double() for b in bars), dtype=np.float64, count=n)
+    return out
+
+
+def bars_from_frame(
+    df: pd.DataFrame,
+    bar_type: BarType,
+    instrument,
+    ts_init_delta: int = 0,
+    default_volume: float = 1_000_000.0,
+) -> List[Bar]:
+    """Drop-in for ``BarDataWrangler(bar_type, instrument).process(df)``."""
+    volume: Optional[np.ndarray] = df["volume"].to_numpy() if "volume" in df else None
+    return bars_from_arrays(
+        bar_type, instrument, df.index.values,
+        df["open"].to_numpy(), df["high"].to_numpy(), df["low"].to_numpy(), df["close"].to_numpy(),
+        volume, ts_init_delta=ts_init_delta, default_volume=default_volume,
+    )
@@ -0,0 +1,314 @@
+# src/benchmarks.py
+"""Backtest throughput scenarios modelled on the ``refs/backtest`` examples.
+
+Every scenario builds a ready-to-run ``BacktestEngine`` on seeded synthetic
+data, so results are comparable across machines and Nautilus upgrades:
+
+* ``ema_cross_bars``       – EMACross on 1m BTCUSDT bars;
+* ``twap_trade_ticks``     – EMACrossTWAP + TWAP algorithm on ETHUSDT trade
+  ticks (``crypto_ema_cross_ethusdt_trade_ticks.py``);
+* ``orderbook_imbalance``  – OrderBookImbalance on L2 BTCUSDT deltas
+  (``crypto_orderbook_imbalance.py``);
+* ``orderbook_replay``     – the same deltas recorded to a Parquet L2
+  recording (``src/book.py``) and streamed back as ``OrderBookDeltas``, so
+  events/sec is replay throughput in deltas/sec;
+* ``synthetic_pnl``        – the ``synthetic_data_pnl_test.py`` setup: 6E
+  futures, margin account, per-contract fees, portfolio PnL queried on
+  every bar.
+
+``measure`` runs one scenario and reports setup and run wall time, events
+per second and the process' peak RSS. ``compare`` diffs a results file
+against a baseline.
+"""
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+import nautilus_trader
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.backtest.models import PerContractFeeModel
+from nautilus_trader.config import LoggingConfig, StrategyConfig
+from nautilus_trader.examples.algorithms.twap import TWAPExecAlgorithm
+from nautilus_trader.examples.strategies.ema_cross import EMACross, EMACrossConfig
+from nautilus_trader.examples.strategies.ema_cross_twap import EMACrossTWAP, EMACrossTWAPConfig
+from nautilus_trader.examples.strategies.orderbook_imbalance import OrderBookImbalance, OrderBookImbalanceConfig
+from nautilus_trader.model.currencies import BTC, ETH, USD, USDT
+from nautilus_trader.model.data import Bar, BarType, BookOrder, OrderBookDelta, TradeTick
+from nautilus_trader.model.enums import (AccountType, BookAction, BookType, OmsType, OrderSide, RecordFlag,
+                                         TimeInForce)
+from nautilus_trader.model.identifiers import InstrumentId, Venue
+from nautilus_trader.model.objects import Money, Price, Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.trading.strategy import Strategy
+
+from src.bars import bars_from_arrays
+from src.book import add_l2_replay, write_deltas
+
+REFS = Path(__file__).resolve().parents[1] / "refs" / "backtest"
+T0 = 1_704_067_200_000_000_000  # 2024-01-01 UTC in ns
+MINUTE = 60_000_000_000
+
+# (metric, True if higher is better) used by ``compare``
+METRICS = [("events_per_sec", True), ("run_s", False), ("setup_s", False), ("startup_s", False), ("peak_rss_mb", False)]
+
+
+def _engine() -> BacktestEngine:
+    return BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+
+
+def _random_walk(n: int, start: float, scale: float, seed: int) -> np.ndarray:
+    return start + np.cumsum(np.random.default_rng(seed).normal(0.0, scale, n))
+
+
+def _ohlc(close: np.ndarray, spread: float, seed: int) -> Tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(seed + 1)
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) + rng.random(len(close)) * spread
+    low = np.minimum(open_, close) - rng.random(len(close)) * spread
+    return open_, high, low, close
+
+
+# ── Scenarios ───────────────────────────────────────────────────── #
+
+def ema_cross_bars(n: int, seed: int) -> Tuple[BacktestEngine, int]:
+    instrument = TestInstrumentProvider.btcusdt_binance()
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    open_, high, low, close = _ohlc(_random_walk(n, 40_000.0, 5.0, seed), 3.0, seed)
+    bars = bars_from_arrays(bar_type, instrument, T0 + MINUTE * np.arange(n, dtype=np.uint64),
+                            open_, high, low, close)
+    engine = _engine()
+    engine.add_venue(Venue("BINANCE"), OmsType.NETTING, AccountType.CASH,
+                     starting_balances=[Money(1_000_000, USDT), Money(10, BTC)], base_currency=None)
+    engine.add_instrument(instrument)
+    engine.add_data(bars, validate=False, sort=False)
+    engine.add_strategy(EMACross(EMACrossConfig(
+        instrument_id=instrument.id, bar_type=bar_type, trade_size=Decimal("0.01"),
+        fast_ema_period=10, slow_ema_period=20, request_bars=False,
+    )))
+    return engine, n
+
+
+def twap_trade_ticks(n: int, seed: int) -> Tuple[BacktestEngine, int]:
+    instrument = TestInstrumentProvider.ethusdt_binance()
+    rng = np.random.default_rng(seed)
+    prices = np.round(_random_walk(n, 2_000.0, 0.05, seed), instrument.price_precision)
+    sizes = np.round(rng.random(n) * 2 + 0.001, instrument.size_precision)
+    ts = T0 + np.cumsum(rng.integers(1, 200_000_000, n)).astype(np.uint64)
+    ticks = TradeTick.from_raw_arrays_to_list(
+        instrument.id, instrument.price_precision, instrument.size_precision,
+        prices, sizes, rng.integers(1, 3, n).astype(np.uint8), [str(i) for i in range(n)], ts, ts,
+    )
+    engine = _engine()
+    engine.add_venue(Venue("BINANCE"), OmsType.NETTING, AccountType.CASH,
+                     starting_balances=[Money(1_000_000, USDT), Money(10, ETH)], base_currency=None,
+                     book_type=BookType.L1_MBP, trade_execution=True)
+    engine.add_instrument(instrument)
+    engine.add_data(ticks, validate=False, sort=False)
+    engine.add_strategy(EMACrossTWAP(EMACrossTWAPConfig(
+        instrument_id=instrument.id, bar_type=BarType.from_str(f"{instrument.id}-250-TICK-LAST-INTERNAL"),
+        trade_size=Decimal("0.10"), fast_ema_period=10, slow_ema_period=20,
+        twap_horizon_secs=10.0, twap_interval_secs=2.5,
+    )))
+    engine.add_exec_algorithm(TWAPExecAlgorithm())
+    return engine, n
+
+
+def orderbook_deltas(instrument, n: int, seed: int, depth: int = 10, resnap: int = 1_000) -> List[OrderBookDelta]:
+    """``n`` L2 level updates around a drifting mid, re-snapshotted every ``resnap``."""
+    rng = np.random.default_rng(seed)
+    tick = float(instrument.price_increment)
+    iid, pp, sp = instrument.id, instrument.price_precision, instrument.size_precision
+    deltas: List[OrderBookDelta] = []
+    ts, mid = T0, 40_000.0
+
+    def order(side, price, size):
+        return BookOrder(side, Price(price, pp), Quantity(size, sp), 0)
+
+    for i in range(n):
+        ts += int(rng.integers(1, 100_000_000))
+        if i % resnap == 0:
+            mid = round(mid + rng.normal(0, 20) * tick, pp)
+            deltas.append(OrderBookDelta.clear(iid, 0, ts, ts))
+            for k in range(1, depth + 1):
+                for side, sign in ((OrderSide.BUY, -1), (OrderSide.SELL, 1)):
+                    flags = RecordFlag.F_SNAPSHOT | (RecordFlag.F_LAST if k == depth and side == OrderSide.SELL else 0)
+                    deltas.append(OrderBookDelta(iid, BookAction.ADD, order(side, mid + sign * k * tick,
+                                                 round(rng.random() * 5 + 0.1, sp)), flags, 0, ts, ts))
+            continue
+        side, sign = (OrderSide.BUY, -1) if rng.random() < 0.5 else (OrderSide.SELL, 1)
+        k = int(rng.integers(1, depth + 1))
+        deltas.append(OrderBookDelta(iid, BookAction.UPDATE, order(side, mid + sign * k * tick,
+                                     round(rng.random() * 5 + 0.1, sp)), RecordFlag.F_LAST, 0, ts, ts))
+    return deltas
+
+
+def imbalance_engine(instrument) -> BacktestEngine:
+    engine = _engine()
+    engine.add_venue(Venue("BINANCE"), OmsType.NETTING, AccountType.CASH,
+                     starting_balances=[Money(1_000_000, USDT), Money(100, BTC)], base_currency=None,
+                     book_type=BookType.L2_MBP)
+    engine.add_instrument(instrument)
+    engine.add_strategy(OrderBookImbalance(OrderBookImbalanceConfig(
+        instrument_id=instrument.id, max_trade_size=Decimal("1.000"), trigger_min_size=1.0,
+        min_seconds_between_triggers=1.0, book_type="L2_MBP",
+    )))
+    return engine
+
+
+def orderbook_imbalance(n: int, seed: int) -> Tuple[BacktestEngine, int]:
+    instrument = TestInstrumentProvider.btcusdt_binance()
+    deltas = orderbook_deltas(instrument, n, seed)
+    engine = imbalance_engine(instrument)
+    engine.add_data(deltas, validate=False, sort=False)
+    return engine, len(deltas)
+
+
+def orderbook_replay(n: int, seed: int) -> Tuple[BacktestEngine, int]:
+    instrument = TestInstrumentProvider.btcusdt_binance()
+    tmp = tempfile.mkdtemp(prefix="bench-l2-")
+    atexit.register(shutil.rmtree, tmp, True)
+    rows = write_deltas(Path(tmp) / "BTCUSDT.parquet", instrument, orderbook_deltas(instrument, n, seed))
+    engine = imbalance_engine(instrument)
+    add_l2_replay(engine, Path(tmp) / "BTCUSDT.parquet")
+    return engine, rows
+
+
+class PnlProbeConfig(StrategyConfig, frozen=True):
+    instrument_id: InstrumentId
+    bar_type: BarType
+    hold_bars: int = 6
+    every_bars: int = 12
+
+
+class PnlProbe(Strategy):
+    """``MinimalStrategy`` of ``synthetic_data_pnl_test.py`` made periodic: reads
+    realized/unrealized PnL on every bar and trades one round trip per cycle."""
+
+    def __init__(self, config: PnlProbeConfig):
+        super().__init__(config)
+        self.bars_processed = -1
+        self.pnls: List[Tuple[Any, Any]] = []
+
+    def on_start(self):
+        self.subscribe_bars(self.config.bar_type)
+
+    def on_bar(self, bar: Bar):
+        self.bars_processed += 1
+        iid = self.config.instrument_id
+        self.pnls.append((self.portfolio.realized_pnl(iid), self.portfolio.unrealized_pnl(iid)))
+        phase = self.bars_processed % self.config.every_bars
+        if phase in (1, 1 + self.config.hold_bars):
+            flat = self.portfolio.is_completely_flat()
+            if flat == (phase == 1):
+                self.submit_order(self.order_factory.market(
+                    instrument_id=iid, order_side=OrderSide.BUY if flat else OrderSide.SELL,
+                    quantity=Quantity.from_int(1), time_in_force=TimeInForce.GTC,
+                ))
+
+
+def _load_ref(name: str):
+    spec = importlib.util.spec_from_file_location(f"refs_{name}", REFS / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_pnl(n: int, seed: int) -> Tuple[BacktestEngine, int]:
+    venue = Venue("SIM")
+    instrument = _load_ref("synthetic_data_pnl_test").create_6E_instrument(venue)
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    open_, high, low, close = _ohlc(np.abs(_random_walk(n, 1.1, 0.0002, seed)) + 0.5, 0.0001, seed)
+    bars = bars_from_arrays(bar_type, instrument, T0 + MINUTE * np.arange(n, dtype=np.uint64),
+                            open_, high, low, close, default_volume=100)
+    engine = _engine()
+    engine.add_venue(venue, OmsType.NETTING, AccountType.MARGIN, base_currency=USD,
+                     fee_model=PerContractFeeModel(Money(2.50, USD)), starting_balances=[Money(1_000_000, USD)])
+    engine.add_instrument(instrument)
+    engine.add_data(bars, validate=False, sort=False)
+    engine.add_strategy(PnlProbe(PnlProbeConfig(instrument_id=instrument.id, bar_type=bar_type)))
+    return engine, n
+
+
+# name -> (builder, events at scale 1)
+SCENARIOS: Dict[str, Tuple[Callable[[int, int], Tuple[BacktestEngine, int]], int]] = {
+    "ema_cross_bars": (ema_cross_bars, 50_000),
+    "twap_trade_ticks": (twap_trade_ticks, 500_000),
+    "orderbook_imbalance": (orderbook_imbalance, 200_000),
+    "orderbook_replay": (orderbook_replay, 200_000),
+    "synthetic_pnl": (synthetic_pnl, 20_000),
+}
+
+
+# ── Measuring ───────────────────────────────────────────────────── #
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (``ru_maxrss`` is KiB on Linux, bytes on macOS)."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20) if sys.platform == "darwin" else rss / 1024
+
+
+def measure(name: str, scale: float = 1.0, seed: int = 42) -> Dict[str, Any]:
+    """Build and run one scenario; run it in a fresh process for a meaningful peak RSS."""
+    builder, base = SCENARIOS[name]
+    t0 = time.perf_counter()
+    engine, events = builder(max(1, int(base * scale)), seed)
+    t1 = time.perf_counter()
+    engine.run()
+    t2 = time.perf_counter()
+    orders = len(engine.cache.orders())
+    engine.dispose()
+    return {
+        "scenario": name,
+        "events": events,
+        "setup_s": t1 - t0,
+        "run_s": t2 - t1,
+        "events_per_sec": events / (t2 - t1) if t2 > t1 else float("inf"),
+        "orders": orders,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "nautilus_trader": nautilus_trader.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.10) -> pd.DataFrame:
+    """Per-scenario, per-metric change vs the baseline; ``regression`` marks
+    moves in the bad direction by more than ``tolerance`` (relative)."""
+    base = {r["scenario"]: r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        ref = base.get(result["scenario"])
+        if ref is None:
+            continue
+        for metric, higher_is_better in METRICS:
+            new, old = result.get(metric), ref.get(metric)
+            if new is None or not old:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            rows.append({"scenario": result["scenario"], "metric": metric, "baseline": old, "current": new,
+                         "change": change, "regression": worse > tolerance})
+    return pd.DataFrame(rows, columns=["scenario", "metric", "baseline", "current", "change", "regression"])
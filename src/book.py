@@ -0,0 +1,188 @@
+# src/book.py
+"""Compact recording and replay of L2 order book deltas.
+
+A recording is one Parquet file per instrument (e.g. per day) with one row
+per ``OrderBookDelta``::
+
+    ts_event, ts_init, sequence    uint64 (delta-encoded)
+    action, side, flags            uint8  (Nautilus enum values)
+    price, size                    int64  (scaled by 10**precision)
+
+Instrument id and precisions live in the file's schema metadata. Integer
+prices and sizes stay exact and compress well, unlike the per-snapshot
+dicts of the live collectors. ``DeltaRecorder`` appends deltas from any
+source: an actor's ``on_order_book_deltas``, or ``OrderBookDeltaDataWrangler``
+output. ``replay`` reads a recording back in row batches as
+``OrderBookDeltas`` events (split on ``F_LAST``), ready for an ``L2_MBP``
+backtest.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterable, List, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from nautilus_trader.model.data import OrderBookDelta, OrderBookDeltas
+from nautilus_trader.model.enums import BookAction, OrderSide, RecordFlag
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.objects import FIXED_PRECISION
+
+FORMAT = "l2-deltas/1"
+SCHEMA = pa.schema([
+    ("ts_event", pa.uint64()),
+    ("ts_init", pa.uint64()),
+    ("sequence", pa.uint64()),
+    ("action", pa.uint8()),
+    ("side", pa.uint8()),
+    ("flags", pa.uint8()),
+    ("price", pa.int64()),
+    ("size", pa.int64()),
+])
+DELTA_ENCODED = ["ts_event", "ts_init", "sequence"]
+F_LAST = int(RecordFlag.F_LAST)
+
+
+# ── Recording ───────────────────────────────────────────────────── #
+
+class DeltaRecorder:
+    """Append-only writer of one instrument's deltas; rows are flushed as
+    Parquet row groups every ``flush_rows``. Use as a context manager or
+    call ``close()``."""
+
+    def __init__(self, path: Union[str, Path], instrument_id, price_precision: int, size_precision: int,
+                 flush_rows: int = 100_000):
+        self.path = Path(path)
+        self.instrument_id = InstrumentId.from_str(str(instrument_id))
+        self.price_precision = price_precision
+        self.size_precision = size_precision
+        self.flush_rows = flush_rows
+        self.rows = 0
+        self._price_div = 10 ** (FIXED_PRECISION - price_precision)
+        self._size_div = 10 ** (FIXED_PRECISION - size_precision)
+        self._buf: Dict[str, list] = {name: [] for name in SCHEMA.names}
+        meta = {"format": FORMAT, "instrument_id": str(self.instrument_id),
+                "price_precision": price_precision, "size_precision": size_precision}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = pq.ParquetWriter(
+            self.path, SCHEMA.with_metadata({"l2": json.dumps(meta)}), compression="zstd",
+            use_dictionary=["action", "side", "flags"], column_encoding={c: "DELTA_BINARY_PACKED" for c in DELTA_ENCODED},
+        )
+
+    @classmethod
+    def for_instrument(cls, path: Union[str, Path], instrument, **kwargs) -> "DeltaRecorder":
+        return cls(path, instrument.id, instrument.price_precision, instrument.size_precision, **kwargs)
+
+    def record(self, deltas: Union[OrderBookDeltas, OrderBookDelta, Iterable[OrderBookDelta]]) -> None:
+        """Buffer one delta, an ``OrderBookDeltas`` event or a list of deltas."""
+        if isinstance(deltas, OrderBookDeltas):
+            deltas = deltas.deltas
+        elif isinstance(deltas, OrderBookDelta):
+            deltas = [deltas]
+        buf = self._buf
+        for d in deltas:
+            order = d.order
+            buf["ts_event"].append(d.ts_event)
+            buf["ts_init"].append(d.ts_init)
+            buf["sequence"].append(d.sequence)
+            buf["action"].append(int(d.action))
+            buf["side"].append(int(order.side))
+            buf["flags"].append(d.flags)
+            buf["price"].append(order.price.raw // self._price_div)
+            buf["size"].append(order.size.raw // self._size_div)
+        if len(buf["ts_event"]) >= self.flush_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        n = len(self._buf["ts_event"])
+        if n:
+            self._writer.write_table(pa.table(self._buf, schema=self._writer.schema))
+            self.rows += n
+            self._buf = {name: [] for name in SCHEMA.names}
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self) -> "DeltaRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_deltas(path: Union[str, Path], instrument, deltas: Iterable[OrderBookDelta], **kwargs) -> int:
+    """Record ``deltas`` (e.g. ``OrderBookDeltaDataWrangler`` output) to ``path``; returns the row count."""
+    with DeltaRecorder.for_instrument(path, instrument, **kwargs) as recorder:
+        recorder.record(deltas)
+    return recorder.rows
+
+
+# ── Replay ──────────────────────────────────────────────────────── #
+
+def recording_meta(path: Union[str, Path]) -> Dict[str, Any]:
+    """Instrument id and precisions of a recording."""
+    meta = pq.read_schema(path).metadata or {}
+    if b"l2" not in meta:
+        raise ValueError(f"{path} is not an L2 delta recording")
+    return json.loads(meta[b"l2"])
+
+
+def deltas_from_arrays(
+    instrument_id: InstrumentId,
+    arrays: Dict[str, np.ndarray],
+    price_precision: int,
+    size_precision: int,
+) -> List[OrderBookDeltas]:
+    """``OrderBookDeltas`` events from recording columns, one per ``F_LAST`` run
+    (a trailing run without ``F_LAST`` becomes a last, partial event)."""
+    n = len(arrays["ts_event"])
+    if n == 0:
+        return []
+    price_mul = 10 ** (FIXED_PRECISION - price_precision)
+    size_mul = 10 ** (FIXED_PRECISION - size_precision)
+    actions = [BookAction(a) for a in range(int(arrays["action"].max()) + 1)]
+    sides = [OrderSide(s) for s in range(int(arrays["side"].max()) + 1)]
+    from_raw = OrderBookDelta.from_raw
+    deltas = [
+        from_raw(instrument_id, actions[a], sides[s], p * price_mul, price_precision, q * size_mul, size_precision,
+                 0, f, seq, te, ti)
+        for a, s, p, q, f, seq, te, ti in zip(
+            arrays["action"].tolist(), arrays["side"].tolist(), arrays["price"].tolist(), arrays["size"].tolist(),
+            arrays["flags"].tolist(), arrays["sequence"].tolist(), arrays["ts_event"].tolist(),
+            arrays["ts_init"].tolist(),
+        )
+    ]
+    ends = (np.flatnonzero(arrays["flags"] & F_LAST) + 1).tolist()
+    if not ends or ends[-1] != n:
+        ends.append(n)
+    starts = [0, *ends[:-1]]
+    return [OrderBookDeltas(instrument_id, deltas[a:b]) for a, b in zip(starts, ends)]
+
+
+def replay(path: Union[str, Path], batch_rows: int = 100_000) -> Generator[List[OrderBookDeltas], None, None]:
+    """Stream a recording as lists of ``OrderBookDeltas``, roughly ``batch_rows``
+    deltas each; an event is never split across lists."""
+    meta = recording_meta(path)
+    instrument_id = InstrumentId.from_str(meta["instrument_id"])
+    carry: Optional[Dict[str, np.ndarray]] = None
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows):
+        arrays = {name: batch.column(name).to_numpy() for name in SCHEMA.names}
+        if carry is not None:
+            arrays = {name: np.concatenate([carry[name], arrays[name]]) for name in SCHEMA.names}
+        last = np.flatnonzero(arrays["flags"] & F_LAST)
+        cut = int(last[-1]) + 1 if len(last) else 0
+        carry = {name: a[cut:] for name, a in arrays.items()}
+        if cut:
+            yield deltas_from_arrays(instrument_id, {name: a[:cut] for name, a in arrays.items()},
+                                     meta["price_precision"], meta["size_precision"])
+    if carry is not None and len(carry["ts_event"]):
+        yield deltas_from_arrays(instrument_id, carry, meta["price_precision"], meta["size_precision"])
+
+
+def add_l2_replay(engine, path: Union[str, Path], batch_rows: int = 100_000) -> None:
+    """Register a streaming replay of a recording on ``engine`` (use ``BookType.L2_MBP``)."""
+    engine.add_data_iterator(f"l2-{Path(path).stem}", replay(path, batch_rows))
@@ -0,0 +1,137 @@
+# src/checksum.py
+"""Parallel SHA-256 verification of downloaded files with a persisted index.
+
+Digests are stored in a small SQLite file keyed by path together with the
+file's size and mtime, so a file is only re-hashed when it changed on disk.
+Hashing runs on a thread pool: ``hashlib`` releases the GIL while digesting,
+so threads use all cores without pickling file contents between processes.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CHECKSUM_INDEX = Path(os.getenv("CHECKSUM_INDEX", Path.home() / ".cache" / "algocoin" / "checksums.sqlite"))
+
+
+class ChecksumMismatch(ValueError):
+    """Raised when a file does not match its ``.CHECKSUM`` sidecar."""
+
+
+def sha256sum(path: Path, chunk: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            buf = f.read(chunk)
+            if not buf:
+                break
+            h.update(buf)
+    return h.hexdigest()
+
+
+def expected_checksum(path: Path) -> Optional[str]:
+    """Digest from the ``<file>.CHECKSUM`` sidecar (``"<sha256>  <name>"``)."""
+    sidecar = path.with_name(path.name + ".CHECKSUM")
+    try:
+        return sidecar.read_text().split()[0].lower()
+    except (FileNotFoundError, IndexError):
+        return None
+
+
+class ChecksumIndex:
+    """``(path, size, mtime) → sha256`` cache backed by SQLite."""
+
+    def __init__(self, path: Path = CHECKSUM_INDEX):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER,"
+            " digest TEXT, hashed_at REAL)"
+        )
+        self._db.commit()
+
+    def lookup(self, path: Path) -> Optional[str]:
+        """Return the stored digest if the file is unchanged since it was hashed."""
+        st = os.stat(path)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT size, mtime_ns, digest FROM files WHERE path = ?", (str(Path(path).resolve()),)
+            ).fetchone()
+        if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            return row[2]
+        return None
+
+    def store(self, path: Path, digest: str) -> None:
+        st = os.stat(path)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                (str(Path(path).resolve()), st.st_size, st.st_mtime_ns, digest, time.time()),
+            )
+            self._db.commit()
+
+    def forget(self, path: Path) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM files WHERE path = ?", (str(Path(path).resolve()),))
+            self._db.commit()
+
+    def digest(self, path: Path) -> str:
+        """Cached digest of ``path``, hashing (and storing) it when stale."""
+        cached = self.lookup(path)
+        if cached is not None:
+            return cached
+        digest = sha256sum(path)
+        self.store(path, digest)
+        return digest
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def check_file(path: Path, index: ChecksumIndex) -> Optional[bool]:
+    """``True``/``False`` for match/mismatch, ``None`` when there is no sidecar."""
+    expected = expected_checksum(Path(path))
+    if expected is None:
+        return None
+    return index.digest(path) == expected
+
+
+def verify_files(
+    paths: Iterable[Path],
+    index: Optional[ChecksumIndex] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, List[Path]]:
+    """Verify ``paths`` in parallel; returns ``{"ok", "mismatch", "unchecked"}`` lists."""
+    index = index or ChecksumIndex()
+    paths = [Path(p) for p in paths]
+    out: Dict[str, List[Path]] = {"ok": [], "mismatch": [], "unchecked": []}
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for path, status in zip(paths, pool.map(lambda p: check_file(p, index), paths)):
+            key = "unchecked" if status is None else "ok" if status else "mismatch"
+            out[key].append(path)
+    return out
+
+
+def find_archives(root: Path) -> List[Path]:
+    """All downloaded ``.zip`` files under ``root``."""
+    return sorted(Path(root).rglob("*.zip"))
+
+
+def discard(path: Path, index: Optional[ChecksumIndex] = None) -> None:
+    """Delete a corrupt file so the next download pass fetches it again."""
+    Path(path).unlink(missing_ok=True)
+    Path(path).with_name(Path(path).name + ".CHECKSUM").unlink(missing_ok=True)
+    if index is not None:
+        index.forget(path)
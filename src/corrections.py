@@ -0,0 +1,142 @@
+# src/corrections.py
+"""Apply Binance aggTrades correction files to stored partitions.
+
+Binance publishes correction lists (``data/binance/updates/*``) naming monthly
+aggTrades archives that were re-issued, with the old and new SHA-256. For each
+entry we fetch the corrected archive, split it into days and compare every day
+with the ``TradeStore`` index digest. Only days whose content changed are
+rewritten, in the Parquet store and optionally in ClickHouse, and every changed
+row is written to an audit log.
+"""
+from __future__ import annotations
+
+import io
+import json
+import logging
+import zipfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO
+
+import pandas as pd
+
+from src.checksum import ChecksumMismatch, sha256sum
+from src.ingest import BASE_URL, fetch, get_path, read_agg_trades
+from src.trades import TradeStore, frame_digest, replace_day, split_days
+
+logger = logging.getLogger(__name__)
+
+VALUE_COLUMNS = ["price", "qty", "first_id", "last_id", "ts", "is_buyer_maker"]
+
+
+def _read_update_table(path: Path) -> pd.DataFrame:
+    path = Path(path)
+    if path.suffix != ".zip":
+        return pd.read_csv(path)
+    with zipfile.ZipFile(path) as zf:
+        name = next(n for n in zf.namelist() if n.endswith(".csv") and not n.startswith("__MACOSX"))
+        return pd.read_csv(io.BytesIO(zf.read(name)))
+
+
+def load_corrections(path: Path) -> List[Dict[str, Any]]:
+    """Parse a correction list (``File``/``File Path`` + old/new checksum columns)."""
+    out = []
+    for row in _read_update_table(path).to_dict("records"):
+        ref = (row.get("File Path") or row.get("File")).strip()
+        if "/" in ref:
+            rel = ref
+            parts = ref.split("/")
+            market = "spot" if parts[1] == "spot" else parts[2]
+        else:  # bare "SYMBOL-aggTrades-YYYY-MM" entries refer to spot monthly files
+            market = "spot"
+            stem = ref[:-4] if ref.endswith(".zip") else ref
+            rel = get_path(market, "aggTrades", "monthly", stem.split("-aggTrades-")[0]) + f"{stem}.zip"
+        name = rel.rsplit("/", 1)[-1]
+        out.append({
+            "market": market,
+            "symbol": name.split("-aggTrades-")[0],
+            "month": name[-11:-4],
+            "path": rel,
+            "old_digest": row["Original File Checksum"].split()[0],
+            "new_digest": row["New File Checksum"].split()[0],
+        })
+    return out
+
+
+def diff_partition(old: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Rows added, removed or modified between two partitions, keyed by ``agg_id``."""
+    merged = old.merge(new, on="agg_id", how="outer", suffixes=("_old", "_new"), indicator=True)
+    modified = pd.Series(False, index=merged.index)
+    for col in VALUE_COLUMNS:
+        modified |= merged[f"{col}_old"].ne(merged[f"{col}_new"])
+    change = merged["_merge"].map({"left_only": "removed", "right_only": "added", "both": "modified"})
+    merged["change"] = change.astype(str)
+    keep = merged["_merge"].ne("both") | modified
+    return merged.loc[keep].drop(columns="_merge").sort_values("agg_id").reset_index(drop=True)
+
+
+def _audit_rows(diff: pd.DataFrame, correction: Dict[str, Any], day: date, audit: TextIO) -> None:
+    for rec in diff.to_dict("records"):
+        audit.write(json.dumps({
+            "symbol": correction["symbol"],
+            "market": correction["market"],
+            "day": day.isoformat(),
+            "agg_id": int(rec["agg_id"]),
+            "change": rec["change"],
+            "old": {c: rec[f"{c}_old"] for c in VALUE_COLUMNS if pd.notna(rec[f"{c}_old"])},
+            "new": {c: rec[f"{c}_new"] for c in VALUE_COLUMNS if pd.notna(rec[f"{c}_new"])},
+        }, default=str) + "\n")
+
+
+def fetch_corrected(correction: Dict[str, Any], download_dir: Path) -> Path:
+    """Make sure the re-issued archive is on disk and matches the new checksum."""
+    path = Path(download_dir) / correction["path"]
+    if not path.exists() or sha256sum(path) != correction["new_digest"]:
+        if not fetch(BASE_URL + correction["path"], path):
+            raise FileNotFoundError(f"{correction['path']} is not published")
+    digest = sha256sum(path)
+    if digest != correction["new_digest"]:
+        raise ChecksumMismatch(f"{path.name}: {digest} != {correction['new_digest']}")
+    return path
+
+
+def apply_correction(
+    correction: Dict[str, Any],
+    store: TradeStore,
+    download_dir: Path,
+    client=None,
+    audit: Optional[TextIO] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Rewrite the stored days of one corrected monthly file that actually changed."""
+    market, symbol = correction["market"], correction["symbol"]
+    index = store.index(market, symbol)
+    stored = set(store.days(market, symbol, correction["month"]))
+    result = {"symbol": symbol, "month": correction["month"], "days": [], "rows": 0}
+    if not stored:
+        logger.info("%s %s: no stored partitions, skipping", symbol, correction["month"])
+        return result
+
+    corrected = dict(split_days(read_agg_trades(fetch_corrected(correction, download_dir))))
+    for day in sorted(stored):
+        new = corrected.get(day)
+        if new is not None and index[day.isoformat()]["digest"] == frame_digest(new):
+            continue
+        old = store.read_day(market, symbol, day)
+        if new is None:  # day vanished from the corrected file
+            new = old.iloc[0:0]
+        diff = diff_partition(old, new)
+        counts = diff["change"].value_counts().to_dict()
+        logger.info("%s %s: %s", symbol, day, ", ".join(f"{v} {k}" for k, v in sorted(counts.items())))
+        for rec in diff.head(20).itertuples():
+            logger.debug("  %s agg_id=%s", rec.change, rec.agg_id)
+        if audit is not None:
+            _audit_rows(diff, correction, day, audit)
+        result["days"].append(day)
+        result["rows"] += len(diff)
+        if dry_run:
+            continue
+        store.write_day(market, symbol, day, new)
+        if client is not None:
+            replace_day(client, new, market, symbol, day)
+    return result
@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 from datetime import datetime
 from typing import Dict, Optional, Tuple, Callable, Any, List
 
+import numpy as np
 import pandas as pd
 from clickhouse_driver import Client
 
@@ -66,11 +67,15 @@ def create_connection(
             f"Failed to connect to ClickHouse (host={host}, db={database}): {exc}"
         ) from exc
 
+CANDLE_FIELDS = """open_time, open, high, low, close,
+        volume, quote_vol, trades, taker_base, taker_quote"""
+
 def build_candles_query(
     symbol: str,
     timeframe: str,
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
+    fields: str = CANDLE_FIELDS,
 ) -> Tuple[str, Dict[str, Any]]:
     """Build the SQL query for candles data."""
     params = {"symbol": symbol, "interval": timeframe}
@@ -84,14 +89,27 @@ def build_candles_query(
     
     sql = f"""
     SELECT
-        open_time, open, high, low, close,
-        volume, quote_vol, trades, taker_base, taker_quote
+        {fields}
     FROM klines
     WHERE {' AND '.join(conds)}
     ORDER BY open_time
     """
     return sql, params
 
+CANDLE_ARRAY_COLUMNS = ["ts", "open", "high", "low", "close", "volume"]
+
+def build_candle_arrays_query(
+    symbol: str,
+    timeframe: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """Build the SQL query for columnar OHLCV arrays (``ts`` in epoch seconds)."""
+    return build_candles_query(
+        symbol, timeframe, start, end,
+        fields="toUnixTimestamp(open_time) AS ts, open, high, low, close, volume",
+    )
+
 def build_sentiment_query(
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
@@ -132,6 +150,14 @@ def transform_candles_data(rows: List[Tuple], columns: List[Tuple]) -> pd.DataFr
     df[num_cols] = df[num_cols].astype("float64")
     return df
 
+def transform_candle_arrays(columns: List[Tuple]) -> Dict[str, np.ndarray]:
+    """Turn a ``columnar=True`` result into NumPy arrays (``ts`` in nanoseconds)."""
+    if not columns:
+        return {c: np.empty(0, dtype="uint64" if c == "ts" else "float64") for c in CANDLE_ARRAY_COLUMNS}
+    out = {c: np.asarray(col, dtype="float64") for c, col in zip(CANDLE_ARRAY_COLUMNS[1:], columns[1:])}
+    out["ts"] = np.asarray(columns[0], dtype="uint64") * np.uint64(1_000_000_000)
+    return out
+
 def transform_sentiment_data(rows: List[Tuple], columns: List[Tuple]) -> pd.DataFrame:
     """Transform raw sentiment data into a DataFrame."""
     if not rows:
@@ -166,6 +192,11 @@ def get_candles(client: Client, **kwargs) -> pd.DataFrame:
     """Return a DataFrame with klines data."""
     return make_query_executor(client, build_candles_query, transform_candles_data)(**kwargs)
 
+def get_candle_arrays(client: Client, **kwargs) -> Dict[str, np.ndarray]:
+    """Return klines as columnar NumPy arrays, skipping the DataFrame entirely."""
+    sql, params = build_candle_arrays_query(**kwargs)
+    return transform_candle_arrays(client.execute(sql, params, columnar=True))
+
 def get_sentiment(client: Client, **kwargs) -> pd.DataFrame:
     """Return a DataFrame with sentiment data."""
     return make_query_executor(client, build_sentiment_query, transform_sentiment_data, with_column_types=True)(**kwargs)
@@ -0,0 +1,338 @@
+# src/feeds.py
+"""Streaming data feeds for the Nautilus ``BacktestEngine``.
+
+Instead of materialising a full ``list[Bar]`` before ``engine.add_data`` the
+feeds here read ClickHouse in time-ordered chunks and hand the engine one
+chunk of ``Data`` at a time via ``engine.add_data_iterator``. A background
+thread prefetches the next chunk while the engine works on the current one,
+so memory stays bounded by ``chunk × (prefetch + 1)``. ``array_bar_feed``
+does the same for bars held as columnar arrays (e.g. shared memory views,
+see ``src/shared.py``).
+
+A portfolio backtest gets one time-ordered feed per instrument, from
+ClickHouse (``candle_chunks``) or the Parquet catalog (``catalog_chunks``).
+``merge_feeds`` then k-way merges them on a heap. Only the current chunk of
+each instrument is held in memory, so the footprint grows with the number
+of instruments rather than with the length of the history.
+
+Tick backtests stream stored aggTrades one UTC day at a time, from
+ClickHouse (``clickhouse_trade_days``) or the Parquet ``TradeStore``
+(``store_trade_days``). ``tick_feed`` turns each day into ``TradeTick``
+batches (``src/ticks.py``) while the next day is prefetched.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import queue
+import threading
+from datetime import date, datetime, timedelta
+from operator import attrgetter
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.model.data import Bar, BarType
+
+from src.bars import bars_from_arrays, bars_from_frame
+from src.ticks import TICK_COLUMNS, frame_arrays, sort_by_time, ticks_from_arrays
+from src.trades import get_agg_trade_arrays
+
+_END = object()
+
+
+def time_chunks(start: datetime, end: datetime, chunk: timedelta) -> Iterator[Tuple[datetime, datetime]]:
+    """Split ``[start, end]`` into consecutive ``chunk``-sized windows."""
+    t0 = start
+    while t0 <= end:
+        t1 = min(t0 + chunk, end)
+        yield t0, t1
+        if t1 >= end:
+            break
+        t0 = t1
+
+
+def prefetch(items: Iterable[Any], depth: int = 1) -> Generator[Any, None, None]:
+    """Iterate ``items`` on a background thread, staying ``depth`` items ahead.
+
+    Exceptions raised by the producer are re-raised in the consumer.
+    """
+    if depth <= 0:
+        yield from items
+        return
+    buf: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in items:
+                while not stop.is_set():
+                    try:
+                        buf.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+            buf.put(_END)
+        except BaseException as exc:  # surfaced to the consumer
+            buf.put(exc)
+
+    thread = threading.Thread(target=produce, name="feed-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buf.get()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def candle_chunks(
+    connector,
+    *,
+    exchange: str,
+    symbol: str,
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    mkt: str = "spot",
+    chunk: timedelta = timedelta(days=7),
+) -> Iterator[pd.DataFrame]:
+    """Yield non-empty, non-overlapping candle DataFrames in time order."""
+    last: Optional[pd.Timestamp] = None
+    for t0, t1 in time_chunks(start, end, chunk):
+        df = connector.candles(
+            exchange=exchange, symbol=symbol, timeframe=timeframe,
+            start=t0, end=t1, mkt=mkt, empty_ok=True,
+        )
+        if last is not None and not df.empty:
+            df = df[df.index > last]  # chunk bounds are inclusive on both sides
+        if df.empty:
+            continue
+        last = df.index[-1]
+        yield df
+
+
+def catalog_chunks(
+    catalog,
+    data_cls: type,
+    identifier: str,
+    start: datetime,
+    end: datetime,
+    chunk: timedelta = timedelta(days=7),
+) -> Iterator[list]:
+    """Yield non-empty, non-overlapping chunks of one bar type's (or instrument's)
+    catalog data in time order."""
+    last: Optional[int] = None
+    for t0, t1 in time_chunks(start, end, chunk):
+        data = catalog.query(data_cls, identifiers=[identifier], start=t0, end=t1)
+        if last is not None:  # chunk bounds are inclusive on both sides
+            skip = 0
+            while skip < len(data) and data[skip].ts_init <= last:
+                skip += 1
+            data = data[skip:]
+        if not data:
+            continue
+        last = data[-1].ts_init
+        yield data
+
+
+def merge_feeds(
+    feeds: Iterable[Iterable[list]],
+    batch: int = 10_000,
+    key: Callable[[Any], int] = attrgetter("ts_init"),
+) -> Generator[list, None, None]:
+    """K-way heap merge of time-ordered chunk feeds into one feed of ``batch``-sized chunks.
+
+    Equal timestamps keep the order of ``feeds``.
+    """
+    merged = heapq.merge(*(itertools.chain.from_iterable(feed) for feed in feeds), key=key)
+    while True:
+        out = list(itertools.islice(merged, batch))
+        if not out:
+            return
+        yield out
+
+
+def bar_feed(
+    frames: Iterable[pd.DataFrame],
+    bar_type: BarType,
+    instrument,
+    ts_init_delta: int = 0,
+    prefetch_chunks: int = 1,
+    to_bars: Optional[Callable[[pd.DataFrame], List[Bar]]] = None,
+) -> Generator[List[Bar], None, None]:
+    """Convert candle frames to ``list[Bar]`` chunks, prefetching the next frame."""
+    if to_bars is None:
+        to_bars = lambda df: bars_from_frame(df, bar_type, instrument, ts_init_delta)  # noqa: E731
+    for df in prefetch(frames, prefetch_chunks):
+        yield to_bars(df)
+
+
+def array_bar_feed(
+    arrays: Dict[str, np.ndarray],
+    bar_type: BarType,
+    instrument,
+    lo: int = 0,
+    hi: Optional[int] = None,
+    chunk: int = 100_000,
+) -> Generator[List[Bar], None, None]:
+    """Rows ``[lo, hi)`` of ``arrays_from_bars``-style columns as ``list[Bar]`` chunks.
+
+    Each chunk is copied first: Nautilus' array constructors need writable
+    buffers, and the columns may be read-only shared memory views.
+    """
+    hi = len(arrays["ts_event"]) if hi is None else hi
+    for a in range(lo, hi, chunk):
+        c = {name: np.array(arrays[name][a:min(a + chunk, hi)]) for name in
+             ("ts_event", "ts_init", "open", "high", "low", "close", "volume")}
+        yield bars_from_arrays(
+            bar_type, instrument, c["ts_event"], c["open"], c["high"], c["low"], c["close"],
+            c["volume"], ts_init=c["ts_init"],
+        )
+
+
+def add_clickhouse_bars(
+    engine,
+    connector,
+    instrument,
+    bar_type: BarType,
+    *,
+    exchange: str,
+    symbol: str,
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    mkt: str = "spot",
+    chunk: timedelta = timedelta(days=7),
+    prefetch_chunks: int = 1,
+    ts_init_delta: int = 0,
+) -> None:
+    """Register a streaming ClickHouse bar feed on ``engine``.
+
+    The connector is used from the prefetch thread while the engine runs, so
+    give each concurrent feed its own ``ClickHouseConnector``.
+    """
+    frames = candle_chunks(
+        connector, exchange=exchange, symbol=symbol, timeframe=timeframe,
+        start=start, end=end, mkt=mkt, chunk=chunk,
+    )
+    engine.add_data_iterator(
+        f"clickhouse-{bar_type}",
+        bar_feed(frames, bar_type, instrument, ts_init_delta, prefetch_chunks),
+    )
+
+
+def add_catalog_portfolio(
+    engine,
+    catalog,
+    bar_types: Sequence[BarType],
+    start: datetime,
+    end: datetime,
+    chunk: timedelta = timedelta(days=7),
+    batch: int = 10_000,
+) -> None:
+    """Register one merged feed of many bar types streamed from a ``ParquetDataCatalog``.
+
+    The instruments must already be added to ``engine``.
+    """
+    feeds = [catalog_chunks(catalog, Bar, str(bar_type), start, end, chunk) for bar_type in bar_types]
+    engine.add_data_iterator("catalog-portfolio", merge_feeds(feeds, batch))
+
+
+def add_clickhouse_portfolio(
+    engine,
+    connector,
+    members: Sequence[Tuple[str, Any, BarType]],
+    *,
+    exchange: str,
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    mkt: str = "spot",
+    chunk: timedelta = timedelta(days=7),
+    batch: int = 10_000,
+    ts_init_delta: int = 0,
+) -> None:
+    """Register one merged ClickHouse bar feed for ``(symbol, instrument, bar_type)`` members.
+
+    The per-symbol queries run lazily on the engine's thread (no prefetch), so
+    one connector serves all members.
+    """
+    feeds = [
+        bar_feed(
+            candle_chunks(connector, exchange=exchange, symbol=symbol, timeframe=timeframe,
+                          start=start, end=end, mkt=mkt, chunk=chunk),
+            bar_type, instrument, ts_init_delta, prefetch_chunks=0,
+        )
+        for symbol, instrument, bar_type in members
+    ]
+    engine.add_data_iterator(f"clickhouse-portfolio-{timeframe}", merge_feeds(feeds, batch))
+
+
+# ── Trade ticks ─────────────────────────────────────────────────── #
+
+def _day(value) -> date:
+    return pd.Timestamp(value).date()
+
+
+def store_trade_days(store, market: str, symbol: str, start, end) -> Iterator[Dict[str, np.ndarray]]:
+    """Tick columns of every stored ``TradeStore`` day in ``[start, end]``, in order."""
+    first, last = _day(start), _day(end)
+    for day in store.days(market, symbol):
+        if first <= day <= last:
+            df = store.read_day(market, symbol, day, columns=TICK_COLUMNS)
+            if len(df):
+                yield frame_arrays(df)
+
+
+def clickhouse_trade_days(client, market: str, symbol: str, start, end, **kwargs) -> Iterator[Dict[str, np.ndarray]]:
+    """Tick columns of ``agg_trades`` one UTC day at a time for days ``[start, end]``."""
+    day, last = _day(start), _day(end)
+    while day <= last:
+        t0 = datetime(day.year, day.month, day.day)
+        arrays = get_agg_trade_arrays(client, market, symbol, t0, t0 + timedelta(days=1), **kwargs)
+        if len(arrays["ts"]):
+            yield sort_by_time(arrays)
+        day += timedelta(days=1)
+
+
+def tick_feed(
+    days: Iterable[Dict[str, np.ndarray]],
+    instrument,
+    batch: int = 500_000,
+    ts_init_delta: int = 0,
+    prefetch_chunks: int = 1,
+) -> Generator[list, None, None]:
+    """Convert day column sets to ``list[TradeTick]`` batches, prefetching the next day."""
+    for arrays in prefetch(days, prefetch_chunks):
+        n = len(arrays["ts"])
+        for a in range(0, n, batch):
+            part = {c: arrays[c][a:a + batch] for c in TICK_COLUMNS}
+            yield ticks_from_arrays(instrument, part["agg_id"], part["price"], part["qty"], part["ts"],
+                                    part["is_buyer_maker"], ts_init_delta)
+
+
+def add_store_ticks(engine, store, instrument, market: str, symbol: str, start, end, **kwargs) -> None:
+    """Register a streaming trade-tick feed from a ``TradeStore`` on ``engine``."""
+    engine.add_data_iterator(
+        f"aggtrades-{market}-{symbol}",
+        tick_feed(store_trade_days(store, market, symbol, start, end), instrument, **kwargs),
+    )
+
+
+def add_clickhouse_ticks(engine, client, instrument, market: str, symbol: str, start, end,
+                         database: Optional[str] = None, **kwargs) -> None:
+    """Register a streaming trade-tick feed from ClickHouse ``agg_trades`` on ``engine``.
+
+    As with ``add_clickhouse_bars``, the client is used from the prefetch thread.
+    """
+    days = clickhouse_trade_days(client, market, symbol, start, end,
+                                 **({"database": database} if database else {}))
+    engine.add_data_iterator(f"clickhouse-aggtrades-{market}-{symbol}", tick_feed(days, instrument, **kwargs))
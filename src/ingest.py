@@ -0,0 +1,273 @@
+# src/ingest.py
+"""Stage functions for the download → verify → parse → insert pipeline.
+
+Files are described by plain ``dict`` tasks (market, data type, period, symbol,
+interval, date, url, local path) so they can be queued, logged and persisted
+without extra types.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import urllib.error
+import urllib.request
+import zipfile
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from src.checksum import ChecksumIndex, ChecksumMismatch, discard, expected_checksum, sha256sum
+from src.db import create_connection, CH_DATABASE
+from src.symbols import get_cache
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://data.binance.vision/"
+KLINE_TYPES = ("klines", "markPriceKlines", "indexPriceKlines", "premiumIndexKlines")
+INSERT_TYPES = ("klines", "aggTrades")  # the klines table has no data_type column: mark/index/premium are download-only
+
+KLINES_COLUMNS = [
+    "open_time", "open", "high", "low", "close", "volume", "close_time",
+    "quote_vol", "trades", "taker_base", "taker_quote", "ignore",
+]
+KLINES_INSERT_COLUMNS = [
+    "symbol", "interval", "open_time", "open", "high", "low", "close",
+    "volume", "close_time", "quote_vol", "trades", "taker_base", "taker_quote",
+]
+AGG_TRADES_COLUMNS = [
+    "agg_id", "price", "qty", "first_id", "last_id", "ts", "is_buyer_maker", "is_best_match",
+]
+AGG_TRADES_DTYPES = {
+    "agg_id": "int64", "price": "float64", "qty": "float64", "first_id": "int64",
+    "last_id": "int64", "ts": "int64",
+}
+AGG_TRADES_INSERT_COLUMNS = [
+    "market", "symbol", "agg_id", "price", "qty", "first_id", "last_id", "ts", "is_buyer_maker",
+]
+
+# ── Planning ────────────────────────────────────────────────────── #
+
+def get_path(market: str, data_type: str, period: str, symbol: str, interval: Optional[str] = None) -> str:
+    """Relative data.binance.vision directory (mirrors ``utility.get_path``)."""
+    root = "data/spot" if market == "spot" else f"data/futures/{market}"
+    path = f"{root}/{period}/{data_type}/{symbol.upper()}/"
+    return f"{path}{interval}/" if interval else path
+
+
+def file_name(data_type: str, symbol: str, interval: Optional[str], stamp: str) -> str:
+    if data_type in KLINE_TYPES:
+        return f"{symbol.upper()}-{interval}-{stamp}.zip"
+    return f"{symbol.upper()}-{data_type}-{stamp}.zip"
+
+
+def _periods(period: str, start: date, end: date) -> Iterable[date]:
+    if period == "daily":
+        for n in range((end - start).days + 1):
+            yield start + timedelta(days=n)
+        return
+    cur = start.replace(day=1)
+    while cur <= end:
+        yield cur
+        cur = cur.replace(year=cur.year + cur.month // 12, month=cur.month % 12 + 1)
+
+
+def plan_files(
+    market: str,
+    data_type: str,
+    symbols: Iterable[str],
+    period: str,
+    start: date,
+    end: date,
+    intervals: Iterable[Optional[str]] = (None,),
+    dest: Path = Path("."),
+    prune: bool = True,
+) -> List[Dict[str, Any]]:
+    """Expand a download spec into file tasks, skipping dates outside listing windows."""
+    cache = get_cache(market) if prune else None
+    tasks = []
+    for symbol in symbols:
+        for interval in intervals:
+            base = get_path(market, data_type, period, symbol, interval)
+            for day in _periods(period, start, end):
+                if cache is not None and not cache.is_listed(symbol.upper(), day, period):
+                    continue
+                stamp = day.strftime("%Y-%m" if period == "monthly" else "%Y-%m-%d")
+                name = file_name(data_type, symbol, interval, stamp)
+                tasks.append({
+                    "market": market,
+                    "data_type": data_type,
+                    "period": period,
+                    "symbol": symbol.upper(),
+                    "interval": interval,
+                    "date": stamp,
+                    "url": f"{BASE_URL}{base}{name}",
+                    "path": str(Path(dest) / base / name),
+                })
+    return tasks
+
+
+# ── Download / verify ───────────────────────────────────────────── #
+
+def fetch(url: str, path: Path) -> bool:
+    """Download ``url`` to ``path`` atomically; return ``False`` on HTTP 404."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".part")
+    try:
+        with urllib.request.urlopen(url, timeout=60) as resp, open(tmp, "wb") as out:
+            while True:
+                buf = resp.read(1 << 20)
+                if not buf:
+                    break
+                out.write(buf)
+    except urllib.error.HTTPError as exc:
+        tmp.unlink(missing_ok=True)
+        if exc.code == 404:
+            return False
+        raise
+    os.replace(tmp, path)
+    return True
+
+
+def download(task: Dict[str, Any], checksum: bool = True) -> Optional[Dict[str, Any]]:
+    """Download the file (and its ``.CHECKSUM`` sidecar) unless already present."""
+    path = Path(task["path"])
+    if not path.exists() and not fetch(task["url"], path):
+        logger.info("Not published: %s", task["url"])
+        return None
+    if checksum:
+        sidecar = path.with_name(path.name + ".CHECKSUM")
+        if not sidecar.exists():
+            fetch(task["url"] + ".CHECKSUM", sidecar)
+    return task
+
+
+def verify(task: Dict[str, Any], index: Optional[ChecksumIndex] = None) -> Dict[str, Any]:
+    """Check the file against its sidecar.
+
+    A corrupt file is deleted and ``ChecksumMismatch`` raised, so the task can
+    go back to the download stage.
+    """
+    path = Path(task["path"])
+    expected = expected_checksum(path)
+    if expected is None:
+        logger.warning("No checksum sidecar for %s", path.name)
+        return task
+    actual = index.digest(path) if index is not None else sha256sum(path)
+    if actual != expected:
+        discard(path, index)
+        raise ChecksumMismatch(f"Checksum mismatch for {path.name}: {actual} != {expected}")
+    return task
+
+
+# ── Parse / insert ──────────────────────────────────────────────── #
+
+def _to_datetime(ms: pd.Series) -> pd.Series:
+    # spot files switched to microsecond timestamps in 2025
+    unit = "us" if ms.max() > 10**14 else "ms"
+    return pd.to_datetime(ms, unit=unit, utc=True)
+
+
+def has_header(path: Path) -> bool:
+    """Futures CSVs carry a header row, spot CSVs start straight with data."""
+    path = Path(path)
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path) as zf, zf.open(zf.namelist()[0]) as f:
+            first = f.read(1)
+    else:
+        with open(path, "rb") as f:
+            first = f.read(1)
+    return not first.isdigit()
+
+
+def read_klines(path: Path, symbol: str, interval: str) -> pd.DataFrame:
+    """Read a Binance klines CSV/zip into the ``klines`` table layout."""
+    df = pd.read_csv(
+        path,
+        header=0 if has_header(path) else None,
+        names=KLINES_COLUMNS,
+        dtype={"open_time": "int64", "close_time": "int64", "trades": "uint32"},
+    )
+    df = df.drop(columns="ignore")
+    df["open_time"] = _to_datetime(df["open_time"])
+    df["close_time"] = _to_datetime(df["close_time"])
+    df.insert(0, "interval", interval)
+    df.insert(0, "symbol", symbol)
+    return df[KLINES_INSERT_COLUMNS]
+
+
+def read_agg_trades(path: Path) -> pd.DataFrame:
+    """Read a Binance aggTrades CSV/zip; ``ts`` is returned in milliseconds."""
+    df = pd.read_csv(
+        path,
+        header=0 if has_header(path) else None,
+        names=AGG_TRADES_COLUMNS,
+        dtype=AGG_TRADES_DTYPES,
+    )
+    if len(df) and df["ts"].iloc[0] > 10**14:  # microsecond spot files, see _to_datetime
+        df["ts"] = df["ts"] // 1000
+    df["is_buyer_maker"] = df["is_buyer_maker"].astype(str).str.lower().eq("true")
+    return df.drop(columns="is_best_match")
+
+
+def parse(task: Dict[str, Any]) -> Dict[str, Any]:
+    if task["data_type"] in KLINE_TYPES:
+        task["frame"] = read_klines(Path(task["path"]), task["symbol"], task["interval"])
+    elif task["data_type"] == "aggTrades":
+        task["frame"] = read_agg_trades(Path(task["path"]))
+    else:
+        raise ValueError(f"No parser for {task['data_type']}")
+    return task
+
+
+def _insert_columns(df: pd.DataFrame, market: str, symbol: str) -> List[list]:
+    n = len(df)
+    ts = pd.to_datetime(df["ts"], unit="ms", utc=True).dt.to_pydatetime().tolist()
+    return [
+        [market] * n, [symbol] * n,
+        df["agg_id"].tolist(), df["price"].tolist(), df["qty"].tolist(),
+        df["first_id"].tolist(), df["last_id"].tolist(), ts,
+        df["is_buyer_maker"].astype("uint8").tolist(),
+    ]
+
+
+def insert_agg_trades(client, df: pd.DataFrame, market: str, symbol: str,
+                      database: str = CH_DATABASE, batch_size: int = 500_000) -> int:
+    sql = f"INSERT INTO {database}.agg_trades ({', '.join(AGG_TRADES_INSERT_COLUMNS)}) VALUES"
+    for start in range(0, len(df), batch_size):
+        client.execute(sql, _insert_columns(df.iloc[start:start + batch_size], market, symbol), columnar=True)
+    return len(df)
+
+
+def make_inserter(database: str = CH_DATABASE, batch_size: int = 100_000) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Return an insert stage; each worker thread keeps its own ClickHouse client.
+
+    Only ``INSERT_TYPES`` are accepted: mark, index and premium candles would
+    be indistinguishable from trade klines in the ``klines`` table.
+    """
+    local = threading.local()
+    sql = f"INSERT INTO {database}.klines ({', '.join(KLINES_INSERT_COLUMNS)}) VALUES"
+
+    def insert(task: Dict[str, Any]) -> Dict[str, Any]:
+        if task["data_type"] not in INSERT_TYPES:
+            raise ValueError(f"{task['data_type']} has no ClickHouse table; download it with --dry-run")
+        if not hasattr(local, "client"):
+            local.client = create_connection()
+        df = task.pop("frame")
+        if task["data_type"] == "aggTrades":
+            task["rows"] = insert_agg_trades(local.client, df, task["market"], task["symbol"], database)
+            return task
+        for start in range(0, len(df), batch_size):
+            batch = df.iloc[start:start + batch_size]
+            columns = [
+                batch[c].dt.to_pydatetime().tolist() if c in ("open_time", "close_time")
+                else batch[c].to_numpy().tolist()
+                for c in KLINES_INSERT_COLUMNS
+            ]
+            local.client.execute(sql, columns, columnar=True)
+        task["rows"] = len(df)
+        return task
+
+    return insert
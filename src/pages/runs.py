@@ -0,0 +1,70 @@
+# src/pages/runs.py
+import json
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from src.registry import METRICS, RUN_REGISTRY, RunRegistry
+
+st.set_page_config(layout="wide")
+
+st.title("Backtest Runs")
+st.write("Browsing the run registry. Only the index is queried; per-run reports are not loaded.")
+
+@st.cache_resource
+def get_registry(path):
+    """Open and cache the run registry."""
+    return RunRegistry(path)
+
+path = st.sidebar.text_input("Registry", str(RUN_REGISTRY))
+registry = get_registry(path)
+
+# Filters
+filters = {}
+for column in ("kind", "instrument_id", "bar_type", "strategy"):
+    choices = registry.distinct(column)
+    selected = st.sidebar.multiselect(column, choices)
+    if selected:
+        filters[column] = ("IN", selected)
+if st.sidebar.checkbox("Hide failed runs", value=True):
+    filters["error"] = None
+min_positions = st.sidebar.number_input("Min positions", min_value=0, value=0)
+if min_positions:
+    filters["positions"] = (">=", min_positions)
+
+metrics = list(METRICS)
+order_by = st.sidebar.selectbox("Sort by", metrics, index=metrics.index("sharpe"))
+descending = st.sidebar.radio("Order", ["Descending", "Ascending"]) == "Descending"
+limit = st.sidebar.number_input("Rows", min_value=10, max_value=100_000, value=500, step=100)
+
+runs = registry.query(filters, order_by=order_by, descending=descending, limit=limit)
+st.caption(f"{len(runs)} of {registry.count(filters)} matching runs")
+
+if runs.empty:
+    st.warning("No runs match the selected filters.")
+else:
+    runs["started_at"] = pd.to_datetime(runs["started_at"], unit="s", utc=True)
+    st.dataframe(runs, use_container_width=True, hide_index=True)
+
+    # Metric scatter
+    st.subheader("Metric Scatter")
+    x_col, y_col = st.columns(2)
+    x = x_col.selectbox("X", metrics, index=metrics.index("positions"))
+    y = y_col.selectbox("Y", metrics, index=metrics.index(order_by))
+    fig = go.Figure(data=[go.Scatter(x=runs[x], y=runs[y], mode="markers", text=runs["run_id"])])
+    fig.update_layout(xaxis_title=x, yaxis_title=y)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Run details
+    st.subheader("Run Details")
+    run_id = st.selectbox("Run", runs["run_id"])
+    run = registry.get(run_id)
+    config_col, stats_col = st.columns(2)
+    config_col.code(json.dumps(run["config"], indent=2), language="json")
+    stats_col.dataframe(
+        {"statistic": list(run["stats"]), "value": [str(v) for v in run["stats"].values()]},
+        hide_index=True,
+    )
+    if run["path"]:
+        st.caption(f"Reports: {run['path']}")
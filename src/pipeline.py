@@ -0,0 +1,158 @@
+# src/pipeline.py
+"""Streaming multi-stage pipeline over bounded queues.
+
+Each stage runs ``workers`` threads that pull items from an inbound queue,
+apply the stage function and push the result downstream. Queues are bounded,
+so a slow stage (e.g. inserts) throttles the faster ones upstream instead of
+letting finished downloads pile up in memory.
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """A pipeline step: ``func(item) -> item | None`` (``None`` drops the item)."""
+
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    queue_size: int = 8
+
+
+@dataclass
+class StageStats:
+    """Throughput/latency counters for one stage."""
+
+    name: str
+    items: int = 0
+    dropped: int = 0
+    errors: int = 0
+    busy: float = 0.0
+    first_start: Optional[float] = None
+    last_end: Optional[float] = None
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def wall(self) -> float:
+        if self.first_start is None or self.last_end is None:
+            return 0.0
+        return self.last_end - self.first_start
+
+    @property
+    def throughput(self) -> float:
+        """Items per second over the stage's active wall time."""
+        return self.items / self.wall if self.wall > 0 else 0.0
+
+    def latency(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        lat = sorted(self.latencies)
+        return lat[min(len(lat) - 1, int(q * len(lat)))]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.name,
+            "items": self.items,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "wall_s": round(self.wall, 3),
+            "busy_s": round(self.busy, 3),
+            "items_per_s": round(self.throughput, 3),
+            "p50_ms": round(self.latency(0.50) * 1e3, 1),
+            "p95_ms": round(self.latency(0.95) * 1e3, 1),
+        }
+
+
+class Pipeline:
+    """Run items through a chain of stages concurrently."""
+
+    def __init__(self, stages: List[Stage], on_error: Optional[Callable[[str, Any, Exception], None]] = None):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = stages
+        self.on_error = on_error
+        self.stats = [StageStats(s.name) for s in stages]
+        self.results: List[Any] = []
+        self._queues = [queue.Queue(maxsize=s.queue_size) for s in stages]
+        self._lock = threading.Lock()
+        self._remaining = [s.workers for s in stages]
+
+    def _record(self, idx: int, start: float, end: float, outcome: str) -> None:
+        st = self.stats[idx]
+        with self._lock:
+            st.first_start = start if st.first_start is None else min(st.first_start, start)
+            st.last_end = end if st.last_end is None else max(st.last_end, end)
+            st.busy += end - start
+            st.latencies.append(end - start)
+            if outcome == "ok":
+                st.items += 1
+            elif outcome == "dropped":
+                st.dropped += 1
+            else:
+                st.errors += 1
+
+    def _emit(self, idx: int, item: Any) -> None:
+        if idx + 1 < len(self.stages):
+            self._queues[idx + 1].put(item)  # blocks when downstream is full
+        else:
+            with self._lock:
+                self.results.append(item)
+
+    def _worker(self, idx: int) -> None:
+        stage = self.stages[idx]
+        inbox = self._queues[idx]
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                break
+            start = time.perf_counter()
+            try:
+                out = stage.func(item)
+            except Exception as exc:
+                self._record(idx, start, time.perf_counter(), "error")
+                logger.error("[%s] %s failed: %s", stage.name, item, exc)
+                if self.on_error is not None:
+                    self.on_error(stage.name, item, exc)
+                continue
+            self._record(idx, start, time.perf_counter(), "dropped" if out is None else "ok")
+            if out is not None:
+                self._emit(idx, out)
+
+        # last worker of this stage closes the next one
+        with self._lock:
+            self._remaining[idx] -= 1
+            last = self._remaining[idx] == 0
+        if last and idx + 1 < len(self.stages):
+            for _ in range(self.stages[idx + 1].workers):
+                self._queues[idx + 1].put(_DONE)
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """Feed ``items`` into the first stage and block until all stages drain."""
+        threads = [
+            threading.Thread(target=self._worker, args=(idx,), name=f"{stage.name}-{n}", daemon=True)
+            for idx, stage in enumerate(self.stages)
+            for n in range(stage.workers)
+        ]
+        for t in threads:
+            t.start()
+        for item in items:
+            self._queues[0].put(item)
+        for _ in range(self.stages[0].workers):
+            self._queues[0].put(_DONE)
+        for t in threads:
+            t.join()
+        return self.results
+
+    def report(self) -> List[Dict[str, Any]]:
+        return [st.as_dict() for st in self.stats]
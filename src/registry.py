@@ -0,0 +1,232 @@
+# src/registry.py
+"""Queryable index of backtest runs.
+
+Every run (a sweep point, a walk-forward window, a single backtest) gets one
+row in a SQLite table. The row holds the run id, what was run (strategy,
+instrument, bar type, config and its hash), the data version, timing, and
+the headline metrics as real columns. "Best Sharpe on BTCUSDT" is then one
+indexed query. The rest of the statistics are kept as JSON, and per-run
+reports stay in the ``ResultStore`` directory the row points to.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+RUN_REGISTRY = Path(os.getenv("RUN_REGISTRY", Path.home() / ".cache" / "algocoin" / "runs.sqlite"))
+
+# registry column -> statistic name in the sweep result rows
+METRICS = {
+    "pnl": "PnL (total)",
+    "pnl_pct": "PnL% (total)",
+    "sharpe": "Sharpe Ratio (252 days)",
+    "sortino": "Sortino Ratio (252 days)",
+    "profit_factor": "Profit Factor",
+    "win_rate": "Win Rate",
+    "expectancy": "Expectancy",
+    "orders": "orders",
+    "positions": "positions",
+}
+
+COLUMNS = {
+    "run_id": "TEXT PRIMARY KEY",
+    "kind": "TEXT",
+    "strategy": "TEXT",
+    "instrument_id": "TEXT",
+    "bar_type": "TEXT",
+    "config_hash": "TEXT",
+    "data_version": "TEXT",
+    "started_at": "REAL",
+    "elapsed": "REAL",
+    "error": "TEXT",
+    "path": "TEXT",
+    **{name: "REAL" for name in METRICS},
+    "config": "TEXT",
+    "stats": "TEXT",
+}
+
+INDEXES = ("instrument_id, sharpe", "instrument_id, pnl", "config_hash", "started_at", "kind")
+
+OPERATORS = ("=", "!=", "<", "<=", ">", ">=", "LIKE", "IN")
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Stable short hash of a (JSON-able) run configuration."""
+    text = json.dumps(config, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def _finite(value: Any) -> Optional[float]:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value == value and abs(value) != float("inf") else None
+
+
+class RunRegistry:
+    """SQLite table of runs with their config, data version and headline metrics."""
+
+    def __init__(self, path: Union[str, Path] = RUN_REGISTRY):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS runs (" + ", ".join(f"{k} {v}" for k, v in COLUMNS.items()) + ")"
+        )
+        for cols in INDEXES:
+            name = "idx_runs_" + cols.replace(", ", "_")
+            self._db.execute(f"CREATE INDEX IF NOT EXISTS {name} ON runs ({cols})")
+        self._db.commit()
+
+    # ── Writing ──────────────────────────────────────────────────── #
+
+    def record_many(self, runs: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace runs; keys that are not registry columns are ignored."""
+        rows = []
+        for run in runs:
+            if not run.get("run_id"):
+                raise ValueError("every run needs a run_id")
+            rows.append(tuple(run.get(k) for k in COLUMNS))
+        placeholders = ", ".join("?" * len(COLUMNS))
+        with self._lock:
+            self._db.executemany(f"INSERT OR REPLACE INTO runs VALUES ({placeholders})", rows)
+            self._db.commit()
+        return len(rows)
+
+    def record(self, run: Dict[str, Any]) -> None:
+        self.record_many([run])
+
+    def delete(self, run_ids: Sequence[str]) -> None:
+        with self._lock:
+            self._db.executemany("DELETE FROM runs WHERE run_id = ?", [(r,) for r in run_ids])
+            self._db.commit()
+
+    # ── Reading ──────────────────────────────────────────────────── #
+
+    @staticmethod
+    def _where(filters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        """``{"kind": "sweep", "sharpe": (">", 1)}`` -> SQL ``WHERE`` clause and args."""
+        clauses, args = [], []
+        for col, cond in (filters or {}).items():
+            if col not in COLUMNS:
+                raise ValueError(f"unknown registry column {col!r}")
+            op, value = cond if isinstance(cond, tuple) else ("=", cond)
+            op = op.upper()
+            if op not in OPERATORS:
+                raise ValueError(f"unsupported operator {op!r}")
+            if op == "IN":
+                value = list(value)
+                clauses.append(f"{col} IN ({', '.join('?' * len(value))})")
+                args.extend(value)
+            elif value is None:
+                clauses.append(f"{col} IS {'NOT ' if op == '!=' else ''}NULL")
+            else:
+                clauses.append(f"{col} {op} ?")
+                args.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = True,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Runs matching ``filters``, sorted by a registry column (NULLs last)."""
+        columns = list(columns or [c for c in COLUMNS if c not in ("config", "stats")])
+        for col in [*columns, *([order_by] if order_by else [])]:
+            if col not in COLUMNS:
+                raise ValueError(f"unknown registry column {col!r}")
+        where, args = self._where(filters)
+        sql = f"SELECT {', '.join(columns)} FROM runs{where}"
+        if order_by:
+            sql += f" ORDER BY {order_by} IS NULL, {order_by} {'DESC' if descending else 'ASC'}"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        with self._lock:
+            cur = self._db.execute(sql, args)
+            rows = cur.fetchall()
+        return pd.DataFrame(rows, columns=columns)
+
+    def get(self, run_id: str) -> Dict[str, Any]:
+        """One run with its config and full statistics decoded."""
+        df = self.query({"run_id": run_id}, columns=list(COLUMNS))
+        if df.empty:
+            raise KeyError(f"run {run_id!r} is not registered")
+        run = df.iloc[0].to_dict()
+        run["config"] = json.loads(run["config"]) if run["config"] else {}
+        run["stats"] = json.loads(run["stats"]) if run["stats"] else {}
+        return run
+
+    def distinct(self, column: str) -> List[Any]:
+        if column not in COLUMNS:
+            raise ValueError(f"unknown registry column {column!r}")
+        with self._lock:
+            rows = self._db.execute(f"SELECT DISTINCT {column} FROM runs WHERE {column} IS NOT NULL ORDER BY 1").fetchall()
+        return [r[0] for r in rows]
+
+    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        where, args = self._where(filters)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM runs{where}", args).fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+
+# ── Sweep results ───────────────────────────────────────────────── #
+
+def sweep_runs(
+    spec,
+    results: pd.DataFrame,
+    kind: str = "sweep",
+    params: Optional[Sequence[str]] = None,
+    data_version: Optional[str] = None,
+    store: Optional[Union[str, Path]] = None,
+    prefix: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Registry rows for a results table of ``src.sweep``/``src.walkforward``.
+
+    ``params`` names the swept columns (merged into the strategy config);
+    rows stored with a ``run_id`` get their ``ResultStore`` path.
+    """
+    started = time.time()
+    prefix = prefix or f"{kind}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    params = list(params or [])
+    runs = []
+    for i, row in enumerate(results.to_dict("records")):
+        row = {k: v for k, v in row.items() if not (isinstance(v, float) and v != v)}
+        config = {**spec.base_config, **{k: row[k] for k in params if k in row}}
+        stored = row.get("run_id")
+        stats = {k: v for k, v in row.items() if k not in params and k != "run_id"}
+        runs.append({
+            "run_id": f"{prefix}-{stored or f'{i:05d}'}",
+            "kind": kind,
+            "strategy": spec.strategy_path,
+            "instrument_id": spec.data.instrument_id,
+            "bar_type": config.get("bar_type"),
+            "config_hash": config_hash(config),
+            "data_version": data_version,
+            "started_at": started,
+            "elapsed": _finite(row.get("elapsed")),
+            "error": row.get("error"),
+            "path": str(Path(store) / stored) if store and stored else None,
+            **{col: _finite(row.get(stat)) for col, stat in METRICS.items()},
+            "config": json.dumps(config, sort_keys=True, default=str),
+            "stats": json.dumps(stats, default=str),
+        })
+    return runs
@@ -0,0 +1,106 @@
+# src/shared.py
+"""Columnar market data in shared memory for multi-process backtests.
+
+The parent process packs a dataset's columns (e.g. ``ts_event``, OHLCV) into
+a single ``multiprocessing.shared_memory`` block. It then passes the small,
+picklable ``SharedHandle`` to the workers. Each worker attaches read-only
+NumPy views of the same physical pages (zero copy). RAM for the raw columns
+is therefore paid once, however many workers there are. Workers build the
+Nautilus objects they need from these views chunk by chunk (see
+``src/feeds.py``).
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+ALIGN = 64
+
+
+@dataclass(frozen=True)
+class SharedHandle:
+    """Everything a worker needs to attach: block name and column layout."""
+    name: str
+    dataset_id: str
+    layout: Tuple[Tuple[str, str, int, int], ...]  # (column, dtype, length, byte offset)
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+class SharedDataset:
+    """Read-only column views over a shared memory block.
+
+    The creating process owns the block and unlinks it on ``close()`` (or on
+    leaving the ``with`` block). Attached workers only unmap their views.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, handle: SharedHandle, owner: bool):
+        self._shm = shm
+        self.handle = handle
+        self.owner = owner
+        self.arrays: Dict[str, np.ndarray] = {}
+        for column, dtype, length, offset in handle.layout:
+            arr = np.ndarray((length,), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+            arr.flags.writeable = False
+            self.arrays[column] = arr
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.arrays[column]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.arrays.values()))) if self.arrays else 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._shm.size
+
+    def close(self) -> None:
+        self.arrays.clear()  # views must go before the buffer can be released
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedDataset":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def dataset_id(*parts: Any) -> str:
+    """Short stable id of whatever identifies a dataset (spec fields, data version)."""
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:16]
+
+
+def share_arrays(arrays: Dict[str, np.ndarray], dataset: str, meta: Dict[str, Any] = None) -> SharedDataset:
+    """Copy equal-length 1-D ``arrays`` into a new shared block owned by this process."""
+    layout, offset = [], 0
+    lengths = {len(a) for a in arrays.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"columns differ in length: {sorted(lengths)}")
+    for column, arr in arrays.items():
+        arr = np.asarray(arr)
+        if arr.ndim != 1:
+            raise ValueError(f"{column}: expected a 1-D array, got shape {arr.shape}")
+        layout.append((column, arr.dtype.str, len(arr), offset))
+        offset += -(-arr.nbytes // ALIGN) * ALIGN
+    name = f"ac{dataset[:12]}{os.getpid()}"  # macOS caps shm names at 31 characters
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(offset, 1))
+    handle = SharedHandle(name, dataset, tuple(layout), dict(meta or {}))
+    for column, dtype, length, off in layout:
+        np.ndarray((length,), dtype=np.dtype(dtype), buffer=shm.buf, offset=off)[:] = arrays[column]
+    return SharedDataset(shm, handle, owner=True)
+
+
+def attach(handle: SharedHandle) -> SharedDataset:
+    """Read-only views of a block created by ``share_arrays`` in another process."""
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=handle.name, track=False)
+    else:  # registered again, but spawned workers report to the owner's resource tracker
+        shm = shared_memory.SharedMemory(name=handle.name)
+    return SharedDataset(shm, handle, owner=False)
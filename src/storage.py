@@ -1,20 +1,247 @@
+# src/storage.py
+"""Columnar storage of backtest results.
+
+A result is a dict of reports (DataFrames such as fills, positions or the
+account report) and scalar values (parameters, statistics). Each run is one
+directory::
+
+    <run>/meta.json          scalars + the list of reports with row counts
+    <run>/<report>.parquet   one table per report
+
+Opening a run only parses ``meta.json``. Reports are read on demand through
+memory-mapped Parquet, optionally restricted to some columns and filtered rows.
+Failures raise ``ResultStoreError`` instead of returning ``None``.
+"""
+from __future__ import annotations
+
+import json
+import os
 import pickle
+import shutil
+import time
+from datetime import date, datetime
+from decimal import Decimal
 from pathlib import Path
-from typing import Union
-
-def save_backtest_result(res: dict, path: Union[str, Path]) -> None:
-    """Save backtest results to the specified file using pickle."""
-    with open(path, "wb") as f:
-        pickle.dump(res, f)
-
-def load_backtest_result(src: Union[str, Path]) -> dict:
-    """
-    Load backtest results from the given file.
-    Returns the results as a dict, or None if the file is missing or cannot be unpickled.
-    """
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+META_FILE = "meta.json"
+FORMAT_VERSION = 1
+
+
+class ResultStoreError(Exception):
+    """Raised when a stored result is missing, incomplete or unreadable."""
+
+
+# ── Encoding ────────────────────────────────────────────────────── #
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (np.integer, np.floating, np.bool_)):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, Path)):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _cell(value: Any) -> Any:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+_PLAIN = (str, bytes, bool, int, float, Decimal, datetime, date)
+
+
+def _to_table(df: pd.DataFrame) -> pa.Table:
+    """Arrow table of ``df``; object columns holding containers or arbitrary
+    objects (e.g. order ``info`` dicts, Nautilus identifiers) are stored as text."""
+    text = [c for c in df.columns[df.dtypes == object]
+            if not all(v is None or isinstance(v, _PLAIN) for v in df[c])]
+    if text:
+        df = df.copy()
+        for col in text:
+            df[col] = df[col].map(_cell)
     try:
-        with open(src, "rb") as f:
-            return pickle.load(f)
+        return pa.Table.from_pandas(df, preserve_index=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+        raise ResultStoreError(f"cannot store report columns {list(df.columns)}: {exc}") from exc
+
+
+# ── Writing ─────────────────────────────────────────────────────── #
+
+def save_backtest_result(res: Dict[str, Any], path: Union[str, Path], overwrite: bool = True) -> Path:
+    """Write ``res`` as a run directory: DataFrame/Series values become Parquet
+    reports, everything else goes to ``meta.json`` (must be JSON serializable)."""
+    path = Path(path)
+    if path.exists():
+        if not overwrite:
+            raise ResultStoreError(f"{path} already exists")
+        if not (path / META_FILE).exists() and any(path.iterdir()):
+            raise ResultStoreError(f"{path} exists and is not a result directory")
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    meta: Dict[str, Any] = {"format": FORMAT_VERSION, "saved_at": time.time(), "values": {}, "reports": {}}
+    try:
+        for key, value in res.items():
+            series = isinstance(value, pd.Series)
+            if series:
+                value = value.to_frame(name=value.name if value.name is not None else key)
+            if isinstance(value, pd.DataFrame):
+                pq.write_table(_to_table(value), tmp / f"{key}.parquet")
+                meta["reports"][key] = {"rows": int(len(value)), "columns": [str(c) for c in value.columns],
+                                        "series": series}
+            else:
+                meta["values"][key] = value
+        with open(tmp / META_FILE, "w") as f:
+            json.dump(meta, f, indent=1, default=_json_default)
     except Exception:
-        # Return None on any error (e.g., file not found or pickle error)
-        return None
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    if path.exists():
+        shutil.rmtree(path)
+    os.replace(tmp, path)
+    return path
+
+
+def convert_pickle(src: Union[str, Path], dest: Union[str, Path]) -> Path:
+    """Rewrite a legacy pickled result dict (trusted local file) as a run directory."""
+    try:
+        with open(src, "rb") as f:
+            res = pickle.load(f)
+    except Exception as exc:
+        raise ResultStoreError(f"cannot unpickle {src}: {exc}") from exc
+    if not isinstance(res, dict):
+        raise ResultStoreError(f"{src} holds a {type(res).__name__}, expected a dict")
+    return save_backtest_result(res, dest)
+
+
+# ── Reading ─────────────────────────────────────────────────────── #
+
+class BacktestResult:
+    """Lazily loaded run directory; reports are read only when asked for."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        meta_path = self.path / META_FILE
+        if not meta_path.exists():
+            if self.path.is_file():
+                raise ResultStoreError(f"{self.path} is a file; legacy pickles must be converted with convert_pickle()")
+            raise ResultStoreError(f"no result at {self.path}")
+        try:
+            with open(meta_path) as f:
+                self.meta = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            raise ResultStoreError(f"unreadable {meta_path}: {exc}") from exc
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        return self.meta["values"]
+
+    @property
+    def reports(self) -> List[str]:
+        return list(self.meta["reports"])
+
+    def _report_path(self, name: str) -> Path:
+        if name not in self.meta["reports"]:
+            raise KeyError(f"{self.name} has no report {name!r} (have {self.reports})")
+        path = self.path / f"{name}.parquet"
+        if not path.exists():
+            raise ResultStoreError(f"{path} is listed in {META_FILE} but missing")
+        return path
+
+    def table(self, name: str, columns: Optional[Sequence[str]] = None, filters=None) -> pa.Table:
+        """Memory-mapped Arrow table of one report (``filters`` as in ``pq.read_table``)."""
+        path = self._report_path(name)
+        try:
+            return pq.read_table(path, columns=list(columns) if columns else None, filters=filters, memory_map=True)
+        except (OSError, pa.ArrowException) as exc:
+            raise ResultStoreError(f"cannot read {path}: {exc}") from exc
+
+    def frame(self, name: str, columns: Optional[Sequence[str]] = None, filters=None) -> pd.DataFrame:
+        return self.table(name, columns, filters).to_pandas()
+
+    def __getitem__(self, key: str) -> Any:
+        """A scalar value, or a report as the DataFrame (or Series) it was saved from."""
+        if key in self.meta["values"]:
+            return self.meta["values"][key]
+        frame = self.frame(key)
+        return frame.iloc[:, 0] if self.meta["reports"][key].get("series") else frame
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.meta["values"] or key in self.meta["reports"]
+
+    def keys(self) -> List[str]:
+        return [*self.meta["values"], *self.meta["reports"]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Everything, eagerly (the old pickle behaviour)."""
+        return {k: self[k] for k in self.keys()}
+
+
+def load_backtest_result(src: Union[str, Path]) -> BacktestResult:
+    """Open a run directory written by ``save_backtest_result``."""
+    return BacktestResult(src)
+
+
+# ── Many runs ───────────────────────────────────────────────────── #
+
+class ResultStore:
+    """A directory of run directories, e.g. one per sweep point."""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def save(self, run_id: str, res: Dict[str, Any]) -> Path:
+        return save_backtest_result(res, self.root / run_id)
+
+    def open(self, run_id: str) -> BacktestResult:
+        return BacktestResult(self.root / run_id)
+
+    def runs(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if (p / META_FILE).exists())
+
+    def __iter__(self) -> Iterator[BacktestResult]:
+        return (self.open(r) for r in self.runs())
+
+    def summary(self, keys: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Scalar values of every run, one row per run, from ``meta.json`` only."""
+        rows = []
+        for result in self:
+            values = result.values if keys is None else {k: result.values.get(k) for k in keys}
+            rows.append({"run_id": result.name, **values})
+        return pd.DataFrame(rows)
+
+    def scan(self, report: str, columns: Optional[Sequence[str]] = None, filter=None) -> pa.Table:
+        """One report across all runs as a single Arrow table with a ``run_id`` column.
+
+        ``filter`` is a ``pyarrow.dataset`` expression, e.g. ``ds.field("run_id") == "a"``.
+        """
+        files = [str(self.root / r / f"{report}.parquet") for r in self.runs()
+                 if (self.root / r / f"{report}.parquet").exists()]
+        if not files:
+            raise ResultStoreError(f"no run under {self.root} has a {report!r} report")
+        dataset = ds.dataset(
+            files,
+            format="parquet",
+            partitioning=ds.partitioning(pa.schema([("run_id", pa.string())])),
+            partition_base_dir=str(self.root),
+        )
+        cols = None if columns is None else [*columns, "run_id"]
+        return dataset.to_table(columns=cols, filter=filter)
@@ -0,0 +1,601 @@
+# src/sweep.py
+"""Parallel parameter sweeps over Nautilus backtests.
+
+A sweep is a ``SweepSpec`` plus a list of parameter points. The spec holds the
+strategy as importable paths, the venue and where the market data lives. Each
+point overrides part of the strategy config. Points run on a process pool.
+Every worker loads the instrument and data from the Parquet catalog once, in
+its initializer, and reuses them for all the points it runs. Each run
+returns one flat row of parameters and summary statistics, and
+``run_sweep`` collects the rows into a single DataFrame. With a ``store``
+directory every run is also written by the worker as a columnar result
+(statistics plus fills and positions reports, see ``src/storage.py``).
+
+With a ``cache`` directory, runs are memoized. The key hashes the strategy,
+its config, the venue, the instrument, the data window and a fingerprint of
+the catalog files that cover that window (plus the exporter's watermark and
+row count). A repeated point returns its stored row without running the
+engine. Ingesting new data for the window changes the fingerprint, so stale
+entries are never hit.
+
+The cache doubles as a checkpoint. A worker writes each run to the cache
+as soon as the run finishes, and the write is atomic. A restarted sweep
+first looks up every point in the parent (``completed_runs``) and submits
+only the missing ones. A killed job therefore loses at most the runs that
+were in flight.
+
+With ``share=True`` the parent loads the bars once and puts them in shared
+memory as columns (``src/shared.py``). Workers attach zero-copy, read-only
+views and build ``Bar`` objects chunk by chunk as the engine consumes them,
+so no worker holds its own copy of the whole dataset.
+
+With ``warm=True`` each worker keeps its engines (venue, instrument and
+data already added) between runs. A run then only resets the engine and
+swaps in the point's strategy. This saves the build cost for every point
+after the first on the same window.
+"""
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing as mp
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.common.config import resolve_path
+from nautilus_trader.config import ImportableStrategyConfig, LoggingConfig
+from nautilus_trader.model.currencies import Currency
+from nautilus_trader.model.data import Bar, BarType, TradeTick
+from nautilus_trader.model.enums import AccountType, BookType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.funcs import class_to_filename, urisafe_identifier
+from nautilus_trader.trading.config import StrategyFactory
+
+from src.bars import arrays_from_bars
+from src.catalog import ExportState
+from src.feeds import array_bar_feed
+from src.shared import SharedDataset, SharedHandle, attach, dataset_id, share_arrays
+from src.storage import ResultStore, ResultStoreError
+
+logger = logging.getLogger(__name__)
+
+
+# ── Specs ───────────────────────────────────────────────────────── #
+
+@dataclass
+class DataSpec:
+    """Market data for a sweep, read from a ``ParquetDataCatalog``.
+
+    With ``bar_types`` the listed bars are loaded, otherwise the instrument's
+    trade ticks.
+    """
+    catalog: str
+    instrument_id: str
+    bar_types: Optional[List[str]] = None
+    start: Optional[str] = None
+    end: Optional[str] = None
+
+    def load_instrument(self, catalog: Optional[ParquetDataCatalog] = None):
+        catalog = catalog or ParquetDataCatalog(self.catalog)
+        instruments = catalog.instruments(instrument_ids=[self.instrument_id])
+        if not instruments:
+            raise ValueError(f"{self.instrument_id} not found in catalog {self.catalog}")
+        return instruments[0]
+
+    def load(self) -> Tuple[Any, list]:
+        catalog = ParquetDataCatalog(self.catalog)
+        instrument = self.load_instrument(catalog)
+        if self.bar_types:
+            data = catalog.bars(bar_types=self.bar_types, start=self.start, end=self.end)
+        else:
+            data = catalog.trade_ticks(instrument_ids=[self.instrument_id], start=self.start, end=self.end)
+        if not data:
+            raise ValueError(f"No data for {self.instrument_id} in catalog {self.catalog}")
+        return instrument, data
+
+    def share(self) -> SharedDataset:
+        """Load the bars once into shared memory (owned by the caller, who must close it)."""
+        if not self.bar_types or len(self.bar_types) != 1:
+            raise ValueError("shared market data needs exactly one bar type")
+        _, bars = self.load()
+        arrays = arrays_from_bars(bars)
+        del bars
+        key = dataset_id(self.catalog, self.instrument_id, self.bar_types, self.start, self.end, self.version())
+        return share_arrays(arrays, key, meta={"bar_type": self.bar_types[0]})
+
+    def version(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> str:
+        """Fingerprint of the catalog data this spec reads within ``[start_ns, end_ns)``.
+
+        Hashes name, size and mtime of the instrument file and of every data
+        file overlapping the range, plus the exporter state of the bar types.
+        The files are listed from the catalog's ``data/<class>/<identifier>``
+        layout here rather than through the catalog's private query helpers,
+        whose signature changes between Nautilus releases.
+        """
+        catalog = ParquetDataCatalog(self.catalog)
+        lo = max(x for x in (_ns(self.start), start_ns, 0) if x is not None)
+        his = [x for x in (_ns(self.end), end_ns) if x is not None]
+        hi = min(his) if his else None
+        instrument = catalog.instruments(instrument_ids=[self.instrument_id])
+        files = _data_files(self.catalog, type(instrument[0]), [self.instrument_id]) if instrument else []
+        if self.bar_types:
+            files += _data_files(self.catalog, Bar, list(self.bar_types), lo, hi)
+        else:
+            files += _data_files(self.catalog, TradeTick, [self.instrument_id], lo, hi)
+        parts: List[Any] = []
+        for path in sorted(files):
+            st = path.stat()
+            parts.append([os.path.relpath(path, self.catalog), st.st_size, st.st_mtime_ns])
+        exports = ExportState(Path(self.catalog)).load()
+        parts.append({key: exports.get(key) for key in self.bar_types or []})
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def _data_files(root: str, data_cls: type, identifiers: Sequence[str], lo: int = 0,
+                hi: Optional[int] = None) -> List[Path]:
+    """Parquet files of ``identifiers`` whose ``<start>_<end>`` name overlaps ``[lo, hi]``."""
+    out = []
+    for identifier in identifiers:
+        directory = Path(root) / "data" / class_to_filename(data_cls) / urisafe_identifier(identifier)
+        for path in directory.glob("*.parquet"):
+            interval = _file_interval(path.stem)
+            if interval is None or (interval[1] >= lo and (hi is None or interval[0] <= hi)):
+                out.append(path)
+    return out
+
+
+def _file_interval(stem: str) -> Optional[Tuple[int, int]]:
+    # "2024-01-01T00-00-00-000000000Z_2024-01-03T01-59-00-000000000Z" (older catalogs: "<ns>-<ns>")
+    try:
+        if "_" in stem:
+            return tuple(pd.Timestamp(f"{t[:13]}:{t[14:16]}:{t[17:19]}.{t[20:29]}Z").value
+                         for t in stem.split("_"))
+        start, end = stem.split("-")
+        return int(start), int(end)
+    except ValueError:
+        return None  # unknown naming: always hashed
+
+
+def _ns(ts) -> Optional[int]:
+    if ts is None:
+        return None
+    ts = pd.Timestamp(ts)
+    return (ts.tz_localize("UTC") if ts.tz is None else ts).value
+
+
+@dataclass
+class VenueSpec:
+    name: str = "BINANCE"
+    oms_type: str = "NETTING"
+    account_type: str = "CASH"
+    book_type: str = "L1_MBP"
+    starting_balances: List[str] = field(default_factory=lambda: ["1000000 USDT"])
+    base_currency: Optional[str] = None
+
+
+@dataclass
+class SweepSpec:
+    data: DataSpec
+    strategy_path: str
+    config_path: str
+    base_config: Dict[str, Any]
+    venue: VenueSpec = field(default_factory=VenueSpec)
+    exec_algorithms: List[str] = field(default_factory=list)
+
+
+def param_grid(
+    grid: Dict[str, Iterable[Any]],
+    valid: Optional[Callable[[Dict[str, Any]], bool]] = None,
+) -> List[Dict[str, Any]]:
+    """Cartesian product of ``grid`` values, optionally filtered by ``valid``."""
+    keys = list(grid)
+    points = [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+    return [p for p in points if valid is None or valid(p)]
+
+
+# ── Single run ──────────────────────────────────────────────────── #
+
+def _number(value: Any) -> Any:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def summarize(engine: BacktestEngine, currency) -> Dict[str, Any]:
+    """Flat summary statistics of a finished engine run."""
+    analyzer = engine.portfolio.analyzer
+    stats: Dict[str, Any] = {}
+    for group in (
+        analyzer.get_performance_stats_pnls(currency),
+        analyzer.get_performance_stats_returns(),
+        analyzer.get_performance_stats_general(),
+    ):
+        stats.update({k: _number(v) for k, v in group.items()})
+    stats["orders"] = len(engine.cache.orders())
+    stats["positions"] = len(engine.cache.positions())
+    return stats
+
+
+Feed = Callable[[], Iterator[list]]
+
+WARM_ENGINES = 2  # warm engines kept per worker (one per data window), least recently used evicted
+
+
+def base_engine(spec: SweepSpec, instrument, data: Union[list, Feed]) -> BacktestEngine:
+    """An engine with the venue, instrument and data but no strategy yet.
+
+    ``data`` is a list, or a callable returning an iterator of time-ordered
+    chunks that is streamed with ``add_data_iterator``.
+    """
+    venue = spec.venue
+    engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+    engine.add_venue(
+        venue=Venue(venue.name),
+        oms_type=OmsType[venue.oms_type],
+        account_type=AccountType[venue.account_type],
+        book_type=BookType[venue.book_type],
+        starting_balances=[Money.from_str(b) for b in venue.starting_balances],
+        base_currency=Currency.from_str(venue.base_currency) if venue.base_currency else None,
+    )
+    engine.add_instrument(instrument)
+    if callable(data):
+        engine.add_data_iterator("data", data())
+    else:
+        engine.add_data(data, validate=False, sort=False)  # catalog queries are already ordered
+    return engine
+
+
+def add_strategy(engine: BacktestEngine, spec: SweepSpec, params: Dict[str, Any]) -> None:
+    """Add the spec's strategy configured with ``params`` (and its exec algorithms)."""
+    engine.add_strategy(StrategyFactory.create(ImportableStrategyConfig(
+        strategy_path=spec.strategy_path,
+        config_path=spec.config_path,
+        config={**spec.base_config, **params},
+    )))
+    for path in spec.exec_algorithms:
+        engine.add_exec_algorithm(resolve_path(path)())
+
+
+def build_engine(spec: SweepSpec, instrument, data: Union[list, Feed], params: Dict[str, Any]) -> BacktestEngine:
+    """A ready-to-run engine for one parameter point."""
+    engine = base_engine(spec, instrument, data)
+    add_strategy(engine, spec, params)
+    return engine
+
+
+def run_backtest(
+    spec: SweepSpec,
+    instrument,
+    data: Union[list, Feed],
+    params: Dict[str, Any],
+    extra: Optional[Callable[[BacktestEngine], Dict[str, Any]]] = None,
+    engine: Optional[BacktestEngine] = None,
+) -> Dict[str, Any]:
+    """Run one parameter point and return ``params`` merged with its statistics.
+
+    ``extra(engine)`` may add more fields (e.g. reports) before disposal.
+    A strategy-less ``engine`` from ``base_engine`` (already holding ``data``)
+    is used instead of building one, and is left to the caller, not disposed.
+    """
+    t0 = time.perf_counter()
+    owned = engine is None
+    if owned:
+        engine = build_engine(spec, instrument, data, params)
+    else:
+        add_strategy(engine, spec, params)
+    try:
+        engine.run()
+        row = {**params, **summarize(engine, instrument.quote_currency)}
+        if extra is not None:
+            row.update(extra(engine))
+    finally:
+        if owned:
+            engine.dispose()
+    row["elapsed"] = time.perf_counter() - t0
+    return row
+
+
+def engine_reports(engine: BacktestEngine) -> Dict[str, pd.DataFrame]:
+    """Fills and positions reports of a finished engine run."""
+    return {
+        "fills": engine.trader.generate_order_fills_report(),
+        "positions": engine.trader.generate_positions_report(),
+    }
+
+
+# ── Process pool ────────────────────────────────────────────────── #
+
+_WORKER: Dict[str, Any] = {}
+
+
+def init_worker(
+    spec: SweepSpec,
+    cache: Optional[str] = None,
+    shared: Optional[SharedHandle] = None,
+    warm: bool = False,
+) -> None:
+    """Pool initializer: load the sweep's market data once per process,
+    or attach to the parent's ``shared`` copy of it."""
+    for engine in (_WORKER.get("engines") or {}).values():  # re-initialized in-process
+        engine.dispose()
+    _WORKER["spec"] = spec
+    _WORKER["cache"] = ResultStore(cache) if cache else None
+    _WORKER["versions"] = {}
+    _WORKER["slices"] = {}
+    _WORKER["engines"] = OrderedDict() if warm else None
+    if shared is not None:
+        _WORKER["shared"] = attach(shared)
+        _WORKER["instrument"], _WORKER["data"] = spec.data.load_instrument(), None
+        _WORKER["ts"] = _WORKER["shared"]["ts_init"]
+        return
+    _WORKER["shared"] = None
+    _WORKER["instrument"], _WORKER["data"] = spec.data.load()
+    _WORKER["ts"] = np.fromiter((d.ts_init for d in _WORKER["data"]), dtype=np.uint64, count=len(_WORKER["data"]))
+
+
+def worker_slice(start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> Union[list, Feed]:
+    """The worker's data with ``start_ns <= ts_init < end_ns``, cached per window.
+
+    With shared data this is a feed over the shared columns instead of a list.
+    """
+    key = (start_ns, end_ns)
+    cached = _WORKER["slices"].get(key)
+    if cached is None:
+        ts = _WORKER["ts"]
+        lo = 0 if start_ns is None else int(np.searchsorted(ts, start_ns, side="left"))
+        hi = len(ts) if end_ns is None else int(np.searchsorted(ts, end_ns, side="left"))
+        shared = _WORKER["shared"]
+        if shared is not None:
+            bar_type = BarType.from_str(shared.handle.meta["bar_type"])
+            cached = partial(array_bar_feed, shared.arrays, bar_type, _WORKER["instrument"], lo, hi)
+        elif lo == 0 and hi == len(ts):
+            cached = _WORKER["data"]
+        else:
+            cached = _WORKER["data"][lo:hi]
+        _WORKER["slices"][key] = cached
+    return cached
+
+
+def warm_engine(window: Optional[Tuple[Optional[int], Optional[int]]], data: Union[list, Feed]) -> BacktestEngine:
+    """The worker's engine for ``window``, reset and without strategies, built on first use."""
+    engines = _WORKER["engines"]
+    engine = engines.pop(window, None)
+    if engine is None:
+        engine = base_engine(_WORKER["spec"], _WORKER["instrument"], data)
+    elif engine.run_started is not None:
+        engine.reset()  # keeps venue, instrument and data; iterators are consumed, so re-add them
+        engine.clear_strategies()
+        engine.clear_exec_algorithms()
+        if callable(data):
+            engine.add_data_iterator("data", data())
+    engines[window] = engine
+    while len(engines) > WARM_ENGINES:
+        engines.popitem(last=False)[1].dispose()
+    return engine
+
+
+def worker_backtest(
+    params: Dict[str, Any],
+    window: Optional[Tuple[Optional[int], Optional[int]]],
+    extra: Optional[Callable[[BacktestEngine], Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """``run_backtest`` on the worker's data, on a warm engine if the worker keeps them."""
+    data = worker_slice(*(window or (None, None)))
+    if _WORKER["engines"] is None:
+        return run_backtest(_WORKER["spec"], _WORKER["instrument"], data, params, extra)
+    engine = warm_engine(window, data)
+    try:
+        return run_backtest(_WORKER["spec"], _WORKER["instrument"], data, params, extra, engine=engine)
+    except Exception:
+        del _WORKER["engines"][window]  # state unknown after a failed run
+        engine.dispose()
+        raise
+
+
+def run_key(
+    spec: SweepSpec,
+    params: Dict[str, Any],
+    window: Optional[Tuple[Optional[int], Optional[int]]],
+    data_version: str,
+    extras: Sequence[str] = (),
+) -> str:
+    """Content hash identifying one backtest: what runs, on which data and window."""
+    key = {
+        "strategy": [spec.strategy_path, spec.config_path, spec.exec_algorithms],
+        "config": {**spec.base_config, **params},
+        "venue": asdict(spec.venue),
+        "data": [spec.data.instrument_id, spec.data.bar_types, spec.data.start, spec.data.end, data_version],
+        "window": list(window) if window else None,
+        "extras": list(extras),
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+
+def lookup_run(
+    cache: ResultStore,
+    spec: SweepSpec,
+    params: Dict[str, Any],
+    window: Optional[Tuple[Optional[int], Optional[int]]],
+    version: str,
+    extras: Sequence[str] = (),
+) -> Optional[Dict[str, Any]]:
+    """The cached row of a run (with ``cached=True``), or ``None``."""
+    try:
+        return {**cache.open(run_key(spec, params, window, version, extras)).to_dict(), "cached": True}
+    except ResultStoreError:
+        return None
+
+
+def point_extras(extra: Optional[Callable[[BacktestEngine], Dict[str, Any]]] = None, store: bool = False) -> List[str]:
+    """Cache-key names of what ``run_point`` adds to a run's statistics."""
+    names = [f"{extra.__module__}.{extra.__qualname__}"] if extra else []
+    return names + (["engine_reports"] if store else [])
+
+
+def store_row(row: Dict[str, Any], store: Optional[Tuple[str, str]]) -> Dict[str, Any]:
+    """Save ``row`` as run ``store=(root, run_id)`` and return it without its reports."""
+    if store is None:
+        return row
+    root, run_id = store
+    ResultStore(root).save(run_id, row)
+    row = {k: v for k, v in row.items() if not isinstance(v, pd.DataFrame)}
+    row["run_id"] = run_id
+    return row
+
+
+def cached_backtest(
+    params: Dict[str, Any],
+    window: Optional[Tuple[Optional[int], Optional[int]]] = None,
+    extra: Optional[Callable[[BacktestEngine], Dict[str, Any]]] = None,
+    extras: Sequence[str] = (),
+) -> Dict[str, Any]:
+    """``run_backtest`` on the worker's data, memoized in the worker's cache if any.
+
+    ``extras`` names what ``extra`` adds, so that it is part of the key.
+    A hit returns the stored row with ``cached=True``.
+    """
+    spec, cache = _WORKER["spec"], _WORKER.get("cache")
+    if cache is None:
+        return worker_backtest(params, window, extra)
+    version = _WORKER["versions"].get(window)
+    if version is None:
+        version = _WORKER["versions"][window] = spec.data.version(*(window or (None, None)))
+    hit = lookup_run(cache, spec, params, window, version, extras)
+    if hit is not None:
+        return hit
+    key = run_key(spec, params, window, version, extras)
+    row = worker_backtest(params, window, extra)
+    try:
+        cache.save(key, row)
+    except (OSError, TypeError, ResultStoreError) as exc:  # a cache miss next time, not a failed run
+        logger.warning("could not cache run %s: %s", key, exc)
+    return row
+
+
+def run_point(
+    params: Dict[str, Any],
+    window: Optional[Tuple[Optional[int], Optional[int]]] = None,
+    extra: Optional[Callable[[BacktestEngine], Dict[str, Any]]] = None,
+    store: Optional[Tuple[str, str]] = None,
+) -> Dict[str, Any]:
+    """Run one point on the worker's data (or a ``(start_ns, end_ns)`` slice of it).
+
+    ``store=(root, run_id)`` saves the row and the engine reports to a
+    ``ResultStore``; the returned row then only carries the ``run_id``.
+    """
+    try:
+        collect = extra
+        if store is not None:
+            def collect(engine):
+                return {**(extra(engine) if extra else {}), **engine_reports(engine)}
+        row = cached_backtest(params, window, collect, point_extras(extra, store is not None))
+        return store_row(row, store)
+    except Exception as exc:  # reported in the results table, the sweep goes on
+        return {**params, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def completed_runs(
+    spec: SweepSpec,
+    cache: Optional[str],
+    units: Sequence[Tuple[Dict[str, Any], Optional[Tuple[Optional[int], Optional[int]]]]],
+    extras: Sequence[str] = (),
+) -> Dict[int, Dict[str, Any]]:
+    """Cached rows of the ``(params, window)`` units that already ran, by unit index.
+
+    Used by the parent to resume: only the missing units are submitted.
+    """
+    if not cache:
+        return {}
+    store, versions, done = ResultStore(cache), {}, {}
+    for i, (params, window) in enumerate(units):
+        if window not in versions:
+            versions[window] = spec.data.version(*(window or (None, None)))
+        hit = lookup_run(store, spec, params, window, versions[window], extras)
+        if hit is not None:
+            done[i] = hit
+    return done
+
+
+def make_pool(
+    spec: SweepSpec,
+    workers: Optional[int],
+    tasks: int,
+    cache: Optional[str] = None,
+    shared: Optional[SharedHandle] = None,
+    warm: bool = False,
+) -> ProcessPoolExecutor:
+    """Spawn-based pool whose workers each hold the spec's data (and run cache),
+    or attach to ``shared``, and keep ``warm`` engines."""
+    workers = min(workers or os.cpu_count() or 1, tasks) or 1
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(spec, str(cache) if cache else None, shared, warm),
+    )
+
+
+def run_sweep(
+    spec: SweepSpec,
+    points: List[Dict[str, Any]],
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    store: Optional[str] = None,
+    cache: Optional[str] = None,
+    share: bool = False,
+    warm: bool = False,
+) -> pd.DataFrame:
+    """Run every point and return one row per point, in input order.
+
+    ``workers=0`` runs in-process; otherwise a spawn-based process pool is
+    used (each worker loads the data once, or with ``share`` attaches to one
+    shared copy). With ``store`` each point is also saved as run
+    ``point-<i>`` under that directory, and with ``cache`` runs are memoized
+    there and a rerun resumes from them. ``warm`` reuses engines between
+    points (see the module docstring).
+    """
+    rows: List[Optional[Dict[str, Any]]] = [None] * len(points)
+    target = (lambda i: (str(store), f"point-{i:05d}")) if store else (lambda i: None)
+    if workers != 0:
+        done = completed_runs(spec, cache, [(p, None) for p in points], point_extras(None, bool(store)))
+        if done:
+            logger.info("resuming: %d of %d points already done", len(done), len(points))
+        for i, row in sorted(done.items()):
+            rows[i] = store_row(row, target(i))
+            if on_result:
+                on_result(rows[i])
+    todo = [i for i, row in enumerate(rows) if row is None]
+    if workers == 0:  # the in-process cache already skips finished points
+        init_worker(spec, str(cache) if cache else None, warm=warm)
+        for i in todo:
+            rows[i] = run_point(points[i], store=target(i))
+            if on_result:
+                on_result(rows[i])
+    elif todo:
+        shared = spec.data.share() if share else None
+        try:
+            with make_pool(spec, workers, len(todo), cache, shared.handle if shared else None, warm) as pool:
+                futures = {pool.submit(run_point, points[i], store=target(i)): i for i in todo}
+                for fut in as_completed(futures):
+                    rows[futures[fut]] = fut.result()
+                    if on_result:
+                        on_result(rows[futures[fut]])
+        finally:
+            if shared is not None:
+                shared.close()
+    return pd.DataFrame(rows)
@@ -0,0 +1,237 @@
+# src/symbols.py
+"""Local cache of Binance ``exchangeInfo`` symbol metadata.
+
+The downloaders, the CSV uploader and the instrument provider all need to know
+which symbols exist, when they were listed/delisted and their tick/lot sizes.
+Instead of hitting ``exchangeInfo`` on every run we keep one JSON file per
+market under ``SYMBOL_CACHE_DIR`` and refresh it incrementally once the TTL
+(``SYMBOL_CACHE_TTL`` seconds) has expired.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+import urllib.error
+import urllib.request
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ── Settings ────────────────────────────────────────────────────── #
+EXCHANGE_INFO_URLS: Dict[str, str] = {
+    "spot": "https://api.binance.com/api/v3/exchangeInfo",
+    "um": "https://fapi.binance.com/fapi/v1/exchangeInfo",
+    "cm": "https://dapi.binance.com/dapi/v1/exchangeInfo",
+}
+KLINES_URLS: Dict[str, str] = {
+    "spot": "https://api.binance.com/api/v3/klines",
+    "um": "https://fapi.binance.com/fapi/v1/klines",
+    "cm": "https://dapi.binance.com/dapi/v1/klines",
+}
+# ClickHouse / Nautilus market names → data.binance.vision trading types
+MARKET_ALIASES: Dict[str, str] = {"usdm": "um", "coinm": "cm"}
+
+CACHE_DIR = Path(os.getenv("SYMBOL_CACHE_DIR", Path.home() / ".cache" / "algocoin" / "symbols"))
+CACHE_TTL = int(os.getenv("SYMBOL_CACHE_TTL", 24 * 3600))
+
+# Binance reports perpetual contracts with a far-future delivery date (2100-12-25)
+_PERPETUAL_DELIVERY_YEAR = 2100
+
+
+def normalize_market(market: str) -> str:
+    """Map ``usdm``/``coinm`` style market names to ``um``/``cm``."""
+    market = MARKET_ALIASES.get(market, market)
+    if market not in EXCHANGE_INFO_URLS:
+        raise ValueError(f"Unknown market: {market}")
+    return market
+
+
+def _fetch_json(url: str) -> Any:
+    with urllib.request.urlopen(url, timeout=30) as resp:
+        return json.loads(resp.read())
+
+
+def _ms_to_date(ms: Optional[int]) -> Optional[str]:
+    if not ms:
+        return None
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).date().isoformat()
+
+
+def _filter_value(filters: List[Dict[str, Any]], filter_type: str, key: str) -> Optional[str]:
+    for f in filters:
+        if f.get("filterType") == filter_type:
+            return f.get(key)
+    return None
+
+
+def parse_exchange_info(payload: Dict[str, Any], market: str) -> Dict[str, Dict[str, Any]]:
+    """Turn an ``exchangeInfo`` payload into ``{symbol: metadata}``."""
+    out: Dict[str, Dict[str, Any]] = {}
+    for s in payload.get("symbols", []):
+        filters = s.get("filters", [])
+        delivery = s.get("deliveryDate")
+        delisted = _ms_to_date(delivery)
+        if delisted and int(delisted[:4]) >= _PERPETUAL_DELIVERY_YEAR:
+            delisted = None
+        out[s["symbol"]] = {
+            "symbol": s["symbol"],
+            "market": market,
+            "status": s.get("status") or s.get("contractStatus"),
+            "base": s.get("baseAsset"),
+            "quote": s.get("quoteAsset"),
+            "tick_size": _filter_value(filters, "PRICE_FILTER", "tickSize"),
+            "lot_size": _filter_value(filters, "LOT_SIZE", "stepSize"),
+            "listed": _ms_to_date(s.get("onboardDate")),
+            "delisted": delisted,
+        }
+    return out
+
+
+# ── Cache ───────────────────────────────────────────────────────── #
+
+class SymbolCache:
+    """Per-market symbol metadata persisted as JSON and refreshed on a TTL."""
+
+    def __init__(
+        self,
+        market: str,
+        cache_dir: Optional[Path] = None,
+        ttl: Optional[int] = None,
+        fetch: Callable[[str], Any] = _fetch_json,
+    ):
+        self.market = normalize_market(market)
+        self.path = Path(cache_dir or CACHE_DIR) / f"{self.market}.json"
+        self.ttl = CACHE_TTL if ttl is None else ttl
+        self._fetch = fetch
+        self._data: Optional[Dict[str, Any]] = None
+
+    # ── persistence ── #
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"updated": 0, "symbols": {}}
+
+    def _write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._data, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = self._read()
+            if time.time() - self._data["updated"] > self.ttl:
+                self.refresh()
+        return self._data
+
+    def is_stale(self) -> bool:
+        return time.time() - self.data["updated"] > self.ttl
+
+    def refresh(self) -> None:
+        """Merge a fresh ``exchangeInfo`` snapshot into the cache.
+
+        Existing entries keep their listing dates; symbols that disappeared
+        from the exchange are kept and marked delisted as of today.
+        """
+        if self._data is None:
+            self._data = self._read()
+        try:
+            fresh = parse_exchange_info(self._fetch(EXCHANGE_INFO_URLS[self.market]), self.market)
+        except (urllib.error.URLError, OSError, ValueError) as exc:
+            if not self._data["symbols"]:
+                raise ConnectionError(f"Failed to fetch exchangeInfo for {self.market}: {exc}") from exc
+            logger.warning("exchangeInfo refresh failed for %s, using stale cache: %s", self.market, exc)
+            return
+
+        symbols = self._data["symbols"]
+        today = date.today().isoformat()
+        for name, info in fresh.items():
+            old = symbols.get(name, {})
+            info["listed"] = info["listed"] or old.get("listed")
+            if old.get("listed_probe"):
+                info["listed_probe"] = old["listed_probe"]
+            symbols[name] = info
+        for name, info in symbols.items():
+            if name not in fresh and info.get("status") != "DELISTED":
+                info["status"] = "DELISTED"
+                info["delisted"] = info.get("delisted") or today
+        self._data["updated"] = time.time()
+        self._write()
+
+    # ── lookups ── #
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        return self.data["symbols"].get(symbol.upper())
+
+    def symbols(self, status: Optional[str] = None) -> List[str]:
+        """Return cached symbol names, optionally filtered by status."""
+        return sorted(
+            name for name, info in self.data["symbols"].items()
+            if status is None or info.get("status") == status
+        )
+
+    def _probe_listing(self, symbol: str) -> Optional[str]:
+        """Find the first daily kline of ``symbol`` (spot has no ``onboardDate``)."""
+        url = f"{KLINES_URLS[self.market]}?symbol={symbol}&interval=1d&startTime=0&limit=1"
+        try:
+            rows = self._fetch(url)
+        except (urllib.error.URLError, OSError, ValueError) as exc:
+            logger.warning("Listing probe failed for %s: %s", symbol, exc)
+            return None
+        return _ms_to_date(rows[0][0]) if rows else None
+
+    def listing_bounds(self, symbol: str) -> Tuple[Optional[date], Optional[date]]:
+        """Return ``(listed, delisted)`` dates; unknown bounds are ``None``.
+
+        A probe that finds nothing (or fails) is remembered in ``listed_probe``
+        and not retried until the TTL has passed.
+        """
+        info = self.get(symbol)
+        if info is None:
+            return None, None
+        probed = info.get("listed_probe") or 0
+        if info.get("listed") is None and time.time() - probed > self.ttl:
+            listed = self._probe_listing(info["symbol"])
+            if listed:
+                info["listed"] = listed
+                info.pop("listed_probe", None)
+            else:
+                info["listed_probe"] = time.time()
+            self._write()
+        listed, delisted = info.get("listed"), info.get("delisted")
+        return (
+            date.fromisoformat(listed) if listed else None,
+            date.fromisoformat(delisted) if delisted else None,
+        )
+
+    def is_listed(self, symbol: str, day: date, period: str = "daily") -> bool:
+        """Whether ``symbol`` traded on ``day`` (or during its month for ``monthly``)."""
+        listed, delisted = self.listing_bounds(symbol)
+        first, last = day, day
+        if period == "monthly":
+            first = day.replace(day=1)
+            nxt = first.replace(year=first.year + first.month // 12, month=first.month % 12 + 1)
+            last = date.fromordinal(nxt.toordinal() - 1)
+        if listed and last < listed:
+            return False
+        if delisted and first > delisted:
+            return False
+        return True
+
+
+_CACHES: Dict[str, SymbolCache] = {}
+
+
+def get_cache(market: str) -> SymbolCache:
+    """Return the process-wide cache for ``market``."""
+    market = normalize_market(market)
+    if market not in _CACHES:
+        _CACHES[market] = SymbolCache(market)
+    return _CACHES[market]
@@ -0,0 +1,185 @@
+# src/sync.py
+"""Declarative bulk sync of data.binance.vision datasets.
+
+A job file lists download specs (market, data type, symbols, intervals,
+period, date range). ``start`` may be relative to today, see ``_parse_date``.
+All specs are expanded into one deduplicated set of file tasks and pushed
+through a single download → verify pipeline. With ``extract`` set, verified
+zips are also unpacked to CSVs under ``<extract>/data/...`` (the layout
+``bin/upload_csv.py`` reads). Completed files are appended to a JSON-lines
+state log, so an interrupted or nightly re-run only fetches what is new.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import tomllib
+import urllib.error
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from src import ingest
+from src.checksum import ChecksumIndex
+from src.pipeline import Pipeline, Stage
+
+logger = logging.getLogger(__name__)
+
+SPEC_DEFAULTS: Dict[str, Any] = {
+    "data_type": "klines",
+    "period": "monthly",
+    "intervals": [None],
+    "end": None,
+}
+
+
+def _parse_date(value: Any) -> date:
+    """``YYYY-MM[-DD]``, or relative to today: ``"month"`` (its first day) or ``"-<n>d"``."""
+    if isinstance(value, date):
+        return value
+    value = str(value).strip()
+    today = date.today()
+    if value == "month":
+        return today.replace(day=1)
+    if value.startswith("-") and value.endswith("d"):
+        return today - timedelta(days=int(value[1:-1]))
+    parts = [int(p) for p in str(value).split("-")]
+    return date(parts[0], parts[1], parts[2] if len(parts) > 2 else 1)
+
+
+def load_job(path: Path) -> Dict[str, Any]:
+    """Read a TOML (or YAML, when PyYAML is installed) job file."""
+    path = Path(path)
+    if path.suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as exc:
+            raise RuntimeError("YAML job files need PyYAML (pip install pyyaml)") from exc
+        with open(path) as f:
+            job = yaml.safe_load(f)
+    else:
+        with open(path, "rb") as f:
+            job = tomllib.load(f)
+    if not job.get("spec"):
+        raise ValueError(f"{path}: no [[spec]] entries")
+    for spec in job["spec"]:
+        for key in ("market", "symbols", "start"):
+            if key not in spec:
+                raise ValueError(f"{path}: spec {spec} is missing '{key}'")
+    return job
+
+
+def expand(specs: List[Dict[str, Any]], dest: Path) -> List[Dict[str, Any]]:
+    """Turn specs into file tasks, dropping files requested by more than one spec."""
+    seen: Set[str] = set()
+    tasks = []
+    for raw in specs:
+        spec = {**SPEC_DEFAULTS, **raw}
+        intervals = spec["intervals"] if spec["data_type"] in ingest.KLINE_TYPES else [None]
+        end = _parse_date(spec["end"]) if spec["end"] else date.today()
+        for task in ingest.plan_files(
+            spec["market"], spec["data_type"], spec["symbols"], spec["period"],
+            _parse_date(spec["start"]), end, intervals=intervals, dest=dest,
+        ):
+            if task["url"] not in seen:
+                seen.add(task["url"])
+                tasks.append(task)
+    return tasks
+
+
+class SyncState:
+    """Append-only log of completed URLs."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.done: Set[str] = set()
+        if self.path.exists():
+            with open(self.path) as f:
+                self.done = {json.loads(line)["url"] for line in f if line.strip()}
+
+    def pending(self, tasks: List[Dict[str, Any]], extract: Optional[Path] = None) -> List[Dict[str, Any]]:
+        """Tasks not yet completed (or whose file, or extracted CSV, has since disappeared)."""
+        return [
+            t for t in tasks
+            if t["url"] not in self.done or not Path(t["path"]).exists()
+            or (extract is not None and not csv_path(t, extract).exists())
+        ]
+
+    def mark(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps({"url": task["url"], "path": task["path"], "at": time.time()}) + "\n")
+            self.done.add(task["url"])
+        return task
+
+
+def csv_path(task: Dict[str, Any], root: Path) -> Path:
+    """Where ``extract_csv`` puts the CSV of ``task``'s zip."""
+    base = ingest.get_path(task["market"], task["data_type"], task["period"], task["symbol"], task["interval"])
+    return Path(root) / base / Path(task["path"]).with_suffix(".csv").name
+
+
+def extract_csv(task: Dict[str, Any], root: Path) -> Dict[str, Any]:
+    """Unpack the task's zip to ``csv_path`` (atomically, skipped when already there)."""
+    target = csv_path(task, root)
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".part")
+        with zipfile.ZipFile(task["path"]) as zf, zf.open(zf.namelist()[0]) as src, open(tmp, "wb") as out:
+            while buf := src.read(1 << 20):
+                out.write(buf)
+        os.replace(tmp, target)
+    return task
+
+
+def _content_length(url: str) -> Optional[int]:
+    req = urllib.request.Request(url, method="HEAD")
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return int(resp.headers.get("Content-Length", 0))
+    except urllib.error.HTTPError:
+        return None
+
+
+def estimate(tasks: List[Dict[str, Any]], workers: int = 16) -> Dict[str, int]:
+    """HEAD every pending file and sum the sizes (dry run)."""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        sizes = list(pool.map(lambda t: _content_length(t["url"]), tasks))
+    return {
+        "files": sum(s is not None for s in sizes),
+        "missing": sum(s is None for s in sizes),
+        "bytes": sum(s or 0 for s in sizes),
+    }
+
+
+def run(
+    tasks: List[Dict[str, Any]],
+    state: SyncState,
+    workers: int = 16,
+    verify_workers: int = 2,
+    checksum: bool = True,
+    index: Optional[ChecksumIndex] = None,
+    extract: Optional[Path] = None,
+) -> Pipeline:
+    """Download and verify ``tasks`` on one shared pipeline, recording progress.
+
+    With ``extract`` every verified zip is also unpacked by ``extract_csv``.
+    """
+    index = index or ChecksumIndex()
+    stages = [
+        Stage("download", lambda t: ingest.download(t, checksum=checksum), workers=workers),
+        Stage("verify", lambda t: ingest.verify(t, index), workers=verify_workers),
+    ]
+    if extract is not None:
+        stages.append(Stage("extract", lambda t: extract_csv(t, extract), workers=verify_workers))
+    pipeline = Pipeline(stages + [Stage("record", state.mark)])
+    pipeline.run(tasks)
+    return pipeline
@@ -0,0 +1,288 @@
+# src/synthetic.py
+"""Seedable synthetic Binance market data for stress tests and benchmarks.
+
+Prices follow a ``PriceModel``: GBM, optionally with Poisson jumps (Merton
+jump-diffusion) and Markov switching between (drift, volatility) regimes.
+Everything is drawn with NumPy in whole-day chunks. One ``seed`` fixes every
+row, whatever the chunking.
+
+* ``kline_days`` yields klines frames in the ``KLINES_COLUMNS`` layout of the
+  data.binance.vision files. Bar highs and lows are exact Brownian-bridge
+  extremes. Volume rises with the size of the move, and the taker-buy share
+  leans with its direction.
+* ``agg_trade_days`` yields aggTrades frames (``AGG_TRADES_COLUMNS``) with
+  Poisson arrivals, log-normal sizes and aggressor sides that follow price.
+
+The writers turn the chunks into Binance zips with ``.CHECKSUM`` sidecars
+(``write_binance``), so the ingest pipeline can read them back. They can also
+produce Parquet (``write_klines_parquet``, or ``TradeStore.write_day``) or
+Nautilus objects (``kline_bars``, ``ticks_from_frame``).
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import itertools
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from src.bars import bars_from_arrays
+from src.ingest import AGG_TRADES_COLUMNS, KLINES_COLUMNS, file_name, get_path
+
+DAY_MS = 86_400_000
+YEAR_MS = 365 * DAY_MS
+INTERVAL_MS = {
+    "1s": 1_000, "1m": 60_000, "3m": 180_000, "5m": 300_000, "15m": 900_000, "30m": 1_800_000,
+    "1h": 3_600_000, "2h": 7_200_000, "4h": 14_400_000, "6h": 21_600_000, "8h": 28_800_000,
+    "12h": 43_200_000, "1d": DAY_MS,
+}
+
+Day = Union[date, datetime, str]
+
+
+@dataclass(frozen=True)
+class PriceModel:
+    """Log-price dynamics with annualized parameters.
+
+    ``regimes`` of ``(mu, sigma)`` pairs replace ``mu``/``sigma``. The chain
+    leaves its regime after ``regime_days`` on average, for a uniformly chosen
+    other regime.
+    """
+    mu: float = 0.0
+    sigma: float = 0.6
+    jump_rate: float = 0.0  # jumps per year
+    jump_mean: float = 0.0  # mean log jump size
+    jump_std: float = 0.05
+    regimes: Tuple[Tuple[float, float], ...] = ()
+    regime_days: float = 30.0
+
+    def log_returns(self, rng: np.random.Generator, dt: np.ndarray, regime: int = 0) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Log returns over steps of ``dt`` years, the per-step volatility and the last regime."""
+        n = len(dt)
+        if self.regimes:
+            k = len(self.regimes)
+            switch = rng.random(n) < dt * 365.0 / self.regime_days
+            steps = np.where(switch, rng.integers(1, k, n) if k > 1 else 0, 0)
+            state = (regime + np.cumsum(steps)) % k
+            mu, sigma = np.asarray(self.regimes, dtype=np.float64)[state].T
+            regime = int(state[-1]) if n else regime
+        else:
+            mu, sigma = self.mu, self.sigma
+        vol = sigma * np.sqrt(dt)
+        r = (mu - 0.5 * sigma ** 2) * dt + vol * rng.standard_normal(n)
+        if self.jump_rate > 0:
+            jumps = rng.poisson(self.jump_rate * dt)
+            hit = jumps > 0
+            r[hit] += self.jump_mean * jumps[hit] + self.jump_std * np.sqrt(jumps[hit]) * rng.standard_normal(hit.sum())
+        return r, np.broadcast_to(vol, (n,)), regime
+
+
+MODELS = {
+    "gbm": PriceModel(),
+    "jump": PriceModel(sigma=0.5, jump_rate=25.0, jump_mean=-0.005, jump_std=0.03),
+    "regime": PriceModel(regimes=((0.8, 0.45), (-1.0, 1.1), (0.0, 0.25)), regime_days=45.0),
+}
+
+
+def _day(value: Day) -> date:
+    return value if type(value) is date else pd.Timestamp(value).date()
+
+
+def _days(start: Day, end: Day) -> Iterator[Tuple[date, int]]:
+    day, last = _day(start), _day(end)
+    while day <= last:
+        yield day, int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp() * 1000)
+        day += timedelta(days=1)
+
+
+# ── Klines ──────────────────────────────────────────────────────── #
+
+def kline_days(
+    start: Day,
+    end: Day,
+    interval: str = "1m",
+    model: PriceModel = MODELS["gbm"],
+    seed: int = 0,
+    price: float = 40_000.0,
+    daily_volume: float = 20_000.0,
+    price_precision: int = 2,
+) -> Iterator[Tuple[date, pd.DataFrame]]:
+    """``(day, klines)`` for every UTC day in ``[start, end]``, continuing one price path."""
+    step = INTERVAL_MS[interval]
+    if DAY_MS % step:
+        raise ValueError(f"interval {interval} does not divide a day")
+    n = DAY_MS // step
+    rng = np.random.default_rng(seed)
+    dt = np.full(n, step / YEAR_MS)
+    regime = 0
+    offsets = np.arange(n, dtype=np.int64) * step
+    for day, t0 in _days(start, end):
+        r, vol, regime = model.log_returns(rng, dt, regime)
+        path = np.log(price) + np.cumsum(r)
+        opens = np.exp(np.r_[np.log(price), path[:-1]])
+        close = np.exp(path)
+        price = close[-1]
+        # extremes of a Brownian bridge from 0 to r with variance vol²
+        var = vol ** 2
+        up = 0.5 * (r + np.sqrt(r ** 2 - 2.0 * var * np.log(rng.random(n))))
+        down = 0.5 * (r - np.sqrt(r ** 2 - 2.0 * var * np.log(rng.random(n))))
+        o, c = np.round(opens, price_precision), np.round(close, price_precision)
+        high = np.maximum(np.round(opens * np.exp(up), price_precision), np.maximum(o, c))
+        low = np.minimum(np.round(opens * np.exp(down), price_precision), np.minimum(o, c))
+        z = np.abs(r) / np.maximum(vol, 1e-12)
+        volume = np.round(daily_volume / n * rng.lognormal(-0.125, 0.5, n) * (1.0 + z) / 1.8, 8)
+        vwap = (high + low + c) / 3.0
+        buy_share = np.clip(rng.beta(8.0, 8.0, n) + 0.15 * np.tanh(r / np.maximum(vol, 1e-12)), 0.0, 1.0)
+        taker_base = np.round(volume * buy_share, 8)
+        open_time = t0 + offsets
+        yield day, pd.DataFrame({
+            "open_time": open_time,
+            "open": o,
+            "high": high,
+            "low": low,
+            "close": c,
+            "volume": volume,
+            "close_time": open_time + (step - 1),
+            "quote_vol": np.round(volume * vwap, 8),
+            "trades": (1 + rng.poisson(volume / 0.02 + 1.0)).astype(np.uint32),
+            "taker_base": taker_base,
+            "taker_quote": np.round(taker_base * vwap, 8),
+            "ignore": 0,
+        }, columns=KLINES_COLUMNS)
+
+
+def kline_bars(df: pd.DataFrame, bar_type, instrument, ts_init_delta: int = 0) -> list:
+    """Nautilus bars of a klines frame, stamped with ``open_time`` like ``export_bars``."""
+    return bars_from_arrays(
+        bar_type, instrument, df["open_time"].to_numpy() * 1_000_000,
+        df["open"].to_numpy(), df["high"].to_numpy(), df["low"].to_numpy(), df["close"].to_numpy(),
+        df["volume"].to_numpy(), ts_init_delta=ts_init_delta,
+    )
+
+
+# ── Aggregate trades ────────────────────────────────────────────── #
+
+def agg_trade_days(
+    start: Day,
+    end: Day,
+    model: PriceModel = MODELS["gbm"],
+    seed: int = 0,
+    price: float = 40_000.0,
+    trades_per_day: float = 500_000.0,
+    mean_qty: float = 0.02,
+    price_precision: int = 2,
+    size_precision: int = 5,
+) -> Iterator[Tuple[date, pd.DataFrame]]:
+    """``(day, aggTrades)`` for every UTC day in ``[start, end]`` (``ts`` in ms)."""
+    rng = np.random.default_rng(seed)
+    regime, agg_id, trade_id = 0, 1, 1
+    min_qty = 10.0 ** -size_precision
+    for day, t0 in _days(start, end):
+        n = int(rng.poisson(trades_per_day))
+        ts = t0 + np.sort(rng.integers(0, DAY_MS, n))
+        dt = np.diff(ts, prepend=t0) / YEAR_MS
+        r, vol, regime = model.log_returns(rng, dt, regime)
+        px = price * np.exp(np.cumsum(r))
+        if n:
+            price = px[-1]
+        qty = np.maximum(np.round(rng.lognormal(np.log(mean_qty) - 0.5, 1.0, n), size_precision), min_qty)
+        fills = 1 + rng.poisson(0.5, n)
+        last_id = trade_id + np.cumsum(fills) - 1
+        first_id = last_id - fills + 1
+        seller = rng.random(n) < 0.5 - 0.4 * np.tanh(r / np.maximum(vol, 1e-12))
+        yield day, pd.DataFrame({
+            "agg_id": np.arange(agg_id, agg_id + n, dtype=np.int64),
+            "price": np.round(px, price_precision),
+            "qty": qty,
+            "first_id": first_id,
+            "last_id": last_id,
+            "ts": ts,
+            "is_buyer_maker": seller,
+            "is_best_match": True,
+        }, columns=AGG_TRADES_COLUMNS)
+        agg_id += n
+        trade_id += int(fills.sum())
+
+
+# ── Writers ─────────────────────────────────────────────────────── #
+
+def _csv_bytes(df: pd.DataFrame, header: bool) -> bytes:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_boolean(field.type):  # Binance writes Python-style booleans
+            values = table.column(i).to_numpy(zero_copy_only=False)
+            table = table.set_column(i, field.name, pa.array(np.where(values, "True", "False")))
+    buf = io.BytesIO()
+    pacsv.write_csv(table, buf, pacsv.WriteOptions(include_header=header))
+    return buf.getvalue()
+
+
+def _write_zip(path: Path, df: pd.DataFrame, header: bool) -> Path:
+    data = _csv_bytes(df, header)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zf.writestr(path.stem + ".csv", data)
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    path.with_name(path.name + ".CHECKSUM").write_text(f"{digest}  {path.name}\n")
+    return path
+
+
+def write_binance(
+    days: Iterable[Tuple[date, pd.DataFrame]],
+    root: Union[str, Path],
+    market: str,
+    data_type: str,
+    symbol: str,
+    interval: Optional[str] = None,
+    period: str = "daily",
+    workers: int = 4,
+) -> List[Path]:
+    """Write day chunks as data.binance.vision zips (``period`` daily or monthly)
+    with ``.CHECKSUM`` sidecars under ``root``; returns the zip paths.
+
+    Spot CSVs have no header and futures CSVs have one, as on the real site.
+    CSV encoding and compression run on ``workers`` threads while the next
+    chunks are generated.
+    """
+    stamp = (lambda d: d.isoformat()) if period == "daily" else (lambda d: d.strftime("%Y-%m"))
+    directory = Path(root) / get_path(market, data_type, period, symbol, interval)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: List[Path] = []
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        pending: deque = deque()
+        for key, group in itertools.groupby(days, key=lambda item: stamp(item[0])):
+            df = pd.concat([frame for _, frame in group], ignore_index=True)
+            path = directory / file_name(data_type, symbol, interval, key)
+            pending.append(pool.submit(_write_zip, path, df, market != "spot"))
+            if len(pending) > 2 * workers:
+                paths.append(pending.popleft().result())
+        paths.extend(f.result() for f in pending)
+    return paths
+
+
+def write_klines_parquet(days: Iterable[Tuple[date, pd.DataFrame]], path: Union[str, Path]) -> int:
+    """Write klines day chunks to one Parquet file (a row group per day); returns the row count."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer, rows = None, 0
+    try:
+        for _, df in days:
+            table = pa.Table.from_pandas(df.drop(columns="ignore"), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression="zstd")
+            writer.write_table(table)
+            rows += len(df)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
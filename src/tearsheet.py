@@ -0,0 +1,232 @@
+# src/tearsheet.py
+"""Vectorized performance metrics over fills and positions reports.
+
+The inputs are the ``generate_order_fills_report()`` and
+``generate_positions_report()`` frames of many runs, concatenated with a
+``run_id`` column. ``ResultStore.scan`` returns exactly this for stored
+sweeps (``store_reports``). Every metric is a ``groupby`` over
+``run_id`` or a column operation on a (day × run) matrix, so one call
+produces the tearsheets of hundreds of runs. There is no per-run Python
+loop.
+
+Equity is realized equity: starting ``capital`` plus cumulative realized
+PnL at each position close. Returns are daily and Sharpe/Sortino are
+annualized with ``periods`` (365 for crypto).
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+DAY_NS = 86_400_000_000_000
+HOUR_NS = 3_600_000_000_000
+MONEY = re.compile(r"(-?\d+(?:\.\d+)?),?\s+[A-Z]")  # "1.5 USDT", "Money(1.5, USDT)", JSON lists of either
+
+POSITION_COLUMNS = ["ts_opened", "ts_closed", "duration_ns", "realized_pnl", "realized_return", "commissions"]
+FILL_COLUMNS = ["side", "filled_qty", "avg_px", "commissions", "ts_last"]
+
+Capital = Union[float, pd.Series]
+
+
+# ── Inputs ──────────────────────────────────────────────────────── #
+
+def money(values: pd.Series) -> np.ndarray:
+    """Summed amounts of Money cells, whether objects, strings or (JSON) lists of them
+    (each distinct cell is parsed once)."""
+    codes, cells = pd.factorize(values.astype(str), use_na_sentinel=False)
+    amounts = np.array([sum(map(float, MONEY.findall(c))) for c in cells], dtype=np.float64)
+    return amounts[codes]
+
+
+def _ns(values: pd.Series) -> np.ndarray:
+    if pd.api.types.is_integer_dtype(values.dtype):
+        return values.to_numpy(dtype=np.int64)
+    return pd.DatetimeIndex(pd.to_datetime(values, utc=True)).as_unit("ns").asi8
+
+
+def concat_reports(reports: Dict[str, Dict[str, pd.DataFrame]], name: str) -> pd.DataFrame:
+    """One report (``fills`` or ``positions``) of many runs, tagged with ``run_id``."""
+    frames = [df.assign(run_id=run_id) for run_id, r in reports.items() if (df := r.get(name)) is not None and len(df)]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["run_id"])
+
+
+def store_reports(store, runs: Optional[Sequence[str]] = None) -> Dict[str, pd.DataFrame]:
+    """The ``positions`` and ``fills`` reports of a ``ResultStore`` as two frames
+    (only the columns needed here, read from Parquet in one scan each)."""
+    import pyarrow.dataset as ds
+
+    flt = ds.field("run_id").isin(list(runs)) if runs is not None else None
+    return {
+        "positions": store.scan("positions", POSITION_COLUMNS, flt).to_pandas(),
+        "fills": store.scan("fills", FILL_COLUMNS, flt).to_pandas(),
+    }
+
+
+def closed_positions(positions: pd.DataFrame) -> pd.DataFrame:
+    """Numeric view of closed positions, ordered by run and close time."""
+    p = positions[positions["ts_closed"].notna()]
+    out = pd.DataFrame({
+        "run_id": p["run_id"].to_numpy(),
+        "opened": _ns(p["ts_opened"]),
+        "closed": _ns(p["ts_closed"]),
+        "duration_ns": p["duration_ns"].to_numpy(dtype=np.int64),
+        "pnl": money(p["realized_pnl"]),
+        "ret": p["realized_return"].to_numpy(dtype=np.float64),
+        "commission": money(p["commissions"]),
+    })
+    return out.sort_values(["run_id", "closed"], kind="stable").reset_index(drop=True)
+
+
+def filled_orders(fills: pd.DataFrame) -> pd.DataFrame:
+    """Numeric view of filled orders: signed quantity, price, notional and fees."""
+    qty = pd.to_numeric(fills["filled_qty"].astype(str), errors="coerce").to_numpy()
+    px = fills["avg_px"].to_numpy(dtype=np.float64)
+    return pd.DataFrame({
+        "run_id": fills["run_id"].to_numpy(),
+        "ts": _ns(fills["ts_last"]),
+        "qty": np.where(fills["side"].astype(str).to_numpy() == "SELL", -qty, qty),
+        "notional": qty * px,
+        "commission": money(fills["commissions"]),
+    })
+
+
+def run_capital(capital: Capital, runs: pd.Index) -> pd.Series:
+    """Starting capital of each of ``runs`` from a scalar or a Series by ``run_id``."""
+    if isinstance(capital, pd.Series):
+        return capital.reindex(runs).astype(float)
+    return pd.Series(float(capital), index=runs)
+
+
+# ── Metrics ─────────────────────────────────────────────────────── #
+
+def trade_stats(p: pd.DataFrame) -> pd.DataFrame:
+    """Per-run trade statistics of ``closed_positions`` output."""
+    run = p["run_id"]
+    pnl = p["pnl"]
+    g = pnl.groupby(run)
+    gross_win = pnl.clip(lower=0).groupby(run).sum()
+    gross_loss = -pnl.clip(upper=0).groupby(run).sum()
+    avg_win = pnl.where(pnl > 0).groupby(run).mean()
+    avg_loss = pnl.where(pnl < 0).groupby(run).mean()
+    return pd.DataFrame({
+        "trades": g.size(),
+        "pnl": g.sum(),
+        "win_rate": (pnl > 0).groupby(run).mean(),
+        "avg_win": avg_win,
+        "avg_loss": avg_loss,
+        "payoff_ratio": avg_win / -avg_loss,
+        "profit_factor": gross_win / gross_loss.replace(0.0, np.nan),
+        "expectancy": g.mean(),
+        "largest_win": g.max(),
+        "largest_loss": g.min(),
+        "avg_return": p["ret"].groupby(run).mean(),
+        "avg_hold_hours": p["duration_ns"].groupby(run).mean() / HOUR_NS,
+        "commissions": p["commission"].groupby(run).sum(),
+    })
+
+
+def equity_curves(p: pd.DataFrame, capital: Capital) -> pd.DataFrame:
+    """Realized equity, running peak and drawdown at every position close (long format)."""
+    run = p["run_id"]
+    cap = run_capital(capital, pd.Index(run.unique())).reindex(run).to_numpy()
+    equity = cap + p["pnl"].groupby(run).cumsum().to_numpy()
+    peak = np.maximum(pd.Series(equity).groupby(run.to_numpy()).cummax().to_numpy(), cap)
+    drawdown = peak - equity
+    # time since the previous peak, for closes in a drawdown or recovering from one
+    at_peak = pd.Series(np.where(equity >= peak, p["closed"], np.nan)).groupby(run.to_numpy())
+    first_open = pd.Series(p["opened"].groupby(run).transform("min").to_numpy())
+    since = at_peak.shift(1).groupby(run.to_numpy()).ffill().fillna(first_open).to_numpy()
+    was_under = pd.Series(drawdown).groupby(run.to_numpy()).shift(1, fill_value=0.0).to_numpy() > 0
+    underwater = np.where((drawdown > 0) | was_under, p["closed"].to_numpy() - since, 0)
+    return pd.DataFrame({
+        "run_id": run.to_numpy(),
+        "ts": pd.to_datetime(p["closed"].to_numpy(), utc=True),
+        "equity": equity,
+        "peak": peak,
+        "drawdown": drawdown,
+        "drawdown_pct": drawdown / peak,
+        "underwater_days": underwater / DAY_NS,
+    })
+
+
+def daily_returns(p: pd.DataFrame, capital: Capital) -> pd.DataFrame:
+    """(day × run) realized daily returns; NaN outside a run's first open .. last close."""
+    day = p["closed"] // DAY_NS
+    pnl = p.assign(day=day).pivot_table(index="day", columns="run_id", values="pnl", aggfunc="sum")
+    days = np.arange(min(p["opened"].min() // DAY_NS, day.min()), day.max() + 1)
+    pnl = pnl.reindex(days)
+    first = (p["opened"].groupby(p["run_id"]).min() // DAY_NS).reindex(pnl.columns).to_numpy()
+    last = day.groupby(p["run_id"]).max().reindex(pnl.columns).to_numpy()
+    live = (days[:, None] >= first[None, :]) & (days[:, None] <= last[None, :])
+    values = np.where(live, np.nan_to_num(pnl.to_numpy()), np.nan)
+    cap = run_capital(capital, pnl.columns).to_numpy()
+    before = cap[None, :] + np.nancumsum(values, axis=0) - np.nan_to_num(values)
+    out = pd.DataFrame(values / before, index=pd.to_datetime(days * DAY_NS, utc=True), columns=pnl.columns)
+    out.index.name = "day"
+    return out
+
+
+def return_ratios(returns: pd.DataFrame, periods: int = 365) -> pd.DataFrame:
+    """Annualized Sharpe, Sortino and volatility per column of ``daily_returns``."""
+    r = returns.to_numpy()
+    n = np.sum(~np.isnan(r), axis=0)
+    mean = np.nanmean(r, axis=0) if r.size else np.full(r.shape[1], np.nan)
+    std = np.nanstd(r, axis=0, ddof=1) if r.size else mean
+    downside = np.sqrt(np.nanmean(np.minimum(r, 0.0) ** 2, axis=0)) if r.size else mean
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return pd.DataFrame({
+            "days": n,
+            "volatility": std * np.sqrt(periods),
+            "sharpe": np.where(std > 0, mean / std * np.sqrt(periods), np.nan),
+            "sortino": np.where(downside > 0, mean / downside * np.sqrt(periods), np.nan),
+        }, index=returns.columns)
+
+
+def fill_stats(f: pd.DataFrame, capital: Capital) -> pd.DataFrame:
+    """Per-run order count, traded notional, turnover (notional / capital) and fees."""
+    g = f.groupby("run_id")
+    notional = g["notional"].sum()
+    return pd.DataFrame({
+        "orders": g.size(),
+        "notional": notional,
+        "turnover": notional / run_capital(capital, notional.index),
+        "fill_commissions": g["commission"].sum(),
+    })
+
+
+def tearsheets(
+    positions: pd.DataFrame,
+    fills: Optional[pd.DataFrame] = None,
+    capital: Capital = 1_000_000.0,
+    periods: int = 365,
+) -> pd.DataFrame:
+    """One row of metrics per ``run_id`` from concatenated positions (and fills) reports.
+
+    ``capital`` is the starting quote balance, a scalar or a Series by ``run_id``.
+    """
+    p = closed_positions(positions)
+    if p.empty:
+        return pd.DataFrame(index=pd.Index([], name="run_id"))
+    curves = equity_curves(p, capital)
+    g = curves.groupby("run_id")
+    first_open = p.groupby("run_id")["opened"].min()
+    span = p.groupby("run_id")["closed"].max() - first_open
+    parts = [
+        trade_stats(p),
+        pd.DataFrame({
+            "return_pct": (g["equity"].last() / run_capital(capital, g.size().index) - 1) * 100,
+            "max_drawdown": g["drawdown"].max(),
+            "max_drawdown_pct": g["drawdown_pct"].max() * 100,
+            "max_underwater_days": g["underwater_days"].max(),
+            "exposure": p.groupby("run_id")["duration_ns"].sum() / span.replace(0, np.nan),
+        }),
+        return_ratios(daily_returns(p, capital), periods),
+    ]
+    if fills is not None and len(fills):
+        parts.append(fill_stats(filled_orders(fills), capital))
+    out = pd.concat(parts, axis=1)
+    out.index.name = "run_id"
+    return out
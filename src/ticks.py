@@ -0,0 +1,77 @@
+# src/ticks.py
+"""Bulk construction of Nautilus ``TradeTick`` objects from Binance aggTrades.
+
+The counterpart of ``src/bars.py`` for trades. ``TradeTickDataWrangler``
+builds one tick per DataFrame row in Python. Here the aggTrades columns
+(``price``, ``qty``, ``ts`` in ms, ``is_buyer_maker``, ``agg_id``) are turned
+into typed arrays with NumPy and handed to ``TradeTick.from_raw_arrays_to_list``.
+That builds the whole batch in one Cython loop.
+"""
+from __future__ import annotations
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+
+from src.bars import to_ns
+
+TICK_COLUMNS = ["agg_id", "price", "qty", "ts", "is_buyer_maker"]
+
+
+def ticks_from_arrays(
+    instrument,
+    agg_id,
+    price,
+    qty,
+    ts_ms,
+    is_buyer_maker,
+    ts_init_delta: int = 0,
+) -> List[TradeTick]:
+    """Trade ticks at the instrument's precisions; the buyer is the aggressor
+    unless the buyer was the maker. Trades whose size rounds to zero are dropped."""
+    qty = np.ascontiguousarray(qty, dtype=np.float64)
+    keep = np.round(qty, instrument.size_precision) > 0
+    if not keep.all():
+        agg_id, price, qty, ts_ms, is_buyer_maker = (
+            np.asarray(a)[keep] for a in (agg_id, price, qty, ts_ms, is_buyer_maker))
+    ts_event = to_ns(ts_ms) * np.uint64(1_000_000)
+    sides = np.where(np.asarray(is_buyer_maker, dtype=bool),
+                     int(AggressorSide.SELLER), int(AggressorSide.BUYER)).astype(np.uint8)
+    return TradeTick.from_raw_arrays_to_list(
+        instrument.id,
+        instrument.price_precision,
+        instrument.size_precision,
+        np.ascontiguousarray(price, dtype=np.float64),
+        np.ascontiguousarray(qty, dtype=np.float64),
+        sides,
+        np.asarray(agg_id, dtype=np.int64).astype(str).tolist(),
+        ts_event,
+        ts_event + np.uint64(ts_init_delta),
+    )
+
+
+def ticks_from_frame(df: pd.DataFrame, instrument, ts_init_delta: int = 0) -> List[TradeTick]:
+    """Ticks from an aggTrades frame as stored by ``TradeStore`` (``ts`` in ms)."""
+    return ticks_from_arrays(
+        instrument, df["agg_id"].to_numpy(), df["price"].to_numpy(), df["qty"].to_numpy(),
+        df["ts"].to_numpy(), df["is_buyer_maker"].to_numpy(), ts_init_delta,
+    )
+
+
+def frame_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """The ``TICK_COLUMNS`` of an aggTrades frame as arrays ordered by ``ts``."""
+    arrays = {c: df[c].to_numpy() for c in TICK_COLUMNS}
+    return sort_by_time(arrays)
+
+
+def sort_by_time(arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Stable-sort columns by ``ts`` if they are not already (partitions are in agg id order)."""
+    ts = arrays["ts"]
+    if len(ts) < 2 or (np.diff(ts) >= 0).all():
+        return arrays
+    order = np.argsort(ts, kind="stable")
+    return {c: a[order] for c, a in arrays.items()}
@@ -0,0 +1,189 @@
+# src/trades.py
+"""Binance aggTrades storage: a day-partitioned Parquet store and the
+matching ClickHouse table.
+
+Parquet layout::
+
+    <root>/aggTrades/<market>/<SYMBOL>/<YYYY-MM-DD>.parquet
+    <root>/aggTrades/<market>/<SYMBOL>/_index.json
+
+The per-symbol ``_index.json`` records, for every stored day, the agg-trade id
+range, the row count and a content digest. It is how the correction patcher
+finds the partitions a corrected file touches without scanning the store.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.db import CH_DATABASE
+from src.ingest import AGG_TRADES_COLUMNS, insert_agg_trades
+
+
+def create_agg_trades_table(client, database: str = CH_DATABASE) -> None:
+    """Create the ``agg_trades`` table if it does not exist."""
+    client.execute(f"""CREATE TABLE IF NOT EXISTS {database}.agg_trades (
+        market LowCardinality(String),
+        symbol LowCardinality(String),
+        agg_id UInt64,
+        price Float64,
+        qty Float64,
+        first_id UInt64,
+        last_id UInt64,
+        ts DateTime64(3, 'UTC'),
+        is_buyer_maker UInt8
+    ) ENGINE MergeTree
+    PARTITION BY toYYYYMM(ts)
+    ORDER BY (symbol, ts, agg_id)""")
+
+
+# ── Partitions ──────────────────────────────────────────────────── #
+
+def split_days(df: pd.DataFrame) -> Iterator[Tuple[date, pd.DataFrame]]:
+    """Yield ``(day, rows)`` per UTC day, ordered by agg id."""
+    days = pd.to_datetime(df["ts"], unit="ms", utc=True).dt.date
+    for day, part in df.groupby(days, sort=True):
+        yield day, part.sort_values("agg_id").reset_index(drop=True)
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """Order-insensitive content digest of a partition."""
+    df = df.sort_values("agg_id")[[c for c in AGG_TRADES_COLUMNS if c in df.columns]]
+    hashed = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.sha256(hashed.tobytes()).hexdigest()
+
+
+# ── Parquet store ───────────────────────────────────────────────── #
+
+_INDEX_LOCKS: Dict[Path, threading.Lock] = {}
+_INDEX_LOCKS_GUARD = threading.Lock()
+
+
+def _index_lock(directory: Path) -> threading.Lock:
+    """Process-wide lock of one symbol's ``_index.json``, shared by all store instances."""
+    with _INDEX_LOCKS_GUARD:
+        return _INDEX_LOCKS.setdefault(directory.resolve(), threading.Lock())
+
+
+class TradeStore:
+    """Day-partitioned Parquet store of aggTrades with a per-symbol index.
+
+    Partitions and index updates are safe to write from several threads (the
+    ingest "store" stage runs ``--parse-workers`` of them).
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _dir(self, market: str, symbol: str) -> Path:
+        return self.root / "aggTrades" / market / symbol.upper()
+
+    def partition_path(self, market: str, symbol: str, day: date) -> Path:
+        return self._dir(market, symbol) / f"{day.isoformat()}.parquet"
+
+    def index(self, market: str, symbol: str) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._dir(market, symbol) / "_index.json") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _save_index(self, market: str, symbol: str, index: Dict[str, Dict[str, Any]]) -> None:
+        path = self._dir(market, symbol) / "_index.json"
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, prefix="_index.", suffix=".tmp", delete=False) as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+        os.replace(f.name, path)
+
+    def days(self, market: str, symbol: str, month: Optional[str] = None) -> List[date]:
+        """Stored days, optionally restricted to ``YYYY-MM``."""
+        return [
+            date.fromisoformat(d) for d in sorted(self.index(market, symbol))
+            if month is None or d.startswith(month)
+        ]
+
+    def read_day(self, market: str, symbol: str, day: date, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        path = self.partition_path(market, symbol, day)
+        if not path.exists():
+            return pd.DataFrame(columns=columns or AGG_TRADES_COLUMNS[:-1])
+        return pd.read_parquet(path, columns=columns)
+
+    def write_day(self, market: str, symbol: str, day: date, df: pd.DataFrame) -> Dict[str, Any]:
+        """Replace one partition and update the index entry."""
+        directory = self._dir(market, symbol)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = self.partition_path(market, symbol, day)
+        with tempfile.NamedTemporaryFile(dir=directory, prefix=f"{day.isoformat()}.", suffix=".tmp", delete=False) as f:
+            df.to_parquet(f, index=False)
+        os.replace(f.name, path)
+        entry = {
+            "rows": int(len(df)),
+            "first_id": int(df["agg_id"].min()) if len(df) else None,
+            "last_id": int(df["agg_id"].max()) if len(df) else None,
+            "digest": frame_digest(df),
+        }
+        with _index_lock(directory):
+            index = self.index(market, symbol)
+            index[day.isoformat()] = entry
+            self._save_index(market, symbol, index)
+        return entry
+
+    def write_file(self, market: str, symbol: str, df: pd.DataFrame) -> List[date]:
+        """Store a parsed monthly/daily file as day partitions."""
+        written = []
+        for day, part in split_days(df):
+            self.write_day(market, symbol, day, part)
+            written.append(day)
+        return written
+
+
+# ── ClickHouse ──────────────────────────────────────────────────── #
+
+def replace_day(client, df: pd.DataFrame, market: str, symbol: str, day: date,
+                database: str = CH_DATABASE) -> int:
+    """Delete one symbol/day from ``agg_trades`` and insert ``df`` in its place."""
+    client.execute(
+        f"ALTER TABLE {database}.agg_trades DELETE "
+        "WHERE market = %(m)s AND symbol = %(s)s AND toDate(ts) = %(d)s",
+        {"m": market, "s": symbol, "d": day},
+        settings={"mutations_sync": 1},
+    )
+    return insert_agg_trades(client, df, market, symbol, database)
+
+
+def build_agg_trades_query(
+    market: str,
+    symbol: str,
+    start: datetime,
+    end: datetime,
+    database: str = CH_DATABASE,
+) -> Tuple[str, Dict[str, Any]]:
+    """SQL for one symbol's aggTrades in ``[start, end)`` as tick columns (``ts`` in ms)."""
+    sql = f"""
+    SELECT agg_id, price, qty, toUnixTimestamp64Milli(ts) AS ts, is_buyer_maker
+    FROM {database}.agg_trades
+    WHERE market = %(m)s AND symbol = %(s)s AND ts >= %(t0)s AND ts < %(t1)s
+    ORDER BY ts, agg_id
+    """
+    return sql, {"m": market, "s": symbol, "t0": start, "t1": end}
+
+
+AGG_TRADE_ARRAY_DTYPES = {"agg_id": "int64", "price": "float64", "qty": "float64", "ts": "int64", "is_buyer_maker": "bool"}
+
+
+def get_agg_trade_arrays(client, market: str, symbol: str, start: datetime, end: datetime,
+                         database: str = CH_DATABASE) -> Dict[str, np.ndarray]:
+    """aggTrades in ``[start, end)`` as NumPy columns, via a ``columnar=True`` query."""
+    sql, params = build_agg_trades_query(market, symbol, start, end, database)
+    columns = client.execute(sql, params, columnar=True)
+    if not columns:
+        return {c: np.empty(0, dtype=t) for c, t in AGG_TRADE_ARRAY_DTYPES.items()}
+    return {c: np.asarray(col, dtype=t) for (c, t), col in zip(AGG_TRADE_ARRAY_DTYPES.items(), columns)}
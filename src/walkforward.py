@@ -0,0 +1,221 @@
+# src/walkforward.py
+"""Walk-forward optimization on top of the parameter sweep.
+
+History is cut into rolling (or anchored) train/test windows. For every
+window the whole parameter grid is run on the train slice. The best point by
+``metric`` is then evaluated on the following test slice, which is unseen
+data for that window (see ``docs/BIAS.md``). All windows share one process
+pool. Each worker loads the data once and caches the per-window slices, so
+every parameter set that hits the same window reuses them. A window's
+out-of-sample run is submitted as soon as its in-sample grid finishes.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src.sweep import SweepSpec, completed_runs, init_worker, make_pool, point_extras, run_point
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Window:
+    index: int
+    train_start: pd.Timestamp
+    train_end: pd.Timestamp
+    test_start: pd.Timestamp
+    test_end: pd.Timestamp
+
+    @staticmethod
+    def _ns(start: pd.Timestamp, end: pd.Timestamp) -> Tuple[int, int]:
+        return start.value, end.value
+
+    @property
+    def train(self) -> Tuple[int, int]:
+        return self._ns(self.train_start, self.train_end)
+
+    @property
+    def test(self) -> Tuple[int, int]:
+        return self._ns(self.test_start, self.test_end)
+
+
+def _utc(ts) -> pd.Timestamp:
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize("UTC") if ts.tz is None else ts.tz_convert("UTC")
+
+
+def make_windows(
+    start,
+    end,
+    train: pd.Timedelta,
+    test: pd.Timedelta,
+    step: Optional[pd.Timedelta] = None,
+    anchored: bool = False,
+) -> List[Window]:
+    """Train/test windows over ``[start, end)``; ``step`` defaults to ``test``.
+
+    Anchored windows keep ``train_start`` fixed and grow the train period.
+    With ``step < test`` the test windows overlap; ``walk_forward`` then
+    stitches each window's OOS curve only up to the next window's test start.
+    """
+    start, end = _utc(start), _utc(end)
+    train, test = pd.Timedelta(train), pd.Timedelta(test)
+    step = pd.Timedelta(step) if step is not None else test
+    windows = []
+    offset = pd.Timedelta(0)
+    while start + offset + train + test <= end:
+        train_end = start + offset + train
+        windows.append(Window(
+            index=len(windows),
+            train_start=start if anchored else start + offset,
+            train_end=train_end,
+            test_start=train_end,
+            test_end=train_end + test,
+        ))
+        offset += step
+    return windows
+
+
+def realized_pnl_curve(engine) -> Dict[str, Any]:
+    """Realized PnL per closed position (snapshots included), indexed by close time."""
+    report = engine.trader.generate_positions_report()
+    if report.empty:
+        return {"pnl_curve": pd.Series(dtype="float64")}
+    closed = report.dropna(subset=["ts_closed", "realized_pnl"])
+    pnl = closed["realized_pnl"].astype(str).str.split().str[0].astype("float64")
+    return {"pnl_curve": pd.Series(pnl.to_numpy(), index=pd.to_datetime(closed["ts_closed"], utc=True)).sort_index()}
+
+
+def _best(rows: List[Dict[str, Any]], metric: str) -> Optional[Dict[str, Any]]:
+    ok = [r for r in rows if not r.get("error") and pd.notna(r.get(metric))]
+    return max(ok, key=lambda r: r[metric]) if ok else None
+
+
+@dataclass
+class WalkForwardResult:
+    in_sample: pd.DataFrame
+    out_of_sample: pd.DataFrame
+    equity: pd.Series  # cumulative out-of-sample realized PnL, stitched across windows
+
+
+def walk_forward(
+    spec: SweepSpec,
+    points: List[Dict[str, Any]],
+    windows: List[Window],
+    metric: str = "PnL (total)",
+    workers: Optional[int] = None,
+    on_window: Optional[Callable[[Dict[str, Any]], None]] = None,
+    cache: Optional[str] = None,
+    share: bool = False,
+    warm: bool = False,
+) -> WalkForwardResult:
+    """Optimize on every train window and evaluate the winner on its test window.
+
+    ``cache`` memoizes the individual runs, ``share`` puts the data in
+    shared memory and ``warm`` reuses engines, as in ``run_sweep``. A rerun
+    with the same ``cache`` resumes: finished in-sample and out-of-sample
+    runs are read back and only the rest is submitted.
+    """
+    keys = list(points[0]) if points else []
+    is_rows: Dict[int, List[Dict[str, Any]]] = {w.index: [] for w in windows}
+    chosen: Dict[int, Dict[str, Any]] = {}
+    oos_rows: List[Dict[str, Any]] = []
+
+    def choose(window: Window) -> Optional[Dict[str, Any]]:
+        best = _best(is_rows[window.index], metric)
+        if best is None:
+            logger.warning("window %d: every in-sample run failed, skipped", window.index)
+            return None
+        chosen[window.index] = best
+        return {k: best[k] for k in keys}
+
+    def record(window: Window, row: Dict[str, Any]) -> None:
+        row = {"window": window.index, "test_start": window.test_start, "test_end": window.test_end,
+               f"is_{metric}": chosen[window.index][metric], **row}
+        oos_rows.append(row)
+        if on_window:
+            on_window(row)
+
+    if workers == 0:
+        init_worker(spec, str(cache) if cache else None, warm=warm)
+        for w in windows:
+            is_rows[w.index] = [run_point(p, w.train) for p in points]
+            params = choose(w)
+            if params is not None:
+                record(w, run_point(params, w.test, realized_pnl_curve))
+    else:
+        units = [(p, w) for w in windows for p in points]
+        resumed = completed_runs(spec, cache, [(p, w.train) for p, w in units])
+        if resumed:
+            logger.info("resuming: %d of %d in-sample runs already done", len(resumed), len(units))
+        remaining = {w.index: len(points) for w in windows}
+        for i, row in sorted(resumed.items()):
+            w = units[i][1]
+            is_rows[w.index].append(row)
+            remaining[w.index] -= 1
+        oos_extras = point_extras(realized_pnl_curve)
+        deferred: List[Tuple[Window, Dict[str, Any]]] = []
+
+        def evaluate(w: Window, submit: Callable[[Window, Dict[str, Any]], None]) -> None:
+            """Out-of-sample run of the window's winner: from the checkpoint if done, else submitted."""
+            params = choose(w)
+            if params is None:
+                return
+            hit = completed_runs(spec, cache, [(params, w.test)], oos_extras).get(0)
+            if hit is not None:
+                record(w, hit)
+            else:
+                submit(w, params)
+
+        for w in windows:
+            if remaining[w.index] == 0:
+                evaluate(w, lambda w, params: deferred.append((w, params)))
+        todo = [(p, w) for i, (p, w) in enumerate(units) if i not in resumed]
+        if todo or deferred:
+            shared = spec.data.share() if share else None
+            try:
+                with make_pool(spec, workers, len(todo) + len(deferred), cache,
+                               shared.handle if shared else None, warm) as pool:
+                    def submit_oos(w: Window, params: Dict[str, Any]) -> None:
+                        pending[pool.submit(run_point, params, w.test, realized_pnl_curve)] = ("oos", w)
+
+                    pending = {pool.submit(run_point, p, w.train): ("is", w) for p, w in todo}
+                    for w, params in deferred:
+                        submit_oos(w, params)
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for fut in done:
+                            phase, w = pending.pop(fut)
+                            if phase == "oos":
+                                record(w, fut.result())
+                                continue
+                            is_rows[w.index].append(fut.result())
+                            remaining[w.index] -= 1
+                            if remaining[w.index] == 0:
+                                evaluate(w, submit_oos)
+            finally:
+                if shared is not None:
+                    shared.close()
+
+    in_sample = pd.DataFrame([
+        {"window": w.index, "train_start": w.train_start, "train_end": w.train_end, **row}
+        for w in windows for row in is_rows[w.index]
+    ])
+    if not in_sample.empty:  # pool results arrive in completion order
+        in_sample = in_sample.sort_values(["window", *keys], kind="stable").reset_index(drop=True)
+    oos = sorted(oos_rows, key=lambda r: r["window"])
+    curves = []
+    for row, nxt in zip(oos, oos[1:] + [None]):
+        curve = row.pop("pnl_curve", None)
+        if curve is None:
+            continue
+        if nxt is not None and nxt["test_start"] < row["test_end"]:  # step < test: overlapping test windows
+            curve = curve[curve.index < nxt["test_start"]]
+        curves.append(curve)
+    stitched = pd.concat(curves).sort_index() if curves else pd.Series(dtype="float64")
+    return WalkForwardResult(in_sample, pd.DataFrame(oos), stitched.cumsum().rename("equity"))
@@ -0,0 +1,60 @@
+# test/test_bars.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the bars module."""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nautilus_trader.model.data import BarType
+from nautilus_trader.persistence.wranglers import BarDataWrangler
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from src.bars import bars_from_arrays, bars_from_frame
+from src.db import transform_candle_arrays
+
+
+class TestBars(unittest.TestCase):
+    """Test suite for the NumPy bar fast path."""
+
+    def setUp(self):
+        self.instrument = TestInstrumentProvider.btcusdt_binance()
+        self.bar_type = BarType.from_str(f"{self.instrument.id}-1-MINUTE-LAST-EXTERNAL")
+        rng = np.random.default_rng(7)
+        close = 40_000 + np.cumsum(rng.normal(0, 5, 500))
+        idx = pd.date_range("2024-01-01", periods=500, freq="1min", tz="UTC", name="timestamp")
+        self.df = pd.DataFrame({
+            "open": close, "high": close + 3.123456, "low": close - 2.987654,
+            "close": close + 0.004999, "volume": rng.random(500) * 10,
+        }, index=idx)
+
+    def test_matches_wrangler(self):
+        """Bars are identical to BarDataWrangler output, including ts_init."""
+        expected = BarDataWrangler(self.bar_type, self.instrument).process(self.df, ts_init_delta=59_999_999_999)
+        actual = bars_from_frame(self.df, self.bar_type, self.instrument, ts_init_delta=59_999_999_999)
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            self.assertEqual((a.open, a.high, a.low, a.close, a.volume), (e.open, e.high, e.low, e.close, e.volume))
+            self.assertEqual((a.ts_event, a.ts_init), (e.ts_event, e.ts_init))
+
+    def test_columnar_result_and_validation(self):
+        """Columnar driver output converts to bars; NaNs are rejected."""
+        secs = [1_704_067_200, 1_704_067_260]
+        arrays = transform_candle_arrays((secs, [1.0, 2.0], [2.0, 3.0], [0.5, 1.5], [1.5, 2.5], [10.0, 20.0]))
+        bars = bars_from_arrays(self.bar_type, self.instrument, arrays["ts"], arrays["open"],
+                                arrays["high"], arrays["low"], arrays["close"], arrays["volume"])
+        self.assertEqual(bars[1].ts_event, 1_704_067_260 * 10**9)
+        self.assertEqual(str(bars[1].close), "2.50")
+        with self.assertRaises(ValueError):
+            bars_from_arrays(self.bar_type, self.instrument, arrays["ts"], [1.0, np.nan],
+                             arrays["high"], arrays["low"], arrays["close"])
+
+
+if __name__ == "__main__":
+    unittest.main()
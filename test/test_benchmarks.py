@@ -0,0 +1,41 @@
+# test/test_benchmarks.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the benchmarks module."""
+
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.benchmarks import SCENARIOS, compare, measure
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test suite for the backtest benchmark scenarios."""
+
+    def test_scenarios_run(self):
+        """Every scenario builds, runs and trades at a tiny scale."""
+        for name in SCENARIOS:
+            with self.subTest(name):
+                result = measure(name, scale=0.02)
+                self.assertGreater(result["events"], 0)
+                self.assertGreater(result["events_per_sec"], 0)
+                self.assertGreater(result["orders"], 0)
+                self.assertGreater(result["peak_rss_mb"], 0)
+
+    def test_compare_flags_regressions(self):
+        """Only moves in the bad direction beyond the tolerance are regressions."""
+        baseline = {"results": [{"scenario": "a", "events_per_sec": 1000.0, "run_s": 1.0, "peak_rss_mb": 100.0}]}
+        current = {"results": [{"scenario": "a", "events_per_sec": 850.0, "run_s": 0.8, "peak_rss_mb": 105.0},
+                               {"scenario": "new", "events_per_sec": 1.0}]}
+        diff = compare(current, baseline, tolerance=0.10).set_index("metric")
+        self.assertTrue(diff.loc["events_per_sec", "regression"])
+        self.assertFalse(diff.loc["run_s", "regression"])
+        self.assertFalse(diff.loc["peak_rss_mb", "regression"])
+        self.assertEqual(set(diff["scenario"]), {"a"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# test/test_catalog.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the catalog module."""
+
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from src.catalog import STATE_FILE, export_bars
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeConnector:
+    """In-memory stand-in for ``ClickHouseConnector.candles``."""
+
+    def __init__(self, minutes):
+        self.extend(minutes)
+
+    def extend(self, minutes):
+        idx = pd.date_range(START, periods=minutes, freq="1min", tz="UTC", name="timestamp")
+        close = 40_000 + np.arange(minutes, dtype=float)
+        self.df = pd.DataFrame({
+            "open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0,
+        }, index=idx)
+        self.queried = []
+
+    def candles(self, *, start, end, empty_ok=False, **kwargs):
+        self.queried.append((start, end))
+        return self.df[(self.df.index >= start) & (self.df.index <= end)]
+
+
+class TestCatalogExport(unittest.TestCase):
+    """Test suite for the incremental catalog exporter."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.catalog = ParquetDataCatalog(self.tmp.name)
+        self.instrument = TestInstrumentProvider.btcusdt_binance()
+        self.bar_type = BarType.from_str(f"{self.instrument.id}-1-MINUTE-LAST-EXTERNAL")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def export(self, conn, end):
+        return export_bars(
+            conn, self.catalog, self.instrument, self.bar_type,
+            exchange="BINANCE", symbol="BTCUSDT", timeframe="1m",
+            start=START, end=end, chunk=timedelta(hours=6),
+        )
+
+    def test_second_run_appends_only_new_bars(self):
+        """A re-run exports only candles after the recorded open_time."""
+        conn = FakeConnector(24 * 60)
+        first = self.export(conn, START + timedelta(days=1))
+        self.assertEqual(first["rows"], 24 * 60)
+
+        conn.extend(36 * 60)
+        second = self.export(conn, START + timedelta(days=2))
+        self.assertEqual(second["rows"], 12 * 60)
+        self.assertGreaterEqual(conn.queried[0][0], START + timedelta(hours=23))
+
+        bars = self.catalog.bars(bar_types=[str(self.bar_type)])
+        self.assertEqual(len(bars), 36 * 60)
+        self.assertEqual(len({b.ts_event for b in bars}), 36 * 60)
+        with open(os.path.join(self.tmp.name, STATE_FILE)) as f:
+            entry = json.load(f)[str(self.bar_type)]
+        self.assertEqual(entry["rows"], 36 * 60)
+        self.assertEqual(len(self.catalog.instruments()), 1)
+
+    def test_noop_when_up_to_date(self):
+        """Nothing is written when ClickHouse has no newer candles."""
+        conn = FakeConnector(60)
+        self.export(conn, START + timedelta(hours=1))
+        again = self.export(conn, START + timedelta(hours=1))
+        self.assertEqual(again["rows"], 0)
+        self.assertEqual(len(self.catalog.get_intervals(Bar, str(self.bar_type))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# test/test_checksum.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the checksum module."""
+
+import unittest
+import tempfile
+import hashlib
+from pathlib import Path
+from unittest.mock import patch
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import checksum
+from src.checksum import ChecksumIndex, discard, find_archives, verify_files
+
+
+class TestChecksum(unittest.TestCase):
+    """Test suite for parallel verification and the digest index."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        self.index = ChecksumIndex(self.dir / "index.sqlite")
+        self.addCleanup(self.index.close)
+
+    def _archive(self, name, payload, digest=None):
+        path = self.dir / name
+        path.write_bytes(payload)
+        digest = digest or hashlib.sha256(payload).hexdigest()
+        (self.dir / f"{name}.CHECKSUM").write_text(f"{digest}  {name}\n")
+        return path
+
+    def test_verify_files_classifies_results(self):
+        """Files are split into ok, mismatch and unchecked."""
+        good = self._archive("a.zip", b"good")
+        bad = self._archive("b.zip", b"bad", digest="0" * 64)
+        bare = self.dir / "c.zip"
+        bare.write_bytes(b"no sidecar")
+        result = verify_files(find_archives(self.dir), self.index, workers=4)
+        self.assertEqual(result, {"ok": [good], "mismatch": [bad], "unchecked": [bare]})
+
+    def test_unchanged_files_are_not_rehashed(self):
+        """The index serves digests until size or mtime change."""
+        path = self._archive("a.zip", b"payload")
+        self.index.digest(path)
+        with patch.object(checksum, "sha256sum", side_effect=AssertionError("rehashed")):
+            self.assertEqual(verify_files([path], self.index)["ok"], [path])
+
+        path.write_bytes(b"changed payload")
+        os.utime(path, ns=(0, 0))
+        self.assertEqual(verify_files([path], self.index)["mismatch"], [path])
+
+    def test_discard_removes_file_sidecar_and_entry(self):
+        """Discarded files are gone so the downloader fetches them again."""
+        path = self._archive("a.zip", b"payload")
+        self.index.digest(path)
+        discard(path, self.index)
+        self.assertFalse(path.exists())
+        self.assertFalse((self.dir / "a.zip.CHECKSUM").exists())
+        path.write_bytes(b"payload")
+        self.assertIsNone(self.index.lookup(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# test/test_clickhouse.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the ClickHouse instrument provider in bin/clickhouse.py."""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+# Add the project root and bin/ to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'bin')))
+
+import clickhouse
+from clickhouse import ClickHouseInstrumentProvider
+
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.model.identifiers import InstrumentId
+
+ROWS = [
+    (1, 1, 2, 5, "BTC", "USDT"),
+    (1, 1, 2, 4, "ETH", "USDT"),
+    (1, 1, 4, 1, "NEWCOIN", "USDT"),
+]
+META = {"BTCUSDT": {"tick_size": "0.01000000", "lot_size": "0.00001000", "status": "TRADING"}}
+
+
+class TestInstrumentProvider(unittest.TestCase):
+    """Test suite for ClickHouseInstrumentProvider.load_all."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.snapshot = Path(self.tmp.name) / "instruments.json"
+        self.ch = MagicMock()
+        self.ch.cli.execute.return_value = ROWS
+        patcher = patch.object(clickhouse, "get_cache")
+        patcher.start().return_value.get.side_effect = META.get
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_load_all_single_query_fills_cache(self):
+        """One query loads every pair into the provider and the Cache."""
+        cache = Cache()
+        provider = ClickHouseInstrumentProvider(self.ch, cache=cache, snapshot_path=self.snapshot)
+        provider.load_all()
+        self.assertEqual(self.ch.cli.execute.call_count, 1)
+        self.assertEqual(provider.count, 3)
+        btc = cache.instrument(InstrumentId.from_str("BTCUSDT.BINANCE"))
+        self.assertEqual(str(btc.price_increment), "0.01")
+        self.assertEqual(btc.size_precision, 5)
+        new = provider.find(InstrumentId.from_str("NEWCOINUSDT.BINANCE"))
+        self.assertEqual(new.base_currency.code, "NEWCOIN")
+        self.assertIs(new.quote_currency, btc.quote_currency)
+
+    def test_snapshot_skips_clickhouse(self):
+        """A fresh snapshot lets a new provider load without a connector."""
+        ClickHouseInstrumentProvider(self.ch, snapshot_path=self.snapshot).load_all()
+        provider = ClickHouseInstrumentProvider(None, snapshot_path=self.snapshot)
+        asyncio.run(provider.load_all_async())
+        self.assertEqual(provider.count, 3)
+        self.assertEqual(self.ch.cli.execute.call_count, 1)
+
+        # restarts use the tick/lot sizes stored in the snapshot, not the exchangeInfo cache
+        clickhouse.get_cache.return_value.get.side_effect = ConnectionError("offline")
+        offline = ClickHouseInstrumentProvider(None, snapshot_path=self.snapshot)
+        offline.load_all()
+        self.assertEqual(str(offline.find(InstrumentId.from_str("BTCUSDT.BINANCE")).price_increment), "0.01")
+
+        stale = ClickHouseInstrumentProvider(None, snapshot_path=self.snapshot, snapshot_ttl=-1)
+        with self.assertRaises(RuntimeError):
+            stale.load_all()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# test/test_corrections.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the corrections module."""
+
+import unittest
+import tempfile
+import io
+import json
+import zipfile
+from datetime import date
+from pathlib import Path
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.checksum import sha256sum
+from src.corrections import apply_correction, load_corrections
+from src.ingest import read_agg_trades
+from src.trades import TradeStore
+
+ROOT = Path(__file__).resolve().parents[1]
+DAY1 = 1514764800000  # 2018-01-01
+DAY2 = DAY1 + 86_400_000
+
+
+def agg_csv(rows):
+    return "".join(f"{i},{p},1.0,{i},{i},{ts},True,True\n" for i, p, ts in rows)
+
+
+class TestCorrections(unittest.TestCase):
+    """Test suite for the aggTrades correction patcher."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        self.store = TradeStore(self.dir / "store")
+
+    def _archive(self, rel, csv):
+        path = self.dir / "dl" / rel
+        path.parent.mkdir(parents=True)
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr(path.stem + ".csv", csv)
+        return path
+
+    def test_load_bundled_correction_lists(self):
+        """Both bundled correction formats resolve to spot monthly archives."""
+        for name in ("2022-10-04_aggregate_trade_updates.csv", "2022-04-21_aggregate_trade_updates.zip"):
+            corrections = load_corrections(ROOT / "data/binance/updates" / name)
+            self.assertTrue(corrections)
+            for c in corrections:
+                self.assertRegex(c["path"], r"^data/spot/monthly/aggTrades/\w+/\w+-aggTrades-\d{4}-\d{2}\.zip$")
+                self.assertEqual(len(c["new_digest"]), 64)
+
+    def test_only_changed_partitions_are_rewritten(self):
+        """Unchanged days are left alone and changed rows are audited."""
+        original = self.dir / "original.csv"
+        original.write_text(agg_csv([(1, 10.0, DAY1), (2, 11.0, DAY1), (3, 12.0, DAY2)]))
+        self.store.write_file("spot", "ETHBTC", read_agg_trades(original))
+        day1_mtime = self.store.partition_path("spot", "ETHBTC", date(2018, 1, 1)).stat().st_mtime_ns
+
+        rel = "data/spot/monthly/aggTrades/ETHBTC/ETHBTC-aggTrades-2018-01.zip"
+        fixed = self._archive(rel, agg_csv([(1, 10.0, DAY1), (2, 11.0, DAY1), (3, 12.5, DAY2), (4, 13.0, DAY2)]))
+        correction = {"market": "spot", "symbol": "ETHBTC", "month": "2018-01", "path": rel,
+                      "old_digest": "", "new_digest": sha256sum(fixed)}
+
+        audit = io.StringIO()
+        result = apply_correction(correction, self.store, self.dir / "dl", audit=audit)
+        self.assertEqual(result["days"], [date(2018, 1, 2)])
+        rows = [json.loads(line) for line in audit.getvalue().splitlines()]
+        self.assertEqual([(r["agg_id"], r["change"]) for r in rows], [(3, "modified"), (4, "added")])
+        self.assertEqual(rows[0]["old"]["price"], 12.0)
+        self.assertEqual(rows[0]["new"]["price"], 12.5)
+
+        day2 = self.store.read_day("spot", "ETHBTC", date(2018, 1, 2))
+        self.assertEqual(day2["price"].tolist(), [12.5, 13.0])
+        self.assertEqual(
+            self.store.partition_path("spot", "ETHBTC", date(2018, 1, 1)).stat().st_mtime_ns, day1_mtime
+        )
+        # applying the same correction again is a no-op
+        self.assertEqual(apply_correction(correction, self.store, self.dir / "dl")["days"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+# test/test_feeds.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the feeds module."""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.currencies import BTC, USDT
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from src.bars import bars_from_frame
+from src.feeds import (
+    add_catalog_portfolio, add_clickhouse_bars, candle_chunks, catalog_chunks, merge_feeds, prefetch, time_chunks,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeConnector:
+    """Serves 1m candles from memory with ClickHouseConnector.candles semantics."""
+
+    def __init__(self, minutes, gap=None):
+        idx = pd.date_range(START, periods=minutes, freq="1min", tz="UTC", name="timestamp")
+        close = 40_000 + np.cumsum(np.sin(np.arange(minutes) / 15.0) * 5)
+        self.df = pd.DataFrame({
+            "open": close, "high": close + 5, "low": close - 5, "close": close, "volume": 1.0,
+        }, index=idx)
+        if gap:
+            self.df = self.df[(self.df.index < gap[0]) | (self.df.index >= gap[1])]
+        self.calls = 0
+
+    def candles(self, *, start, end, empty_ok=False, **kwargs):
+        self.calls += 1
+        return self.df[(self.df.index >= start) & (self.df.index <= end)]
+
+
+class TestFeeds(unittest.TestCase):
+    """Test suite for chunked ClickHouse feeds."""
+
+    def test_time_chunks_cover_range(self):
+        """Windows are contiguous and end exactly at ``end``."""
+        chunks = list(time_chunks(START, START + timedelta(days=10), timedelta(days=3)))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(chunks[0][0], START)
+        self.assertEqual(chunks[-1][1], START + timedelta(days=10))
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(chunks, chunks[1:])))
+
+    def test_prefetch_propagates_errors(self):
+        """Producer exceptions surface in the consuming thread."""
+        def boom():
+            yield 1
+            raise RuntimeError("db down")
+
+        it = prefetch(boom())
+        self.assertEqual(next(it), 1)
+        with self.assertRaises(RuntimeError):
+            next(it)
+
+    def test_candle_chunks_skip_gaps_and_boundary_duplicates(self):
+        """Inclusive chunk bounds do not duplicate rows and gaps yield nothing."""
+        gap = (START + timedelta(hours=2), START + timedelta(hours=5))
+        conn = FakeConnector(8 * 60, gap=gap)
+        frames = list(candle_chunks(
+            conn, exchange="BINANCE", symbol="BTCUSDT", timeframe="1m",
+            start=START, end=START + timedelta(hours=8), chunk=timedelta(hours=1),
+        ))
+        joined = pd.concat(frames)
+        self.assertTrue(joined.index.is_unique)
+        self.assertTrue(joined.index.is_monotonic_increasing)
+        self.assertEqual(len(joined), len(conn.df))
+        self.assertEqual(len(frames), 6)  # 04:00-05:00 only holds the 05:00 bar
+
+    def test_engine_runs_on_streamed_bars(self):
+        """The engine consumes the chunked feed end to end."""
+        from nautilus_trader.examples.strategies.ema_cross import EMACross, EMACrossConfig
+        from decimal import Decimal
+
+        instrument = TestInstrumentProvider.btcusdt_binance()
+        bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+        engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+        engine.add_venue(Venue("BINANCE"), OmsType.NETTING, AccountType.CASH,
+                         starting_balances=[Money(1_000_000, USDT), Money(10, BTC)], base_currency=None)
+        engine.add_instrument(instrument)
+        engine.add_strategy(EMACross(EMACrossConfig(
+            instrument_id=instrument.id, bar_type=bar_type, trade_size=Decimal("0.01"),
+            subscribe_trade_ticks=False, request_bars=False,
+        )))
+        conn = FakeConnector(3 * 24 * 60)
+        add_clickhouse_bars(
+            engine, conn, instrument, bar_type, exchange="BINANCE", symbol="BTCUSDT",
+            timeframe="1m", start=START, end=START + timedelta(days=3), chunk=timedelta(hours=6),
+        )
+        engine.run()
+        self.assertEqual(conn.calls, 12)
+        self.assertGreater(len(engine.trader.generate_order_fills_report()), 0)
+        engine.dispose()
+
+    def test_merge_feeds_orders_by_timestamp(self):
+        """Chunked feeds are merged in ``ts_init`` order, ties in feed order."""
+        class Item:
+            def __init__(self, ts, name):
+                self.ts_init, self.name = ts, name
+
+        a = [[Item(1, "a"), Item(3, "a")], [Item(5, "a")]]
+        b = [[Item(1, "b"), Item(2, "b"), Item(6, "b")]]
+        merged = list(merge_feeds([a, b], batch=2))
+        self.assertEqual([len(c) for c in merged], [2, 2, 2])
+        self.assertEqual([(i.ts_init, i.name) for c in merged for i in c],
+                         [(1, "a"), (1, "b"), (2, "b"), (3, "a"), (5, "a"), (6, "b")])
+
+    def test_catalog_portfolio_streams_every_instrument(self):
+        """Per-instrument catalog chunks merge into the full, ordered history."""
+        from nautilus_trader.examples.strategies.ema_cross import EMACross, EMACrossConfig
+        from decimal import Decimal
+
+        instruments = [TestInstrumentProvider.btcusdt_binance(), TestInstrumentProvider.ethusdt_binance()]
+        with tempfile.TemporaryDirectory() as tmp:
+            catalog = ParquetDataCatalog(tmp)
+            catalog.write_data(instruments)
+            bar_types = []
+            for k, instrument in enumerate(instruments):
+                bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+                df = FakeConnector(2 * 24 * 60).df * (1 + k) / 10
+                catalog.write_data(bars_from_frame(df, bar_type, instrument))
+                bar_types.append(bar_type)
+            end = START + timedelta(days=2)
+
+            chunks = list(catalog_chunks(catalog, Bar, str(bar_types[0]), START, end, timedelta(hours=5)))
+            ts = [b.ts_init for c in chunks for b in c]
+            self.assertEqual(len(ts), 2 * 24 * 60)
+            self.assertEqual(ts, sorted(set(ts)))
+
+            engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+            engine.add_venue(Venue("BINANCE"), OmsType.NETTING, AccountType.MARGIN,
+                             starting_balances=[Money(1_000_000, USDT)], base_currency=USDT)
+            for instrument, bar_type in zip(instruments, bar_types):
+                engine.add_instrument(instrument)
+                engine.add_strategy(EMACross(EMACrossConfig(
+                    instrument_id=instrument.id, bar_type=bar_type, trade_size=Decimal("0.01"),
+                    subscribe_trade_ticks=False, request_bars=False, order_id_tag=str(instrument.id.symbol),
+                )))
+            add_catalog_portfolio(engine, catalog, bar_types, START, end, chunk=timedelta(hours=5), batch=1000)
+            engine.run()
+            fills = engine.trader.generate_order_fills_report()
+            self.assertEqual(set(fills["instrument_id"]), {str(i.id) for i in instruments})
+            self.assertEqual(engine.iteration, 2 * 2 * 24 * 60)
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    unittest.main()
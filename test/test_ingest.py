@@ -0,0 +1,78 @@
+# test/test_ingest.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the ingest module."""
+
+import unittest
+import tempfile
+import hashlib
+import zipfile
+from datetime import date
+from pathlib import Path
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ingest import make_inserter, plan_files, read_klines, verify
+
+ROWS = (
+    "1577836800000,7189.43,7190.52,7170.15,7171.55,2449.049,1577836859999,17576424.5,3226,1090.141,7825109.7,0\n"
+    "1577836860000,7171.43,7175.55,7163.67,7173.53,1351.168,1577836919999,9689975.3,2029,698.389,5008614.1,0\n"
+)
+HEADER = "open_time,open,high,low,close,volume,close_time,quote_volume,count,taker_buy_volume,taker_buy_quote_volume,ignore\n"
+
+
+class TestIngest(unittest.TestCase):
+    """Test suite for download planning, checksum and parsing stages."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+
+    def test_plan_files_monthly(self):
+        """Monthly specs expand to one data.binance.vision file per month."""
+        tasks = plan_files("um", "klines", ["btcusdt"], "monthly", date(2020, 11, 15), date(2021, 2, 1),
+                           intervals=["1m"], dest=self.dir, prune=False)
+        self.assertEqual([t["date"] for t in tasks], ["2020-11", "2020-12", "2021-01", "2021-02"])
+        self.assertEqual(
+            tasks[0]["url"],
+            "https://data.binance.vision/data/futures/um/monthly/klines/BTCUSDT/1m/BTCUSDT-1m-2020-11.zip",
+        )
+
+    def test_read_klines_with_and_without_header(self):
+        """Spot (no header) and futures (header) CSVs parse identically."""
+        spot = self.dir / "spot.csv"
+        spot.write_text(ROWS)
+        fut = self.dir / "fut.zip"
+        with zipfile.ZipFile(fut, "w") as zf:
+            zf.writestr("fut.csv", HEADER + ROWS)
+        a = read_klines(spot, "BTCUSDT", "1m")
+        b = read_klines(fut, "BTCUSDT", "1m")
+        self.assertEqual(len(a), 2)
+        self.assertTrue(a.equals(b))
+        self.assertEqual(str(a["open_time"].iloc[0]), "2020-01-01 00:00:00+00:00")
+        self.assertEqual(list(a.columns[:2]), ["symbol", "interval"])
+
+    def test_inserter_refuses_non_trade_klines(self):
+        """Mark-price candles are never written into the trade klines table."""
+        insert = make_inserter()
+        with self.assertRaises(ValueError):
+            insert({"data_type": "markPriceKlines", "frame": None})
+
+    def test_verify_checksum(self):
+        """Matching sidecars pass, mismatches raise ValueError."""
+        path = self.dir / "f.zip"
+        path.write_bytes(b"payload")
+        sidecar = self.dir / "f.zip.CHECKSUM"
+        sidecar.write_text(f"{hashlib.sha256(b'payload').hexdigest()}  f.zip\n")
+        task = {"path": str(path)}
+        self.assertIs(verify(task), task)
+        sidecar.write_text(f"{'0' * 64}  f.zip\n")
+        with self.assertRaises(ValueError):
+            verify(task)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# test/test_pipeline.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the pipeline module."""
+
+import unittest
+import threading
+import time
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.pipeline import Pipeline, Stage
+
+
+class TestPipeline(unittest.TestCase):
+    """Test suite for the bounded-queue pipeline."""
+
+    def test_items_flow_through_all_stages(self):
+        """Every item is transformed by each stage in turn."""
+        pipeline = Pipeline([
+            Stage("double", lambda x: x * 2, workers=3),
+            Stage("inc", lambda x: x + 1, workers=2),
+        ])
+        results = pipeline.run(range(100))
+        self.assertEqual(sorted(results), [x * 2 + 1 for x in range(100)])
+        self.assertEqual([s["items"] for s in pipeline.report()], [100, 100])
+
+    def test_errors_and_drops_are_counted(self):
+        """Exceptions are reported via on_error and None results are dropped."""
+        failed = []
+
+        def check(x):
+            if x == 3:
+                raise ValueError("bad")
+            return None if x % 2 else x
+
+        pipeline = Pipeline(
+            [Stage("check", check), Stage("noop", lambda x: x)],
+            on_error=lambda stage, item, exc: failed.append((stage, item)),
+        )
+        results = pipeline.run(range(6))
+        self.assertEqual(sorted(results), [0, 2, 4])
+        self.assertEqual(failed, [("check", 3)])
+        stats = pipeline.stats[0]
+        self.assertEqual((stats.items, stats.dropped, stats.errors), (3, 2, 1))
+
+    def test_bounded_queue_applies_backpressure(self):
+        """A slow sink keeps the producer at most queue_size items ahead."""
+        produced = []
+        max_ahead = []
+        lock = threading.Lock()
+
+        def produce(x):
+            with lock:
+                produced.append(x)
+            return x
+
+        def consume(x):
+            time.sleep(0.002)
+            with lock:
+                max_ahead.append(len(produced) - x)
+            return x
+
+        pipeline = Pipeline([Stage("fast", produce), Stage("slow", consume, queue_size=2)])
+        pipeline.run(range(50))
+        # queue (2) + item being emitted + item in hand
+        self.assertLessEqual(max(max_ahead), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
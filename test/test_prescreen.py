@@ -0,0 +1,61 @@
+# test/test_prescreen.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the prescreen module."""
+
+import tempfile
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nautilus_trader.indicators.averages import ExponentialMovingAverage
+
+from src.bars import arrays_from_bars
+from src.prescreen import ema, hold, promote, screen, simulate
+from src.sweep import param_grid
+from test_sweep import ema_spec, make_catalog
+
+
+class TestPrescreen(unittest.TestCase):
+    """Test suite for the vectorized pre-screen."""
+
+    def test_ema_matches_indicator(self):
+        """The blocked EMA equals Nautilus' ExponentialMovingAverage."""
+        x = np.random.default_rng(7).normal(size=1000).cumsum() + 100
+        for period in (2, 17, 300):
+            indicator, expected = ExponentialMovingAverage(period), []
+            for value in x:
+                indicator.update_raw(value)
+                expected.append(indicator.value)
+            np.testing.assert_allclose(ema(x, period), expected, rtol=0, atol=1e-9)
+
+    def test_hold_and_simulate(self):
+        """Sides are held between signals; flips trade twice and the end is flattened."""
+        sides = np.array([[0, 1, 0, -1, 0]], dtype=np.int8)
+        np.testing.assert_array_equal(hold(sides), [[0, 1, 1, -1, -1]])
+        stats = simulate(np.array([10.0, 10.0, 12.0, 11.0, 9.0]), sides, 2.0, fee=0.01)
+        # long 10 -> 11 (+2), short 11 -> 9 (+4); traded notional 20 + 44 + 18
+        self.assertAlmostEqual(stats["pnl"][0], 6.0 - 0.82)
+        self.assertEqual(stats["orders"][0], 4)
+
+    def test_consistent_with_engine(self):
+        """Screen PnL and order counts equal the BacktestEngine results."""
+        with tempfile.TemporaryDirectory() as path:
+            instrument, bar_type = make_catalog(path, minutes=1500)
+            spec = ema_spec(path, instrument, bar_type)
+            _, bars = spec.data.load()
+            points = param_grid({"fast_ema_period": [3, 10], "slow_ema_period": [20, 60]})
+            screened = screen(arrays_from_bars(bars), points, 0.01, float(instrument.taker_fee))
+            full = promote(spec, screened, ["fast_ema_period", "slow_ema_period"], n=4, workers=0)
+        np.testing.assert_allclose(full["PnL (total)"], full["screen_pnl"], atol=1e-6)
+        np.testing.assert_array_equal(full["orders"], full["screen_orders"])
+        self.assertEqual(full["screen_pnl"].tolist(), sorted(full["screen_pnl"], reverse=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
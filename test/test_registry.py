@@ -0,0 +1,71 @@
+# test/test_registry.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the registry module."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+import os
+
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.registry import RunRegistry, config_hash, sweep_runs
+
+
+def fake_spec():
+    return SimpleNamespace(
+        strategy_path="nautilus_trader.examples.strategies.ema_cross:EMACross",
+        base_config={"bar_type": "BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL", "trade_size": "0.01"},
+        data=SimpleNamespace(instrument_id="BTCUSDT.BINANCE"),
+    )
+
+
+class TestRegistry(unittest.TestCase):
+    """Test suite for the run registry."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.registry = RunRegistry(Path(self.tmp.name) / "runs.sqlite")
+        results = pd.DataFrame({
+            "fast_ema_period": [5, 10, 20],
+            "PnL (total)": [10.0, -5.0, float("nan")],
+            "Sharpe Ratio (252 days)": [1.5, -0.2, float("nan")],
+            "positions": [4, 6, None],
+            "error": [None, None, "ValueError: bad"],
+            "run_id": ["point-00000", "point-00001", None],
+        })
+        self.runs = sweep_runs(fake_spec(), results, params=["fast_ema_period"], store="results/store", prefix="s1")
+        self.registry.record_many(self.runs)
+
+    def tearDown(self):
+        self.registry.close()
+        self.tmp.cleanup()
+
+    def test_sweep_rows(self):
+        """Sweep rows carry the merged config hash, store path and metrics."""
+        first = self.registry.get("s1-point-00000")
+        self.assertEqual(first["config"]["fast_ema_period"], 5)
+        self.assertEqual(first["config_hash"], config_hash({**fake_spec().base_config, "fast_ema_period": 5}))
+        self.assertEqual(first["path"], str(Path("results/store") / "point-00000"))
+        self.assertEqual(first["sharpe"], 1.5)
+        self.assertEqual(first["stats"]["PnL (total)"], 10.0)
+        self.assertIsNone(self.registry.get("s1-00002")["sharpe"])
+
+    def test_filtered_sorted_query(self):
+        """Queries filter and sort on indexed columns, NULLs last."""
+        best = self.registry.query({"instrument_id": "BTCUSDT.BINANCE"}, order_by="sharpe")
+        self.assertEqual(best["run_id"].tolist(), ["s1-point-00000", "s1-point-00001", "s1-00002"])
+        ok = self.registry.query({"error": None, "pnl": ("<", 0)}, columns=["run_id"])
+        self.assertEqual(ok["run_id"].tolist(), ["s1-point-00001"])
+        self.assertEqual(self.registry.count({"kind": ("IN", ["sweep"])}), 3)
+        with self.assertRaises(ValueError):
+            self.registry.query({"sharpe; DROP TABLE runs": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+# test/test_robustness.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the robustness module."""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.robustness import path_stats, resample, return_samples, robustness, trade_samples
+from test_tearsheet import positions_report
+
+
+class TestRobustness(unittest.TestCase):
+    """Test suite for Monte Carlo resampling of runs."""
+
+    def test_path_stats(self):
+        """Equity, drawdown and Sharpe of a known trade sequence."""
+        stats = path_stats(np.array([10.0, -20.0, 5.0]), "pnl", 100.0, periods=1)
+        self.assertAlmostEqual(stats["terminal"][0], 95.0)
+        self.assertAlmostEqual(stats["max_drawdown_pct"][0], 20 / 110 * 100)
+        r = np.array([10 / 100, -20 / 110, 5 / 90])
+        self.assertAlmostEqual(stats["sharpe"][0], r.mean() / r.std(ddof=1))
+
+    def test_resample_methods(self):
+        """Shuffles permute, bootstraps draw from the values, blocks stay contiguous."""
+        rng = np.random.default_rng(0)
+        values = np.arange(20, dtype=float)
+        shuffled = resample(values, 50, "shuffle", rng)
+        np.testing.assert_array_equal(np.sort(shuffled, axis=0), np.repeat(values[:, None], 50, axis=1))
+        self.assertTrue(np.isin(resample(values, 50, "bootstrap", rng), values).all())
+        blocks = resample(values, 50, "block", rng, block=4)
+        self.assertEqual(blocks.shape, (20, 50))
+        self.assertTrue((np.diff(blocks.reshape(5, 4, 50), axis=1) == 1).all())
+        with self.assertRaises(ValueError):
+            resample(values, 5, "jackknife", rng)
+
+    def test_intervals_are_seeded_and_independent_of_workers(self):
+        """Shuffles keep terminal equity; results depend on the seed, not the pool size."""
+        positions = pd.concat([
+            positions_report("a", np.arange(40) * 0.5, np.random.default_rng(1).normal(1.0, 10.0, 40)),
+            positions_report("b", np.arange(30), np.random.default_rng(2).normal(-0.5, 5.0, 30)),
+        ], ignore_index=True)
+        samples = trade_samples(positions)
+        serial = robustness(samples, n=1_500, method="shuffle", capital=1_000.0, workers=0)
+        self.assertEqual(serial.index.tolist(), ["a", "b"])
+        np.testing.assert_allclose(serial["terminal_p05"], serial["terminal"])
+        np.testing.assert_allclose(serial["terminal_p95"], serial["terminal"])
+        self.assertTrue((serial["max_drawdown_pct_p95"] >= serial["max_drawdown_pct_p05"]).all())
+        pooled = robustness(samples, n=1_500, method="shuffle", capital=1_000.0, workers=2)
+        pd.testing.assert_frame_equal(serial, pooled)
+        block = robustness(return_samples(positions, 1_000.0), n=500, method="block", kind="returns",
+                           capital=1_000.0, seed=3, workers=0)
+        self.assertTrue(((block["prob_loss"] >= 0) & (block["prob_loss"] <= 1)).all())
+        self.assertTrue((block["sharpe_p05"] <= block["sharpe_p95"]).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# test/test_shared.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the shared module."""
+
+import multiprocessing as mp
+import unittest
+import sys
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.shared import attach, dataset_id, share_arrays
+
+
+def column_sums(handle):
+    """Runs in a spawned process: attach and sum every column."""
+    with attach(handle) as data:
+        return {name: float(arr.sum()) for name, arr in data.arrays.items()}
+
+
+class TestShared(unittest.TestCase):
+    """Test suite for shared-memory market data."""
+
+    def setUp(self):
+        self.arrays = {
+            "ts_event": np.arange(1_000, dtype=np.uint64) * 60_000_000_000,
+            "close": np.linspace(100.0, 200.0, 1_000),
+        }
+
+    def test_views_are_read_only_and_zero_copy(self):
+        """Attached columns equal the source, share the block and cannot be written."""
+        with share_arrays(self.arrays, dataset_id("t", 1)) as owner:
+            self.assertLessEqual(len(owner.handle.name), 30)  # macOS limit, with the leading "/"
+            view = attach(owner.handle)
+            np.testing.assert_array_equal(view["close"], self.arrays["close"])
+            self.assertEqual(view["ts_event"].dtype, np.uint64)
+            self.assertFalse(view["close"].flags.writeable)
+            with self.assertRaises(ValueError):
+                view["close"][0] = 0.0
+            view.close()
+
+    def test_workers_attach_and_owner_unlinks(self):
+        """Spawned workers read the block; closing the owner removes it."""
+        owner = share_arrays(self.arrays, dataset_id("t", 2))
+        try:
+            with mp.get_context("spawn").Pool(2) as pool:
+                sums = pool.map(column_sums, [owner.handle] * 2)
+        finally:
+            owner.close()
+        expected = {name: float(arr.sum()) for name, arr in self.arrays.items()}
+        self.assertEqual(sums, [expected, expected])
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=owner.handle.name)
+
+    def test_columns_must_align(self):
+        """Columns of different lengths are rejected."""
+        with self.assertRaises(ValueError):
+            share_arrays({"a": np.zeros(3), "b": np.zeros(4)}, "bad")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# test/test_storage.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the storage module."""
+
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+import os
+
+import pandas as pd
+import pyarrow.dataset as ds
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.storage import (ResultStore, ResultStoreError, convert_pickle, load_backtest_result,
+                         save_backtest_result)
+
+
+def sample_result(pnl=1.5):
+    fills = pd.DataFrame({
+        "order_side": ["BUY", "SELL", "BUY"],
+        "last_px": [100.0, 101.5, 99.0],
+        "ts_event": pd.to_datetime([1, 2, 3], unit="s", utc=True),
+        "info": [{}, {"a": 1}, {}],
+    }, index=pd.Index(["O-1", "O-2", "O-3"], name="client_order_id"))
+    return {"fast_ema_period": 10, "pnl": pnl, "fills": fills,
+            "returns": pd.Series([0.01, -0.02], name="returns")}
+
+
+class TestStorage(unittest.TestCase):
+    """Test suite for the columnar result store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_with_selection(self):
+        """Reports round-trip with their index; columns and rows can be selected."""
+        save_backtest_result(sample_result(), self.root / "run")
+        res = load_backtest_result(self.root / "run")
+        self.assertEqual(res["pnl"], 1.5)
+        self.assertEqual(sorted(res.reports), ["fills", "returns"])
+        fills = res["fills"]
+        self.assertEqual(list(fills.index), ["O-1", "O-2", "O-3"])
+        self.assertEqual(fills.loc["O-2", "info"], '{"a": 1}')
+        sells = res.frame("fills", columns=["last_px"], filters=[("order_side", "=", "SELL")])
+        self.assertEqual(list(sells.columns), ["last_px"])
+        self.assertEqual(sells["last_px"].tolist(), [101.5])
+
+    def test_errors_are_raised(self):
+        """Missing runs and legacy pickles raise instead of returning None."""
+        with self.assertRaises(ResultStoreError):
+            load_backtest_result(self.root / "missing")
+        legacy = self.root / "old.pkl"
+        with open(legacy, "wb") as f:
+            pickle.dump(sample_result(), f)
+        with self.assertRaises(ResultStoreError):
+            load_backtest_result(legacy)
+        res = load_backtest_result(convert_pickle(legacy, self.root / "converted"))
+        self.assertEqual(res["fast_ema_period"], 10)
+        with self.assertRaises(TypeError):
+            save_backtest_result({"bad": object()}, self.root / "bad")
+        self.assertFalse((self.root / "bad").exists())
+
+    def test_store_summary_and_scan(self):
+        """Many runs are compared from metadata and a single cross-run scan."""
+        store = ResultStore(self.root / "sweep")
+        for i in range(3):
+            store.save(f"run-{i}", sample_result(pnl=float(i)))
+        summary = store.summary(["pnl"])
+        self.assertEqual(summary["pnl"].tolist(), [0.0, 1.0, 2.0])
+        table = store.scan("fills", columns=["last_px"], filter=ds.field("run_id") == "run-1")
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(set(table.column("run_id").to_pylist()), {"run-1"})
+
+
+if __name__ == "__main__":
+    unittest.main()
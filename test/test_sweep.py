@@ -0,0 +1,159 @@
+# test/test_sweep.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the sweep module."""
+
+import tempfile
+import unittest
+from unittest import mock
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nautilus_trader.model.data import BarType
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from src.bars import bars_from_frame
+from src import sweep
+from src.storage import ResultStore
+from src.sweep import DataSpec, SweepSpec, VenueSpec, param_grid, run_sweep
+
+
+def make_catalog(path, minutes=3000):
+    """Write a BTCUSDT instrument and oscillating 1m bars to a catalog."""
+    instrument = TestInstrumentProvider.btcusdt_binance()
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    close = 40_000 + np.cumsum(np.sin(np.arange(minutes) / 30.0) * 5)
+    idx = pd.date_range("2024-01-01", periods=minutes, freq="1min", tz="UTC")
+    df = pd.DataFrame({"open": close, "high": close + 5, "low": close - 5, "close": close, "volume": 1.0}, index=idx)
+    catalog = ParquetDataCatalog(path)
+    catalog.write_data([instrument])
+    catalog.write_data(bars_from_frame(df, bar_type, instrument))
+    return instrument, bar_type
+
+
+def ema_spec(path, instrument, bar_type):
+    return SweepSpec(
+        data=DataSpec(path, str(instrument.id), [str(bar_type)]),
+        strategy_path="nautilus_trader.examples.strategies.ema_cross:EMACross",
+        config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+        base_config={
+            "instrument_id": str(instrument.id), "bar_type": str(bar_type), "trade_size": "0.01",
+            "request_bars": False, "subscribe_trade_ticks": False,
+        },
+        venue=VenueSpec(starting_balances=["1000000 USDT", "10 BTC"]),
+    )
+
+
+class TestSweep(unittest.TestCase):
+    """Test suite for parallel parameter sweeps."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        instrument, bar_type = make_catalog(cls.tmp.name)
+        cls.spec = ema_spec(cls.tmp.name, instrument, bar_type)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_param_grid_filters(self):
+        """The grid is a filtered cartesian product."""
+        points = param_grid({"fast_ema_period": [5, 20], "slow_ema_period": [10, 40]},
+                            lambda p: p["fast_ema_period"] < p["slow_ema_period"])
+        self.assertEqual(points, [
+            {"fast_ema_period": 5, "slow_ema_period": 10},
+            {"fast_ema_period": 5, "slow_ema_period": 40},
+            {"fast_ema_period": 20, "slow_ema_period": 40},
+        ])
+
+    def test_pool_matches_in_process(self):
+        """Pool workers produce the same statistics as in-process runs, in input order."""
+        points = [{"fast_ema_period": 5, "slow_ema_period": 20}, {"fast_ema_period": 10, "slow_ema_period": 40}]
+        serial = run_sweep(self.spec, points, workers=0)
+        pooled = run_sweep(self.spec, points, workers=2)
+        cols = ["fast_ema_period", "slow_ema_period", "PnL (total)", "orders"]
+        pd.testing.assert_frame_equal(serial[cols], pooled[cols])
+        self.assertGreater(serial["orders"].min(), 0)
+
+    def test_shared_data_matches(self):
+        """Workers streaming from shared memory produce the in-process statistics."""
+        points = [{"fast_ema_period": 5, "slow_ema_period": 20}, {"fast_ema_period": 10, "slow_ema_period": 40}]
+        serial = run_sweep(self.spec, points, workers=0)
+        shared = run_sweep(self.spec, points, workers=2, share=True)
+        cols = ["fast_ema_period", "slow_ema_period", "PnL (total)", "orders"]
+        pd.testing.assert_frame_equal(serial[cols], shared[cols])
+
+    def test_warm_engines_match(self):
+        """Reusing reset engines gives the statistics of freshly built ones."""
+        points = [{"fast_ema_period": 5, "slow_ema_period": 20}, {"fast_ema_period": 10, "slow_ema_period": 40},
+                  {"fast_ema_period": 5, "slow_ema_period": 20}]
+        cold = run_sweep(self.spec, points, workers=0)
+        warm = run_sweep(self.spec, points, workers=0, warm=True)
+        pooled = run_sweep(self.spec, points, workers=1, share=True, warm=True)
+        cols = ["fast_ema_period", "slow_ema_period", "PnL (total)", "orders", "positions"]
+        pd.testing.assert_frame_equal(cold[cols], warm[cols])
+        pd.testing.assert_frame_equal(cold[cols], pooled[cols])
+
+    def test_failed_point_is_reported(self):
+        """A bad config yields an error row instead of aborting the sweep."""
+        results = run_sweep(self.spec, [{"fast_ema_period": 5, "slow_ema_period": 20},
+                                        {"fast_ema_period": "x"}], workers=0)
+        self.assertTrue(pd.isna(results.loc[0, "error"]))
+        self.assertIsInstance(results.loc[1, "error"], str)
+
+    def test_runs_are_stored(self):
+        """With a store every point is saved with its statistics and reports."""
+        points = [{"fast_ema_period": 5, "slow_ema_period": 20}, {"fast_ema_period": 10, "slow_ema_period": 40}]
+        with tempfile.TemporaryDirectory() as root:
+            results = run_sweep(self.spec, points, workers=0, store=root)
+            store = ResultStore(root)
+            self.assertEqual(store.runs(), results["run_id"].tolist())
+            summary = store.summary(["fast_ema_period", "PnL (total)"])
+            self.assertEqual(summary["PnL (total)"].tolist(), results["PnL (total)"].tolist())
+            fills = store.scan("fills", columns=["side"])
+            self.assertEqual(fills.num_rows, int(results["orders"].sum()))
+
+    def test_runs_are_memoized(self):
+        """Repeated points hit the cache until the catalog data for the range changes."""
+        points = [{"fast_ema_period": 5, "slow_ema_period": 20}]
+        with tempfile.TemporaryDirectory() as path, tempfile.TemporaryDirectory() as cache:
+            instrument, bar_type = make_catalog(path, minutes=1000)
+            spec = ema_spec(path, instrument, bar_type)
+            first = run_sweep(spec, points, workers=0, cache=cache)
+            second = run_sweep(spec, points, workers=0, cache=cache)
+            self.assertNotIn("cached", first)
+            self.assertTrue(second.loc[0, "cached"])
+            self.assertEqual(first.loc[0, "PnL (total)"], second.loc[0, "PnL (total)"])
+
+            noon = pd.Timestamp("2024-01-01 12:00", tz="UTC").value
+            version, early = spec.data.version(), spec.data.version(end_ns=noon)
+            idx = pd.date_range("2024-01-05", periods=60, freq="1min", tz="UTC")
+            df = pd.DataFrame({"open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0}, index=idx)
+            ParquetDataCatalog(path).write_data(bars_from_frame(df, bar_type, instrument))
+            self.assertNotEqual(version, spec.data.version())
+            self.assertEqual(early, spec.data.version(end_ns=noon))  # new data is outside that range
+            third = run_sweep(spec, points, workers=0, cache=cache)
+            self.assertNotIn("cached", third)
+
+    def test_interrupted_sweep_resumes(self):
+        """A rerun reads finished points from the cache and only submits the rest."""
+        points = [{"fast_ema_period": f, "slow_ema_period": 30} for f in (5, 10, 15)]
+        with tempfile.TemporaryDirectory() as cache, \
+                mock.patch("src.sweep.make_pool", wraps=sweep.make_pool) as pool:
+            partial = run_sweep(self.spec, points[:2], workers=1, cache=cache)  # killed after two points
+            resumed = run_sweep(self.spec, points, workers=1, cache=cache)
+            self.assertEqual([c.args[2] for c in pool.call_args_list], [2, 1])
+            self.assertEqual([c is True for c in resumed["cached"]], [True, True, False])
+            pd.testing.assert_series_equal(partial["PnL (total)"], resumed["PnL (total)"][:2])
+            run_sweep(self.spec, points, workers=1, cache=cache)
+            self.assertEqual(pool.call_count, 2)  # everything done: no pool at all
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+# test/test_sweep_cli.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the argument parsing in bin/sweep.py."""
+
+import importlib.util
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nautilus_trader.config import ImportableStrategyConfig
+from nautilus_trader.trading.config import StrategyFactory
+
+# bin/sweep.py shares its module name with src.sweep, so load it under another one
+_spec = importlib.util.spec_from_file_location(
+    "sweep_cli", os.path.join(os.path.dirname(__file__), '..', 'bin', 'sweep.py'))
+sweep_cli = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sweep_cli)
+
+
+class TestSweepArguments(unittest.TestCase):
+    """Test suite for --grid/--set value parsing."""
+
+    def test_values_are_typed(self):
+        """Ints, floats and ranges are converted; other values stay strings."""
+        self.assertEqual(sweep_cli.parse_values("5-20:5,50"), [5, 10, 15, 20, 50])
+        self.assertEqual(sweep_cli.parse_values("0.5,1e-3,abc"), [0.5, 0.001, "abc"])
+        self.assertIsInstance(sweep_cli.parse_value("2.5"), float)
+
+    def test_twap_config_accepts_set_values(self):
+        """``--set twap_interval_secs=2.5`` builds a valid EMACrossTWAPConfig."""
+        strategy = sweep_cli.STRATEGIES["ema_cross_twap"]
+        params = sweep_cli.parse_assignments(
+            ["twap_horizon_secs=10", "twap_interval_secs=2.5", "trade_size=0.05"], multi=False)
+        instance = StrategyFactory.create(ImportableStrategyConfig(
+            strategy_path=strategy["strategy_path"],
+            config_path=strategy["config_path"],
+            config={
+                "instrument_id": "ETHUSDT.BINANCE", "bar_type": "ETHUSDT.BINANCE-250-TICK-LAST-INTERNAL",
+                "fast_ema_period": 5, "slow_ema_period": 20, **params,
+            },
+        ))
+        self.assertEqual(instance.config.twap_interval_secs, 2.5)
+        self.assertEqual(str(instance.config.trade_size), "0.05")
+
+
+if __name__ == '__main__':
+    unittest.main()
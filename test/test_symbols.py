@@ -0,0 +1,129 @@
+# test/test_symbols.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the symbols module."""
+
+import unittest
+import tempfile
+from datetime import date
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.symbols import SymbolCache, parse_exchange_info
+
+SPOT_INFO = {
+    "symbols": [
+        {
+            "symbol": "BTCUSDT", "status": "TRADING", "baseAsset": "BTC", "quoteAsset": "USDT",
+            "filters": [
+                {"filterType": "PRICE_FILTER", "tickSize": "0.01000000"},
+                {"filterType": "LOT_SIZE", "stepSize": "0.00001000"},
+            ],
+        },
+        {"symbol": "ETHBTC", "status": "BREAK", "baseAsset": "ETH", "quoteAsset": "BTC", "filters": []},
+    ]
+}
+UM_INFO = {
+    "symbols": [
+        {
+            "symbol": "BTCUSDT", "status": "TRADING", "baseAsset": "BTC", "quoteAsset": "USDT",
+            "onboardDate": 1569398400000, "deliveryDate": 4133404800000, "filters": [],
+        },
+        {
+            "symbol": "BTCUSDT_230331", "status": "SETTLING", "baseAsset": "BTC", "quoteAsset": "USDT",
+            "onboardDate": 1672300800000, "deliveryDate": 1680249600000, "filters": [],
+        },
+    ]
+}
+
+
+class FakeFetch:
+    """Records requested URLs and serves canned payloads."""
+
+    def __init__(self, info, klines=None):
+        self.info = info
+        self.klines = klines or []
+        self.urls = []
+
+    def __call__(self, url):
+        self.urls.append(url)
+        return self.klines if "klines" in url else self.info
+
+
+class TestSymbols(unittest.TestCase):
+    """Test suite for the symbol metadata cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_parse_exchange_info(self):
+        """Filters, listing and delivery dates are extracted."""
+        spot = parse_exchange_info(SPOT_INFO, "spot")
+        self.assertEqual(spot["BTCUSDT"]["tick_size"], "0.01000000")
+        self.assertEqual(spot["BTCUSDT"]["lot_size"], "0.00001000")
+        self.assertIsNone(spot["BTCUSDT"]["listed"])
+
+        um = parse_exchange_info(UM_INFO, "um")
+        self.assertEqual(um["BTCUSDT"]["listed"], "2019-09-25")
+        self.assertIsNone(um["BTCUSDT"]["delisted"])
+        self.assertEqual(um["BTCUSDT_230331"]["delisted"], "2023-03-31")
+
+    def test_ttl_avoids_refetch(self):
+        """A fresh cache file is reused without hitting exchangeInfo."""
+        fetch = FakeFetch(SPOT_INFO)
+        SymbolCache("spot", cache_dir=self.tmp.name, fetch=fetch).symbols()
+        again = FakeFetch(SPOT_INFO)
+        cache = SymbolCache("spot", cache_dir=self.tmp.name, ttl=3600, fetch=again)
+        self.assertEqual(cache.symbols(), ["BTCUSDT", "ETHBTC"])
+        self.assertEqual(cache.symbols(status="TRADING"), ["BTCUSDT"])
+        self.assertEqual(len(fetch.urls), 1)
+        self.assertEqual(again.urls, [])
+
+    def test_refresh_marks_vanished_symbols_delisted(self):
+        """Symbols missing from a new snapshot are kept as DELISTED."""
+        cache = SymbolCache("spot", cache_dir=self.tmp.name, fetch=FakeFetch(SPOT_INFO))
+        cache.symbols()
+        cache._fetch = FakeFetch({"symbols": SPOT_INFO["symbols"][:1]})
+        cache.refresh()
+        info = cache.get("ETHBTC")
+        self.assertEqual(info["status"], "DELISTED")
+        self.assertEqual(info["delisted"], date.today().isoformat())
+
+    def test_is_listed_prunes_dates(self):
+        """Days and months before listing/after delivery are rejected."""
+        cache = SymbolCache("usdm", cache_dir=self.tmp.name, fetch=FakeFetch(UM_INFO))
+        self.assertFalse(cache.is_listed("BTCUSDT", date(2019, 9, 24)))
+        self.assertTrue(cache.is_listed("BTCUSDT", date(2019, 9, 25)))
+        self.assertTrue(cache.is_listed("BTCUSDT", date(2019, 9, 1), "monthly"))
+        self.assertFalse(cache.is_listed("BTCUSDT", date(2019, 8, 1), "monthly"))
+        self.assertFalse(cache.is_listed("BTCUSDT_230331", date(2023, 4, 1)))
+        self.assertTrue(cache.is_listed("UNKNOWN", date(2010, 1, 1)))
+
+    def test_spot_listing_probe_is_persisted(self):
+        """Spot listing dates are probed once and stored in the cache file."""
+        fetch = FakeFetch(SPOT_INFO, klines=[[1502928000000, "4261.48"]])
+        cache = SymbolCache("spot", cache_dir=self.tmp.name, fetch=fetch)
+        self.assertEqual(cache.listing_bounds("BTCUSDT"), (date(2017, 8, 17), None))
+        reloaded = SymbolCache("spot", cache_dir=self.tmp.name, fetch=FakeFetch(SPOT_INFO))
+        self.assertEqual(reloaded.get("BTCUSDT")["listed"], "2017-08-17")
+        self.assertEqual(sum("klines" in u for u in fetch.urls), 1)
+
+    def test_empty_listing_probe_is_not_repeated(self):
+        """A probe without klines is remembered until the TTL expires."""
+        fetch = FakeFetch(SPOT_INFO)
+        cache = SymbolCache("spot", cache_dir=self.tmp.name, fetch=fetch)
+        self.assertEqual(cache.listing_bounds("BTCUSDT"), (None, None))
+        self.assertTrue(cache.is_listed("BTCUSDT", date(2010, 1, 1)))
+        reloaded = SymbolCache("spot", cache_dir=self.tmp.name, fetch=fetch)
+        self.assertEqual(reloaded.listing_bounds("BTCUSDT"), (None, None))
+        self.assertEqual(sum("klines" in u for u in fetch.urls), 1)
+        expired = SymbolCache("spot", cache_dir=self.tmp.name, ttl=-1, fetch=fetch)
+        expired.listing_bounds("BTCUSDT")
+        self.assertEqual(sum("klines" in u for u in fetch.urls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# test/test_sync.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the sync module."""
+
+import unittest
+import tempfile
+import zipfile
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.sync import SyncState, _parse_date, csv_path, expand, extract_csv, load_job
+
+JOB = """
+dest = "store"
+
+[[spec]]
+market = "um"
+symbols = ["BTCUSDT", "ETHUSDT"]
+intervals = ["1m"]
+start = "2024-01"
+end = "2024-03"
+
+[[spec]]
+market = "um"
+symbols = ["BTCUSDT"]
+intervals = ["1m", "1h"]
+start = "2024-03"
+end = "2024-04"
+"""
+
+
+class TestSync(unittest.TestCase):
+    """Test suite for job loading, spec dedup and progress state."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        cache = MagicMock()
+        cache.is_listed.return_value = True
+        patcher = patch("src.ingest.get_cache", return_value=cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_overlapping_specs_are_deduplicated(self):
+        """Files requested by several specs are planned once."""
+        path = self.dir / "job.toml"
+        path.write_text(JOB)
+        job = load_job(path)
+        tasks = expand(job["spec"], Path(job["dest"]))
+        urls = [t["url"] for t in tasks]
+        self.assertEqual(len(urls), len(set(urls)))
+        # 2 symbols x 3 months + BTCUSDT 1m 2024-04 + BTCUSDT 1h x 2 months
+        self.assertEqual(len(tasks), 9)
+
+    def test_relative_start_dates(self):
+        """Starts may be absolute months/days or relative to today."""
+        self.assertEqual(_parse_date("2024-03"), date(2024, 3, 1))
+        self.assertEqual(_parse_date("2024-03-05"), date(2024, 3, 5))
+        self.assertEqual(_parse_date("month"), date.today().replace(day=1))
+        self.assertEqual(_parse_date("-7d"), date.today() - timedelta(days=7))
+
+    def test_missing_required_key(self):
+        """Specs without a market/symbols/start are rejected."""
+        path = self.dir / "job.toml"
+        path.write_text('[[spec]]\nmarket = "um"\nsymbols = ["BTCUSDT"]\n')
+        with self.assertRaises(ValueError):
+            load_job(path)
+
+    def test_state_survives_restart(self):
+        """Completed files stay done across runs unless deleted from disk."""
+        done = self.dir / "a.zip"
+        done.write_bytes(b"x")
+        tasks = [{"url": "u/a", "path": str(done)}, {"url": "u/b", "path": str(self.dir / "b.zip")}]
+        state = SyncState(self.dir / "state.jsonl")
+        state.mark(tasks[0])
+        reloaded = SyncState(self.dir / "state.jsonl")
+        self.assertEqual(reloaded.pending(tasks), [tasks[1]])
+        done.unlink()
+        self.assertEqual(reloaded.pending(tasks), tasks)
+
+    def test_extract_recreates_csv_layout(self):
+        """Zips are unpacked to ``<root>/data/...`` and missing CSVs make a task pending again."""
+        task = expand([{"market": "um", "symbols": ["BTCUSDT"], "intervals": ["1m"],
+                        "start": "2020-04", "end": "2020-04"}], self.dir / "store")[0]
+        Path(task["path"]).parent.mkdir(parents=True)
+        with zipfile.ZipFile(task["path"], "w") as zf:
+            zf.writestr("BTCUSDT-1m-2020-04.csv", "1,2,3\n")
+        root = self.dir / "root"
+        target = root / "data/futures/um/monthly/klines/BTCUSDT/1m/BTCUSDT-1m-2020-04.csv"
+        self.assertEqual(csv_path(task, root), target)
+        state = SyncState(self.dir / "state.jsonl")
+        state.mark(task)
+        self.assertEqual(state.pending([task]), [])
+        self.assertEqual(state.pending([task], root), [task])
+        extract_csv(task, root)
+        self.assertEqual(target.read_text(), "1,2,3\n")
+        self.assertEqual(state.pending([task], root), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
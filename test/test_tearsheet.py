@@ -0,0 +1,82 @@
+# test/test_tearsheet.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the tearsheet module."""
+
+import tempfile
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.storage import ResultStore
+from src.sweep import run_sweep
+from src.tearsheet import money, store_reports, tearsheets
+from test_sweep import ema_spec, make_catalog
+
+
+def positions_report(run_id, closes, pnls):
+    """A positions report with one-hour positions closing at ``closes`` (day offsets)."""
+    closed = pd.Timestamp("2024-01-01", tz="UTC") + pd.to_timedelta(closes, unit="D") + pd.Timedelta(hours=12)
+    return pd.DataFrame({
+        "run_id": run_id,
+        "ts_opened": closed - pd.Timedelta(hours=1),
+        "ts_closed": closed,
+        "duration_ns": 3_600_000_000_000,
+        "realized_pnl": [f"{p:.8f} USDT" for p in pnls],
+        "realized_return": 0.0,
+        "commissions": '["0.50000000 USDT"]',
+    })
+
+
+class TestTearsheet(unittest.TestCase):
+    """Test suite for vectorized run metrics."""
+
+    def test_money_cells(self):
+        """Strings, JSON lists and reprs of Money all parse to summed amounts."""
+        cells = pd.Series(["1.5 USDT", '["0.4 USDT", "-0.1 USDT"]', "[Money(2.00, USDT)]", "[]"])
+        np.testing.assert_allclose(money(cells), [1.5, 0.3, 2.0, 0.0])
+
+    def test_metrics_match_per_run_computation(self):
+        """Drawdown, returns and ratios of each run match a direct calculation."""
+        positions = pd.concat([
+            positions_report("a", [0, 1, 3], [10.0, -5.0, 20.0]),
+            positions_report("b", [0, 2], [-3.0, 1.0]),
+        ], ignore_index=True).sample(frac=1.0, random_state=1)
+        sheet = tearsheets(positions, capital=100.0, periods=365)
+        a = sheet.loc["a"]
+        self.assertEqual(a["trades"], 3)
+        self.assertAlmostEqual(a["pnl"], 25.0)
+        self.assertAlmostEqual(a["win_rate"], 2 / 3)
+        self.assertAlmostEqual(a["profit_factor"], 6.0)
+        self.assertAlmostEqual(a["max_drawdown"], 5.0)
+        self.assertAlmostEqual(a["max_drawdown_pct"], 5 / 110 * 100)
+        self.assertAlmostEqual(a["max_underwater_days"], 3.0)
+        self.assertAlmostEqual(a["commissions"], 1.5)
+        r = np.array([10 / 100, -5 / 110, 0.0, 20 / 105])
+        self.assertAlmostEqual(a["sharpe"], r.mean() / r.std(ddof=1) * np.sqrt(365))
+        self.assertAlmostEqual(a["sortino"], r.mean() / np.sqrt(np.mean(np.minimum(r, 0) ** 2)) * np.sqrt(365))
+        self.assertEqual(sheet.loc["b", "days"], 3)
+        self.assertAlmostEqual(sheet.loc["b", "return_pct"], -2.0)
+
+    def test_stored_sweep(self):
+        """A stored sweep yields one row per run consistent with its fills."""
+        with tempfile.TemporaryDirectory() as tmp:
+            instrument, bar_type = make_catalog(tmp)
+            points = [{"fast_ema_period": 5, "slow_ema_period": 20}, {"fast_ema_period": 10, "slow_ema_period": 40}]
+            results = run_sweep(ema_spec(tmp, instrument, bar_type), points, workers=0, store=f"{tmp}/runs")
+            reports = store_reports(ResultStore(f"{tmp}/runs"))
+        sheet = tearsheets(reports["positions"], reports["fills"], capital=1_000_000.0)
+        self.assertEqual(sheet.index.tolist(), results["run_id"].tolist())
+        self.assertTrue((sheet["trades"] > 0).all())
+        self.assertTrue((sheet["orders"] >= 2 * sheet["trades"]).all())
+        np.testing.assert_allclose(sheet["commissions"], sheet["fill_commissions"], rtol=1e-9)
+        np.testing.assert_allclose(sheet["turnover"], sheet["notional"] / 1_000_000.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
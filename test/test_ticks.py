@@ -0,0 +1,121 @@
+# test/test_ticks.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the ticks module and the aggTrades tick feeds."""
+
+import tempfile
+import unittest
+import sys
+import os
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.currencies import BTC, USDT
+from nautilus_trader.model.enums import AccountType, AggressorSide, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from src.feeds import add_store_ticks, clickhouse_trade_days, store_trade_days, tick_feed
+from src.ticks import ticks_from_frame
+from src.trades import TradeStore
+
+
+def agg_trades(day: str, n: int, first_id: int = 1, seed: int = 3) -> pd.DataFrame:
+    """``n`` aggTrades spread over one UTC day, in agg id order."""
+    rng = np.random.default_rng(seed)
+    t0 = pd.Timestamp(day, tz="UTC").value // 1_000_000
+    return pd.DataFrame({
+        "agg_id": np.arange(first_id, first_id + n, dtype=np.int64),
+        "price": np.round(40_000 + np.cumsum(rng.normal(0, 2, n)), 2),
+        "qty": np.round(rng.random(n) * 0.5 + 0.001, 6),
+        "first_id": np.arange(first_id, first_id + n, dtype=np.int64),
+        "last_id": np.arange(first_id, first_id + n, dtype=np.int64),
+        "ts": t0 + np.sort(rng.integers(0, 86_400_000, n)),
+        "is_buyer_maker": rng.random(n) < 0.5,
+    })
+
+
+class FakeClient:
+    """Answers the agg_trades query from a frame, like a ``columnar=True`` execute."""
+
+    def __init__(self, df):
+        self.df = df
+        self.queries = []
+
+    def execute(self, sql, params, columnar=False):
+        self.queries.append(params)
+        t0, t1 = (pd.Timestamp(params[k], tz="UTC").value // 1_000_000 for k in ("t0", "t1"))
+        part = self.df[(self.df["ts"] >= t0) & (self.df["ts"] < t1)]
+        if part.empty:
+            return []
+        return [tuple(part[c]) for c in ("agg_id", "price", "qty", "ts", "is_buyer_maker")]
+
+
+class TestTicks(unittest.TestCase):
+    """Test suite for vectorized aggTrades → TradeTick conversion."""
+
+    def setUp(self):
+        self.instrument = TestInstrumentProvider.btcusdt_binance()
+        self.df = agg_trades("2024-01-01", 1_000)
+
+    def test_ticks_match_rows(self):
+        """Every tick carries its row's price, size, side, id and ms timestamp."""
+        ticks = ticks_from_frame(self.df, self.instrument)
+        self.assertEqual(len(ticks), len(self.df))
+        for tick, row in zip(ticks[:50], self.df.head(50).itertuples()):
+            self.assertAlmostEqual(tick.price.as_double(), row.price, places=8)
+            self.assertAlmostEqual(tick.size.as_double(), row.qty, places=6)
+            self.assertEqual(tick.aggressor_side,
+                             AggressorSide.SELLER if row.is_buyer_maker else AggressorSide.BUYER)
+            self.assertEqual(str(tick.trade_id), str(row.agg_id))
+            self.assertEqual(tick.ts_event, row.ts * 1_000_000)
+            self.assertEqual(tick.ts_init, tick.ts_event)
+
+    def test_clickhouse_days_are_queried_one_at_a_time(self):
+        """Each UTC day is one half-open query and empty days are skipped."""
+        df = pd.concat([self.df, agg_trades("2024-01-03", 200, first_id=5_000)], ignore_index=True)
+        client = FakeClient(df)
+        days = list(clickhouse_trade_days(client, "usdm", "BTCUSDT", "2024-01-01", "2024-01-03"))
+        self.assertEqual(len(client.queries), 3)
+        self.assertEqual([len(d["ts"]) for d in days], [1_000, 200])
+        batches = list(tick_feed(days, self.instrument, batch=300))
+        self.assertEqual([len(b) for b in batches], [300, 300, 300, 100, 200])
+
+    def test_engine_streams_store_days(self):
+        """The engine consumes a TradeStore range day by day, in time order."""
+        from decimal import Decimal
+        from nautilus_trader.examples.strategies.ema_cross import EMACross, EMACrossConfig
+        from nautilus_trader.model.data import BarType
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = TradeStore(tmp)
+            store.write_file("usdm", "BTCUSDT", self.df)
+            store.write_file("usdm", "BTCUSDT", agg_trades("2024-01-02", 1_500, first_id=2_000, seed=4))
+            store.write_file("usdm", "BTCUSDT", agg_trades("2024-01-05", 10, first_id=9_000))
+            self.assertEqual(len(list(store_trade_days(store, "usdm", "BTCUSDT", date(2024, 1, 1), "2024-01-02"))), 2)
+
+            engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+            engine.add_venue(Venue("BINANCE"), OmsType.NETTING, AccountType.CASH,
+                             starting_balances=[Money(1_000_000, USDT), Money(10, BTC)], base_currency=None)
+            engine.add_instrument(self.instrument)
+            engine.add_strategy(EMACross(EMACrossConfig(
+                instrument_id=self.instrument.id,
+                bar_type=BarType.from_str(f"{self.instrument.id}-100-TICK-LAST-INTERNAL"),
+                trade_size=Decimal("0.01"), request_bars=False,
+            )))
+            add_store_ticks(engine, store, self.instrument, "usdm", "BTCUSDT", "2024-01-01", "2024-01-02", batch=400)
+            engine.run()
+            self.assertEqual(engine.iteration, 2_500)
+            self.assertGreater(len(engine.trader.generate_order_fills_report()), 0)
+            engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
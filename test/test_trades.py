@@ -0,0 +1,53 @@
+# test/test_trades.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the trades module."""
+
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.trades import TradeStore
+
+DAY_MS = 86_400_000
+T0 = 1_704_067_200_000  # 2024-01-01 UTC
+
+
+def month_frame(month: int, per_day: int = 3) -> pd.DataFrame:
+    """aggTrades rows for every day of 2024-``month``."""
+    start = pd.Timestamp(f"2024-{month:02d}-01", tz="UTC")
+    days = start.days_in_month
+    ts = int(start.value // 1_000_000) + np.repeat(np.arange(days) * DAY_MS, per_day) + np.tile(np.arange(per_day), days)
+    ids = month * 10_000 + np.arange(len(ts))
+    return pd.DataFrame({"agg_id": ids, "price": 100.0, "qty": 1.0, "first_id": ids, "last_id": ids,
+                         "ts": ts, "is_buyer_maker": False})
+
+
+class TestTradeStore(unittest.TestCase):
+    """Test suite for the day-partitioned aggTrades store."""
+
+    def test_concurrent_writes_keep_every_day(self):
+        """Files written from several threads all end up in the symbol index."""
+        with tempfile.TemporaryDirectory() as tmp:
+            months = range(1, 9)
+            with ThreadPoolExecutor(4) as pool:
+                written = list(pool.map(lambda m: TradeStore(Path(tmp)).write_file("um", "BTCUSDT", month_frame(m)),
+                                        months))
+            store = TradeStore(Path(tmp))
+            expected = sorted(d for days in written for d in days)
+            self.assertEqual(len(expected), sum(pd.Timestamp(f"2024-{m:02d}-01").days_in_month for m in months))
+            self.assertEqual(store.days("um", "BTCUSDT"), expected)
+            self.assertEqual(list(Path(tmp).rglob("*.tmp")), [])
+            self.assertEqual(len(store.read_day("um", "BTCUSDT", expected[-1])), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# test/test_walkforward.py
+# -*- coding: utf-8 -*-
+"""Unit tests for the walkforward module."""
+
+import tempfile
+import unittest
+from unittest import mock
+import sys
+import os
+
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src import sweep
+from src.walkforward import make_windows, walk_forward
+from test_sweep import ema_spec, make_catalog
+
+
+class TestWalkForward(unittest.TestCase):
+    """Test suite for walk-forward windows and the OOS equity curve."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        instrument, bar_type = make_catalog(cls.tmp.name, minutes=2 * 24 * 60)
+        cls.spec = ema_spec(cls.tmp.name, instrument, bar_type)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_rolling_and_anchored_windows(self):
+        """Rolling windows slide by the test length; anchored ones keep the start."""
+        rolling = make_windows("2024-01-01", "2024-01-11", pd.Timedelta(days=4), pd.Timedelta(days=2))
+        self.assertEqual(len(rolling), 3)
+        self.assertEqual(rolling[1].train_start, pd.Timestamp("2024-01-03", tz="UTC"))
+        self.assertEqual(rolling[-1].test_end, pd.Timestamp("2024-01-11", tz="UTC"))
+        self.assertTrue(all(w.test_start == w.train_end for w in rolling))
+        anchored = make_windows("2024-01-01", "2024-01-11", pd.Timedelta(days=4), pd.Timedelta(days=2), anchored=True)
+        self.assertTrue(all(w.train_start == anchored[0].train_start for w in anchored))
+
+    def test_worker_slices_are_cached(self):
+        """Repeated window slices come from the per-worker cache."""
+        sweep.init_worker(self.spec)
+        w = make_windows("2024-01-01", "2024-01-02", pd.Timedelta(hours=12), pd.Timedelta(hours=6))[0]
+        first = sweep.worker_slice(*w.train)
+        self.assertIs(sweep.worker_slice(*w.train), first)
+        self.assertEqual(len(first), 12 * 60)
+        self.assertTrue(all(w.train[0] <= b.ts_init < w.train[1] for b in first))
+
+    def test_oos_equity_is_stitched(self):
+        """Each window picks its in-sample winner and the OOS PnL curves are stitched."""
+        windows = make_windows("2024-01-01", "2024-01-03", pd.Timedelta(hours=12), pd.Timedelta(hours=12))
+        points = [{"fast_ema_period": 5, "slow_ema_period": 20}, {"fast_ema_period": 10, "slow_ema_period": 40}]
+        result = walk_forward(self.spec, points, windows, workers=0)
+        self.assertEqual(len(result.in_sample), len(windows) * len(points))
+        self.assertEqual(list(result.out_of_sample["window"]), [w.index for w in windows])
+        for _, row in result.out_of_sample.iterrows():
+            runs = result.in_sample[result.in_sample["window"] == row["window"]]
+            self.assertEqual(row["is_PnL (total)"], runs["PnL (total)"].max())
+        self.assertTrue(result.equity.index.is_monotonic_increasing)
+        self.assertGreaterEqual(result.equity.index[0], windows[0].test_start)
+        self.assertAlmostEqual(result.equity.iloc[-1], result.out_of_sample["PnL (total)"].sum(), places=6)
+
+    def test_overlapping_test_windows_are_not_double_counted(self):
+        """With step < test each hour of OOS PnL enters the stitched curve once."""
+        windows = make_windows("2024-01-01", "2024-01-03", pd.Timedelta(hours=12), pd.Timedelta(hours=12),
+                               step=pd.Timedelta(hours=6))
+
+        def fake_run(params, bounds, extras=None):
+            if extras is None:
+                return {**params, "PnL (total)": 1.0}
+            hours = pd.date_range(pd.Timestamp(bounds[0], tz="UTC"), pd.Timestamp(bounds[1], tz="UTC"),
+                                  freq="h", inclusive="left")
+            return {**params, "PnL (total)": float(len(hours)), "pnl_curve": pd.Series(1.0, index=hours)}
+
+        with mock.patch("src.walkforward.init_worker"), mock.patch("src.walkforward.run_point", fake_run):
+            result = walk_forward(self.spec, [{"fast_ema_period": 5}], windows, workers=0)
+        self.assertEqual(len(result.out_of_sample), len(windows))
+        self.assertTrue(result.equity.index.is_unique)
+        span = windows[-1].test_end - windows[0].test_start
+        self.assertEqual(result.equity.iloc[-1], span / pd.Timedelta(hours=1))
+
+    def test_rerun_resumes_from_cache(self):
+        """A finished walk-forward rerun with the same cache needs no pool."""
+        windows = make_windows("2024-01-01", "2024-01-02", pd.Timedelta(hours=12), pd.Timedelta(hours=6))
+        points = [{"fast_ema_period": 5, "slow_ema_period": 20}, {"fast_ema_period": 10, "slow_ema_period": 40}]
+        with tempfile.TemporaryDirectory() as cache:
+            first = walk_forward(self.spec, points, windows, workers=1, cache=cache)
+            with mock.patch("src.walkforward.make_pool", side_effect=AssertionError("nothing left to run")):
+                second = walk_forward(self.spec, points, windows, workers=1, cache=cache)
+        cols = ["window", "fast_ema_period", "slow_ema_period", "PnL (total)"]
+        pd.testing.assert_frame_equal(first.out_of_sample[cols], second.out_of_sample[cols])
+        pd.testing.assert_series_equal(first.equity, second.equity)
+
+
+if __name__ == "__main__":
+    unittest.main()